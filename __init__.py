@@ -1,5 +1,27 @@
-from .operators import cleanup_bone_weights, fix_twist_bone_names, fix_seams, fix_toes, cleanup_unused_vertex_groups, fix_finger_bulges, setup_lod_hierarchy, cleanup_all_vertex_groups, bind_to_manny, in_place_conversion
-from .ui import panel
+import bpy
+from .operators.audit_lod_coherence import AuditLodCoherenceOperator
+from .operators.bind_to_manny import BindToMannyOperator
+from .operators.bone_budget import ApplyBoneBudgetOperator
+from .operators.cleanup_all_vertex_groups import CleanupAllVertexGroupsOperator
+from .operators.cleanup_bone_weights import CleanUpBoneWeightsOperator
+from .operators.cleanup_unused_vertex_groups import CleanUpUnusedVertexGroupsOperator
+from .operators.deformation_qa import DeformationQAOperator, SaveDeformationReferenceOperator
+from .operators.fix_finger_bulges import FixFingerBulgesOperator
+from .operators.fix_seams import FixSeamsOperator
+from .operators.fix_toes import FixToesOperator
+from .operators.fix_twist_bone_names import FixTwistBoneNamesOperator
+from .operators.in_place_conversion import InPlaceConversionOperator
+from .operators.lod_bone_reduction import ApplyLodBoneReductionOperator
+from .operators.propagate_lod_weights import PropagateLodWeightsOperator
+from .operators.prune_shape_keys import PruneShapeKeysOperator
+from .operators.remap_tables import SaveRemapTablesOperator
+from .operators.reorder_material_sections import ReorderMaterialSectionsOperator
+from .operators.setup_lod_hierarchy import SetupLodHierarchyOperator
+from .operators.skeleton_conformance import CheckSkeletonConformanceOperator, SaveReferenceSkeletonOperator
+from .operators.skinning_report import SkinningReportOperator
+from .operators.slim_for_export import SlimForExportOperator
+from .operators.weight_snapshot import CompareWeightSnapshotOperator, SaveWeightSnapshotOperator
+from .ui.panel import BoneWeightCleanupPanel, MetahumanToMannySettings
 
 bl_info = {
     "name": "MetahumanToManny",
@@ -14,31 +36,48 @@ bl_info = {
     "warning": "",
 }
 
+# Every class the add-on registers, in registration order (unregistered in reverse).
+# The operator modules only import bpy and the standard library at load time;
+# NumPy and the weight kernels are imported inside the functions that use them.
+classes = (
+    CleanUpBoneWeightsOperator,
+    FixTwistBoneNamesOperator,
+    FixSeamsOperator,
+    FixToesOperator,
+    CleanUpUnusedVertexGroupsOperator,
+    FixFingerBulgesOperator,
+    SetupLodHierarchyOperator,
+    CleanupAllVertexGroupsOperator,
+    BindToMannyOperator,
+    InPlaceConversionOperator,
+    PropagateLodWeightsOperator,
+    ApplyLodBoneReductionOperator,
+    ApplyBoneBudgetOperator,
+    SkinningReportOperator,
+    ReorderMaterialSectionsOperator,
+    PruneShapeKeysOperator,
+    SlimForExportOperator,
+    SaveWeightSnapshotOperator,
+    CompareWeightSnapshotOperator,
+    AuditLodCoherenceOperator,
+    SaveDeformationReferenceOperator,
+    DeformationQAOperator,
+    SaveReferenceSkeletonOperator,
+    CheckSkeletonConformanceOperator,
+    SaveRemapTablesOperator,
+    MetahumanToMannySettings,
+    BoneWeightCleanupPanel,
+)
+
 def register():
-    cleanup_bone_weights.register()
-    fix_twist_bone_names.register()
-    fix_seams.register()
-    fix_toes.register()
-    cleanup_unused_vertex_groups.register()
-    fix_finger_bulges.register()
-    setup_lod_hierarchy.register()
-    cleanup_all_vertex_groups.register()
-    bind_to_manny.register()
-    in_place_conversion.register()
-    panel.register()
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.metahuman_to_manny_settings = bpy.props.PointerProperty(type=MetahumanToMannySettings)
 
 def unregister():
-    cleanup_bone_weights.unregister()
-    fix_twist_bone_names.unregister()
-    fix_seams.unregister()
-    fix_toes.unregister()
-    cleanup_unused_vertex_groups.unregister()
-    fix_finger_bulges.unregister()
-    setup_lod_hierarchy.unregister()
-    cleanup_all_vertex_groups.unregister()
-    bind_to_manny.unregister()
-    in_place_conversion.unregister()
-    panel.unregister()
+    del bpy.types.Scene.metahuman_to_manny_settings
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
 
 if __name__ == "__main__":
     register()
@@ -0,0 +1,7 @@
+"""Conversion algorithms on plain name lists and NumPy arrays.
+
+Nothing in this package imports bpy or mathutils, so it runs in any Python
+with NumPy: add the add-on folder to sys.path and ``import core``. The
+operators are thin adapters that read Blender data into these structures and
+write the results back.
+"""
@@ -0,0 +1,64 @@
+import heapq
+import numpy as np
+
+def solve_bone_budget(hierarchy, group_names, contributions, budget, min_weight=1e-6):
+    """Greedily collapse the least significant leaf bones into their parents until at most budget bones influence the mesh.
+
+    contributions holds the total weight of each vertex group. Only groups that
+    match a bone take part; the root bones are never collapsed. Returns a
+    group name -> target group name mapping for fold_weights.
+    """
+    weight = np.zeros(len(hierarchy), dtype=np.float64)
+    for name, contribution in zip(group_names, contributions):
+        index = hierarchy.index.get(name)
+        if index is not None:
+            weight[index] += contribution
+
+    parents = hierarchy.parents
+    active = weight > min_weight
+    active_count = int(active.sum())
+    if active_count <= budget:
+        return {}
+
+    # Number of active bones strictly below each bone, from the depth-first subtree ranges
+    active_before = np.concatenate(([0], np.cumsum(active)))
+    bone_range = np.arange(len(hierarchy))
+    active_below = active_before[hierarchy.subtree_end] - active_before[bone_range + 1]
+
+    heap = [(weight[i], i) for i in np.flatnonzero(active & (active_below == 0) & (parents >= 0)).tolist()]
+    heapq.heapify(heap)
+    folded_into = {}
+
+    while active_count > budget and heap:
+        bone_weight, bone = heapq.heappop(heap)
+        # Skip stale entries left behind by earlier collapses
+        if not active[bone] or active_below[bone] or bone_weight != weight[bone]:
+            continue
+
+        parent = parents[bone]
+        active[bone] = False
+        weight[parent] += weight[bone]
+        weight[bone] = 0.0
+        folded_into[bone] = parent
+
+        if active[parent]:
+            active_count -= 1
+            ancestor = parent
+            while ancestor >= 0:
+                active_below[ancestor] -= 1
+                ancestor = parents[ancestor]
+        else:
+            # The parent takes the bone's place, so only the parent's own subtree count changes
+            active[parent] = True
+            active_below[parent] -= 1
+
+        if active_below[parent] == 0 and parents[parent] >= 0:
+            heapq.heappush(heap, (weight[parent], parent))
+
+    group_map = {}
+    for bone in folded_into:
+        target = folded_into[bone]
+        while target in folded_into:
+            target = folded_into[target]
+        group_map[hierarchy.names[bone]] = hierarchy.names[target]
+    return group_map
@@ -0,0 +1,121 @@
+import numpy as np
+
+def align_weights(reference_names, reference_weights, candidate_names, candidate_weights):
+    """Bring two weight arrays onto the union of their group names.
+
+    The reference groups come first in their own order, followed by the groups
+    only the candidate has. A group missing on one side is all zero there.
+    Returns (group_names, aligned_reference, aligned_candidate).
+    """
+    reference_set = set(reference_names)
+    all_groups = list(reference_names) + [name for name in candidate_names if name not in reference_set]
+    column = {name: i for i, name in enumerate(all_groups)}
+    aligned_candidate = np.zeros((candidate_weights.shape[0], len(all_groups)), dtype=np.float32)
+    aligned_candidate[:, [column[name] for name in candidate_names]] = candidate_weights
+    aligned_reference = np.zeros((reference_weights.shape[0], len(all_groups)), dtype=np.float32)
+    aligned_reference[:, :len(reference_names)] = reference_weights
+    return all_groups, aligned_reference, aligned_candidate
+
+def compare_weight_snapshots(reference, candidate, tolerance=1e-4):
+    """Compare two weight states of the same mesh, matching vertex groups by name.
+
+    Returns a report dict; report["passed"] is False if the vertex counts differ or
+    any weight differs by more than tolerance. A group missing on one side counts
+    as all zero weights there, so it only fails the check if it carries weight.
+    """
+    reference_weights = reference["weights"]
+    candidate_weights = candidate["weights"]
+    reference_groups = set(reference["groups"])
+    candidate_groups = set(candidate["groups"])
+    report = {
+        "reference": reference["mesh"],
+        "candidate": candidate["mesh"],
+        "tolerance": tolerance,
+        "missing_groups": [name for name in reference["groups"] if name not in candidate_groups],
+        "extra_groups": [name for name in candidate["groups"] if name not in reference_groups],
+    }
+
+    if reference_weights.shape[0] != candidate_weights.shape[0]:
+        report.update({
+            "passed": False,
+            "error": f"vertex count differs: {reference_weights.shape[0]} vs {candidate_weights.shape[0]}",
+        })
+        return report
+
+    all_groups, aligned_reference, aligned_candidate = align_weights(
+        reference["groups"], reference_weights, candidate["groups"], candidate_weights
+    )
+
+    difference = np.abs(aligned_reference - aligned_candidate)
+    per_group = difference.max(axis=0) if difference.size else np.zeros(len(all_groups), dtype=np.float32)
+    per_vertex = difference.max(axis=1) if difference.size else np.zeros(difference.shape[0], dtype=np.float32)
+
+    changed_groups = np.flatnonzero(per_group > tolerance)
+    worst_vertex = int(per_vertex.argmax()) if len(per_vertex) else -1
+    report.update({
+        "passed": not len(changed_groups),
+        "max_difference": float(per_vertex.max(initial=0.0)),
+        "worst_vertex": worst_vertex,
+        "changed_vertices": int((per_vertex > tolerance).sum()),
+        "changed_groups": {all_groups[i]: float(per_group[i]) for i in changed_groups.tolist()},
+    })
+    return report
+
+def format_comparison(report):
+    """One-line summary of a comparison report"""
+    status = "PASS" if report["passed"] else "FAIL"
+    if "error" in report:
+        return f"{status} {report['candidate']}: {report['error']}"
+    return (f"{status} {report['candidate']}: max difference {report['max_difference']:.6f} at vertex {report['worst_vertex']}, "
+            f"{report['changed_vertices']} changed vertices, {len(report['changed_groups'])} changed groups, "
+            f"{len(report['missing_groups'])} missing, {len(report['extra_groups'])} extra")
+
+def weight_divergence(expected_names, expected_weights, actual_names, actual_weights, worst_count=5):
+    """Compare the weights a mesh should have with the ones it has, vertex by vertex.
+
+    Divergence of a vertex is half the L1 distance between both weight vectors
+    (0 = identical, 1 = no bone in common). Regions are the vertices sharing the
+    same dominant expected bone. Returns a report dict.
+    """
+    all_groups, expected, actual = align_weights(expected_names, expected_weights, actual_names, actual_weights)
+
+    difference = np.abs(expected - actual)
+    divergence = 0.5 * difference.sum(axis=1)
+    expected_dominant = expected.argmax(axis=1)
+    dominant_mismatch = expected_dominant != actual.argmax(axis=1)
+
+    per_bone = difference.mean(axis=0)
+    bone_order = np.argsort(-per_bone)[:worst_count]
+
+    # Mean divergence per region, regions keyed by their dominant expected bone
+    region_counts = np.bincount(expected_dominant, minlength=len(all_groups))
+    region_divergence = np.bincount(expected_dominant, weights=divergence, minlength=len(all_groups))
+    region_mean = np.divide(region_divergence, region_counts, out=np.zeros(len(all_groups)), where=region_counts > 0)
+    region_order = np.argsort(-region_mean)[:worst_count]
+
+    return {
+        "vertices": len(actual_weights),
+        "mean_divergence": float(divergence.mean()) if len(divergence) else 0.0,
+        "max_divergence": float(divergence.max(initial=0.0)),
+        "dominant_bone_mismatch": int(dominant_mismatch.sum()),
+        "worst_bones": [
+            {"bone": all_groups[i], "mean_difference": float(per_bone[i])}
+            for i in bone_order.tolist() if per_bone[i] > 0
+        ],
+        "worst_regions": [
+            {"bone": all_groups[i], "vertices": int(region_counts[i]), "mean_divergence": float(region_mean[i])}
+            for i in region_order.tolist() if region_mean[i] > 0
+        ],
+    }
+
+def format_audit(report):
+    """Multi-line summary of an audit report"""
+    lines = [
+        f"{report['target']} vs {report['source']}: mean divergence {report['mean_divergence']:.4f}, "
+        f"max {report['max_divergence']:.4f}, dominant bone differs on {report['dominant_bone_mismatch']}/{report['vertices']} vertices"
+    ]
+    for region in report["worst_regions"]:
+        lines.append(f"  Region {region['bone']}: {region['mean_divergence']:.4f} over {region['vertices']} vertices")
+    for bone in report["worst_bones"]:
+        lines.append(f"  Bone {bone['bone']}: mean difference {bone['mean_difference']:.4f}")
+    return "\n".join(lines)
@@ -0,0 +1,98 @@
+import fnmatch
+import numpy as np
+
+OTHER_REGION = "Other"
+
+def vertex_regions(group_names, weights, region_patterns):
+    """Assign every vertex to the region of its dominant vertex group.
+
+    region_patterns maps region names to group name patterns (fnmatch, case
+    sensitive); the first region with a matching pattern wins. Vertices without
+    weights or whose dominant group matches no region go to "Other".
+    Returns (region_names, vertex_region) with one region index per vertex.
+    """
+    region_names = list(region_patterns) + [OTHER_REGION]
+    group_region = np.full(len(group_names) + 1, len(region_names) - 1, dtype=np.int32)
+    for group_index, group_name in enumerate(group_names):
+        for region_index, patterns in enumerate(region_patterns.values()):
+            if any(fnmatch.fnmatchcase(group_name, pattern) for pattern in patterns):
+                group_region[group_index] = region_index
+                break
+
+    # Weightless vertices point at the extra last slot, which is "Other"
+    dominant = weights.argmax(axis=1) if weights.size else np.zeros(weights.shape[0], dtype=np.int64)
+    if weights.size:
+        dominant[weights.max(axis=1) <= 0.0] = len(group_names)
+    return region_names, group_region[dominant]
+
+def compare_deformation(reference, candidate, tolerance=0.5, vertex_map=None):
+    """Compare the posed vertex positions of two captures of the same mesh.
+
+    Both captures hold "mesh", "poses", "positions" (poses x vertices x 3) and,
+    for the reference, "region_names" and "vertex_region". Poses are matched by
+    name and regions come from the reference. vertex_map can give the reference
+    vertex of every candidate vertex when the vertex counts differ. Returns a
+    report dict; report["passed"] is False if the vertex counts differ without a
+    vertex_map or any vertex moved further than tolerance from its reference position.
+    """
+    report = {
+        "reference": reference["mesh"],
+        "candidate": candidate["mesh"],
+        "tolerance": tolerance,
+        "missing_poses": [name for name in reference["poses"] if name not in candidate["poses"]],
+        "poses": [],
+    }
+
+    reference_positions = reference["positions"]
+    candidate_positions = candidate["positions"]
+    vertex_region = reference["vertex_region"]
+    if vertex_map is not None:
+        reference_positions = reference_positions[:, vertex_map]
+        vertex_region = vertex_region[vertex_map]
+    if reference_positions.shape[1] != candidate_positions.shape[1]:
+        report.update({
+            "passed": False,
+            "error": f"vertex count differs: {reference_positions.shape[1]} vs {candidate_positions.shape[1]}",
+        })
+        return report
+
+    region_names = reference["region_names"]
+    present_regions = np.flatnonzero(np.bincount(vertex_region, minlength=len(region_names))).tolist()
+    candidate_pose = {name: i for i, name in enumerate(candidate["poses"])}
+    for pose_index, pose_name in enumerate(reference["poses"]):
+        if pose_name not in candidate_pose:
+            continue
+        displacement = np.linalg.norm(
+            candidate_positions[candidate_pose[pose_name]] - reference_positions[pose_index], axis=1
+        )
+        region_max = np.zeros(len(region_names), dtype=np.float32)
+        np.maximum.at(region_max, vertex_region, displacement)
+        worst_vertex = int(displacement.argmax()) if len(displacement) else -1
+        report["poses"].append({
+            "pose": pose_name,
+            "max_displacement": float(displacement.max(initial=0.0)),
+            "worst_vertex": worst_vertex,
+            "moved_vertices": int((displacement > tolerance).sum()),
+            "regions": {region_names[i]: float(region_max[i]) for i in present_regions},
+        })
+
+    report["passed"] = all(pose["moved_vertices"] == 0 for pose in report["poses"])
+    return report
+
+def format_deformation_report(report):
+    """Summary line of a deformation report, followed by one line per pose with the worst regions first"""
+    status = "PASS" if report["passed"] else "FAIL"
+    if "error" in report:
+        return f"{status} {report['candidate']}: {report['error']}"
+
+    worst = max((pose["max_displacement"] for pose in report["poses"]), default=0.0)
+    lines = [f"{status} {report['candidate']}: max displacement {worst:.4f} over {len(report['poses'])} pose(s)"]
+    if report["missing_poses"]:
+        lines.append(f"  Missing poses: {', '.join(report['missing_poses'])}")
+    for pose in report["poses"]:
+        regions = ", ".join(
+            f"{region} {displacement:.4f}"
+            for region, displacement in sorted(pose["regions"].items(), key=lambda item: -item[1])
+        )
+        lines.append(f"  {pose['pose']}: max {pose['max_displacement']:.4f} at vertex {pose['worst_vertex']} ({regions})")
+    return "\n".join(lines)
@@ -0,0 +1,85 @@
+import numpy as np
+
+class ArmatureHierarchy:
+    """Flat, array based view of an armature's bone tree.
+
+    Bones are stored in depth-first order, so the subtree of bone i is the
+    contiguous index range [i, subtree_end[i]) and every parent comes before
+    its children.
+    """
+
+    def __init__(self, bone_names, parent_names):
+        """bone_names and parent_names are parallel lists; roots have None as parent.
+
+        Siblings keep the order in which they appear in bone_names.
+        """
+        children = {name: [] for name in bone_names}
+        roots = []
+        for name, parent in zip(bone_names, parent_names):
+            if parent is None or parent not in children:
+                roots.append(name)
+            else:
+                children[parent].append(name)
+
+        names = []
+        parents = []
+        depth = []
+        stack = [(name, -1, 0) for name in reversed(roots)]
+        while stack:
+            name, parent_index, bone_depth = stack.pop()
+            index = len(names)
+            names.append(name)
+            parents.append(parent_index)
+            depth.append(bone_depth)
+            for child in reversed(children[name]):
+                stack.append((child, index, bone_depth + 1))
+
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.name_set = frozenset(names)
+        self.parents = np.array(parents, dtype=np.int32)
+        self.depth = np.array(depth, dtype=np.int32)
+
+        # A subtree ends at the next bone that is not deeper than its root
+        self.subtree_end = np.full(len(names), len(names), dtype=np.int32)
+        open_bones = []
+        for i, bone_depth in enumerate(depth):
+            while open_bones and depth[open_bones[-1]] >= bone_depth:
+                self.subtree_end[open_bones.pop()] = i
+            open_bones.append(i)
+
+    def __len__(self):
+        return len(self.names)
+
+    def has_bone(self, name):
+        return name in self.name_set
+
+    def descendants(self, name):
+        """Names of all bones below the given bone"""
+        i = self.index.get(name)
+        if i is None:
+            return []
+        return self.names[i + 1:self.subtree_end[i]]
+
+    def nearest_ancestor_indices(self, names):
+        """For every bone, the index of the closest bone in names at or above it (-1 if there is none)"""
+        member = np.zeros(len(self.names), dtype=bool)
+        member[[self.index[name] for name in names if name in self.index]] = True
+
+        target = np.where(member, np.arange(len(self.names), dtype=np.int32), self.parents)
+        # Pointer jumping: each pass halves the remaining distance to a member bone
+        while True:
+            unresolved = np.flatnonzero(target >= 0)
+            unresolved = unresolved[~member[target[unresolved]]]
+            if not len(unresolved):
+                return target
+            target[unresolved] = target[target[unresolved]]
+
+    def nearest_ancestor_map(self, names):
+        """Map every bone that is not in names to its closest ancestor in names, skipping bones without one"""
+        target = self.nearest_ancestor_indices(names)
+        return {
+            self.names[i]: self.names[t]
+            for i, t in enumerate(target.tolist())
+            if t >= 0 and t != i
+        }
@@ -0,0 +1,67 @@
+import re
+
+LOD_SUFFIX = re.compile(r'_LOD(\d+)$')
+
+def lod_number(name):
+    """Return the LOD index from a '_LOD<n>' name suffix, or 0 for names without one"""
+    match = LOD_SUFFIX.search(name)
+    return int(match.group(1)) if match else 0
+
+def lod_prefix(name):
+    """Name without its '_LOD<n>' suffix (e.g. "FaceMesh_LOD0" -> "FaceMesh")"""
+    match = LOD_SUFFIX.search(name)
+    return name[:match.start()] if match else name
+
+def toe_merge_map(group_names):
+    """Map every toe group to ball_l or ball_r by its _l/_r suffix; left wins if a name has both"""
+    group_map = {}
+    for name in group_names:
+        if "toe" not in name.lower():
+            continue
+        if "_l" in name:
+            group_map[name] = "ball_l"
+        elif "_r" in name:
+            group_map[name] = "ball_r"
+    return group_map
+
+def bulge_merge_map(group_names):
+    """Map every finger bulge group to the group it was split from, if that group exists.
+
+    Returns (group_map, missing_targets): the merges and the target names of bulge groups that have no target.
+    """
+    existing = set(group_names)
+    group_map = {}
+    missing_targets = []
+    for name in group_names:
+        if "bulge" not in name:
+            continue
+        target = name.replace("_bulge", "")
+        if target in existing and target != name:
+            group_map[name] = target
+        else:
+            missing_targets.append(target)
+    return group_map, missing_targets
+
+def twist_renames(group_names):
+    """Plan the twistCor -> twist renames.
+
+    Returns (renames, replaced): the old -> new names and the existing twist
+    groups that have to be removed first because a twistCor group takes their name.
+    """
+    existing = set(group_names)
+    renames = {name: name.replace("twistCor", "twist") for name in group_names if "twistCor" in name}
+    replaced = [new_name for new_name in renames.values() if new_name in existing]
+    return renames, replaced
+
+def bones_outside_keep_list(bone_names, bones_to_keep):
+    """All bones that are not in the keep list, in the given order"""
+    return [name for name in bone_names if name not in bones_to_keep]
+
+# A standalone l/r (or L/R) token after an underscore or dot, ending at an underscore, dot or the end of the name,
+# e.g. "ball_l", "FACIAL_L_Eye" or Blender's "hand.L"
+SIDE_TOKEN = re.compile(r'(?<=[_.])([lrLR])(?=[_.]|$)')
+MIRRORED_SIDE = {"l": "r", "r": "l", "L": "R", "R": "L"}
+
+def mirror_group_name(name):
+    """Name of the group on the other side ("thigh_l" -> "thigh_r", "hand.L" -> "hand.R"); center groups keep their name"""
+    return SIDE_TOKEN.sub(lambda match: MIRRORED_SIDE[match.group(1)], name)
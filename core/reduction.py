@@ -0,0 +1,38 @@
+def budget_for_lod(budgets, lod_number):
+    """Bone budget of a LOD, or None if no budgets are configured"""
+    if not budgets:
+        return None
+    return budgets[min(lod_number, len(budgets) - 1)]
+
+def rules_for_lod(profiles, lod_number):
+    """All collapse rules that apply to the given LOD, in profile order"""
+    rules = []
+    for profile in profiles:
+        if lod_number >= profile.get("min_lod", 0):
+            rules.extend(profile.get("rules", []))
+    return rules
+
+def compile_reduction_map(rules, hierarchy):
+    """Turn collapse rules into a flat source group -> target group mapping.
+
+    A rule folds either an explicit list of bones ("bones") or the whole subtree
+    below its target ("descendants") into the target. The first rule matching a
+    bone wins, and chains (a target that is itself collapsed) are followed to the end.
+    """
+    group_map = {}
+    for rule in rules:
+        target = rule["target"]
+        sources = list(rule.get("bones", []))
+        if rule.get("descendants"):
+            sources.extend(hierarchy.descendants(target))
+        for source in sources:
+            if source != target and source not in group_map:
+                group_map[source] = target
+
+    for source, target in group_map.items():
+        seen = {source}
+        while target in group_map and target not in seen:
+            seen.add(target)
+            target = group_map[target]
+        group_map[source] = target
+    return group_map
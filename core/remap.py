@@ -0,0 +1,23 @@
+import hashlib
+
+def skeleton_hash(bone_names, parent_names):
+    """Fingerprint of a bone tree that does not depend on bone order: SHA-1 over sorted "bone<parent" pairs"""
+    entries = sorted(f"{name}<{parent or ''}" for name, parent in zip(bone_names, parent_names))
+    return hashlib.sha1("\n".join(entries).encode("utf-8")).hexdigest()
+
+def build_remap_table(skeleton_signature, targets, group_map):
+    """Stored form of a precomputed group -> target map for one skeleton"""
+    return {
+        "skeleton_hash": skeleton_signature,
+        "targets": sorted(targets),
+        "map": dict(sorted(group_map.items())),
+    }
+
+def find_remap_table(tables, table_name, skeleton_signature, targets):
+    """The stored map of a table if it was computed for this skeleton and these targets, else None"""
+    table = tables.get(table_name)
+    if not table or table.get("skeleton_hash") != skeleton_signature:
+        return None
+    if table.get("targets") != sorted(targets):
+        return None
+    return table["map"]
@@ -0,0 +1,86 @@
+import numpy as np
+
+def compare_skeletons(reference, candidate, position_tolerance=0.01, angle_tolerance=0.5):
+    """Check an armature against a reference skeleton with vectorized rest matrix comparisons.
+
+    Both skeletons hold "armature", "names", "parents" (int32 index of the parent
+    bone, -1 for roots) and "rest" (bones x 4 x 4 armature-space rest matrices).
+    Bones are matched by name. A bone fails if its parent differs, its head is more
+    than position_tolerance away or its orientation more than angle_tolerance degrees
+    off. Returns a report dict; report["passed"] is False on any missing, extra or
+    failing bone.
+    """
+    reference_names = list(reference["names"])
+    candidate_names = list(candidate["names"])
+    candidate_index = {name: i for i, name in enumerate(candidate_names)}
+    reference_set = set(reference_names)
+
+    common = [(i, candidate_index[name]) for i, name in enumerate(reference_names) if name in candidate_index]
+    reference_rows = np.array([i for i, _j in common], dtype=np.intp)
+    candidate_rows = np.array([j for _i, j in common], dtype=np.intp)
+
+    # Candidate parent indices in reference numbering: -1 for roots, -2 for parents the reference lacks
+    candidate_to_reference = np.full(len(candidate_names) + 1, -2, dtype=np.intp)
+    candidate_to_reference[candidate_rows] = reference_rows
+    candidate_to_reference[-1] = -1
+    expected_parents = reference["parents"][reference_rows].astype(np.intp)
+    actual_parents = candidate_to_reference[candidate["parents"][candidate_rows]]
+    wrong_parent = np.flatnonzero(expected_parents != actual_parents)
+
+    reference_rest = reference["rest"][reference_rows]
+    candidate_rest = candidate["rest"][candidate_rows]
+    position_error = np.linalg.norm(candidate_rest[:, :3, 3] - reference_rest[:, :3, 3], axis=1)
+
+    # Angle of the rotation between both orientations, ignoring bone scale
+    reference_axes = reference_rest[:, :3, :3] / np.linalg.norm(reference_rest[:, :3, :3], axis=1, keepdims=True)
+    candidate_axes = candidate_rest[:, :3, :3] / np.linalg.norm(candidate_rest[:, :3, :3], axis=1, keepdims=True)
+    trace = np.einsum('bij,bij->b', reference_axes, candidate_axes)
+    angle_error = np.degrees(np.arccos(np.clip((trace - 1.0) / 2.0, -1.0, 1.0)))
+    wrong_rest = np.flatnonzero((position_error > position_tolerance) | (angle_error > angle_tolerance))
+
+    def parent_name(names, index):
+        return names[index] if index >= 0 else None
+
+    report = {
+        "reference": reference["armature"],
+        "candidate": candidate["armature"],
+        "missing_bones": [name for name in reference_names if name not in candidate_index],
+        "extra_bones": [name for name in candidate_names if name not in reference_set],
+        "wrong_parents": {
+            reference_names[reference_rows[k]]: {
+                "expected": parent_name(reference_names, expected_parents[k]),
+                "actual": parent_name(candidate_names, candidate["parents"][candidate_rows[k]]),
+            }
+            for k in wrong_parent.tolist()
+        },
+        "wrong_rest": {
+            reference_names[reference_rows[k]]: {
+                "position_error": float(position_error[k]),
+                "angle_error": float(angle_error[k]),
+            }
+            for k in wrong_rest.tolist()
+        },
+        "max_position_error": float(position_error.max(initial=0.0)),
+        "max_angle_error": float(angle_error.max(initial=0.0)),
+    }
+    report["passed"] = not (report["missing_bones"] or report["extra_bones"] or report["wrong_parents"] or report["wrong_rest"])
+    return report
+
+def format_conformance(report, limit=10):
+    """Summary line of a conformance report, followed by up to limit lines per kind of mismatch"""
+    status = "PASS" if report["passed"] else "FAIL"
+    lines = [
+        f"{status} {report['candidate']} against {report['reference']}: "
+        f"{len(report['missing_bones'])} missing, {len(report['extra_bones'])} extra, "
+        f"{len(report['wrong_parents'])} wrong parent(s), {len(report['wrong_rest'])} wrong rest pose(s), "
+        f"max error {report['max_position_error']:.4f} / {report['max_angle_error']:.2f} deg"
+    ]
+    if report["missing_bones"]:
+        lines.append(f"  Missing: {', '.join(report['missing_bones'][:limit])}")
+    if report["extra_bones"]:
+        lines.append(f"  Extra: {', '.join(report['extra_bones'][:limit])}")
+    for name, parents in list(report["wrong_parents"].items())[:limit]:
+        lines.append(f"  {name}: parent {parents['actual']}, expected {parents['expected']}")
+    for name, error in sorted(report["wrong_rest"].items(), key=lambda item: -item[1]["position_error"])[:limit]:
+        lines.append(f"  {name}: rest pose off by {error['position_error']:.4f} / {error['angle_error']:.2f} deg")
+    return "\n".join(lines)
@@ -0,0 +1,212 @@
+import numpy as np
+
+# 3 x 3 x 3 block of grid cells around a query cell
+_NEIGHBOR_OFFSETS = np.array([(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)], dtype=np.int64)
+
+def _expand_ranges(starts, counts):
+    """Flat indices of the ranges [starts[i], starts[i] + counts[i]) and the range number of every index"""
+    owner = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.arange(len(owner)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owner, np.repeat(starts, counts) + offsets
+
+def _first_minimum(owner, values, count):
+    """Per owner (0 .. count-1), the position of its smallest value; -1 for owners without values.
+
+    owner must be sorted, as _expand_ranges returns it.
+    """
+    best = np.full(count, -1, dtype=np.int64)
+    if not len(owner):
+        return best
+    starts = np.flatnonzero(np.r_[True, owner[1:] != owner[:-1]])
+    segment = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(owner)]))
+    minimum = np.minimum.reduceat(values, starts)
+    hits = np.flatnonzero(values == minimum[segment])
+    first = hits[np.r_[True, segment[hits][1:] != segment[hits][:-1]]]
+    best[owner[starts]] = first
+    return best
+
+def closest_points_on_triangles(points, a, b, c):
+    """Closest point on triangle (a, b, c) for every row, all rows at once.
+
+    Follows the Voronoi region tests of Ericson's "Real-Time Collision Detection".
+    Returns (squared distances, barycentric coordinates as (rows x 3)).
+    """
+    ab, ac = b - a, c - a
+    ap, bp, cp = points - a, points - b, points - c
+    d1 = np.einsum('ij,ij->i', ab, ap)
+    d2 = np.einsum('ij,ij->i', ac, ap)
+    d3 = np.einsum('ij,ij->i', ab, bp)
+    d4 = np.einsum('ij,ij->i', ac, bp)
+    d5 = np.einsum('ij,ij->i', ab, cp)
+    d6 = np.einsum('ij,ij->i', ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Face interior first, then overwrite with the edge and corner regions in rising priority
+        denom = va + vb + vc
+        v = vb / denom
+        w = vc / denom
+        bary = np.stack([1.0 - v - w, v, w], axis=1)
+
+        t = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        edge_bc = (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0)
+        bary[edge_bc] = np.stack([np.zeros_like(t), 1.0 - t, t], axis=1)[edge_bc]
+
+        t = d2 / (d2 - d6)
+        edge_ac = (vb <= 0) & (d2 >= 0) & (d6 <= 0)
+        bary[edge_ac] = np.stack([1.0 - t, np.zeros_like(t), t], axis=1)[edge_ac]
+
+        bary[(d6 >= 0) & (d5 <= d6)] = (0.0, 0.0, 1.0)
+
+        t = d1 / (d1 - d3)
+        edge_ab = (vc <= 0) & (d1 >= 0) & (d3 <= 0)
+        bary[edge_ab] = np.stack([1.0 - t, t, np.zeros_like(t)], axis=1)[edge_ab]
+
+        bary[(d3 >= 0) & (d4 <= d3)] = (0.0, 1.0, 0.0)
+        bary[(d1 <= 0) & (d2 <= 0)] = (1.0, 0.0, 0.0)
+
+    # Degenerate triangles can leave divisions by zero, fall back to their first corner
+    bary[~np.isfinite(bary).all(axis=1)] = (1.0, 0.0, 0.0)
+    closest = a * bary[:, 0, None] + b * bary[:, 1, None] + c * bary[:, 2, None]
+    distance = np.einsum('ij,ij->i', points - closest, points - closest)
+    return distance, bary
+
+class SurfaceIndex:
+    """Closest point queries against a triangle mesh, answered for all query points at once.
+
+    The vertices are bucketed into a uniform grid. A query finds its nearest
+    vertex in the surrounding grid cells (falling back to a brute force search
+    for points further away than one cell), then the closest point on the
+    triangles around that vertex and around the corners of the best of them.
+    For a dense source like LOD0 this is the closest surface point, except for
+    large triangles whose corners are all further away than other vertices.
+    """
+
+    def __init__(self, positions, triangles, cell_size=None):
+        self.positions = np.asarray(positions, dtype=np.float64)
+        self.triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        vertex_count = len(self.positions)
+
+        low = self.positions.min(axis=0) if vertex_count else np.zeros(3)
+        high = self.positions.max(axis=0) if vertex_count else np.zeros(3)
+        if cell_size is None:
+            # About one vertex per cell for a volume, a few per cell along a surface
+            cell_size = float((high - low).max()) / max(vertex_count, 1) ** (1.0 / 3.0)
+        self.cell_size = max(cell_size, 1e-6)
+        self.origin = low
+        self.cell_counts = np.floor((high - low) / self.cell_size).astype(np.int64) + 1
+
+        keys = self._cell_keys(self._cells(self.positions))
+        self.vertex_order = np.argsort(keys, kind='stable')
+        self.sorted_keys = keys[self.vertex_order]
+        occupied = np.count_nonzero(np.diff(self.sorted_keys)) + 1 if vertex_count else 1
+        self.vertices_per_cell = max(vertex_count / occupied, 1.0)
+
+        # Vertex -> triangles adjacency as one sorted array with per-vertex start offsets.
+        # Coincident vertices (split along seams) share one fan, so the fan does not end at the seam
+        unique_positions, self.welded = np.unique(self.positions, axis=0, return_inverse=True)
+        self.welded = self.welded.reshape(-1)
+        corners = self.welded[self.triangles.ravel()]
+        self.corner_order = np.argsort(corners, kind='stable')
+        self.corner_starts = np.searchsorted(corners[self.corner_order], np.arange(len(unique_positions) + 1))
+
+    def _cells(self, points):
+        return np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+
+    def _cell_keys(self, cells):
+        # Padded by one cell on every side, so the neighbors of border cells get valid keys too
+        dims = self.cell_counts + 2
+        cells = cells + 1
+        return (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+
+    def nearest_vertices(self, points, chunk_size=2 ** 22):
+        """Index of and squared distance to the nearest vertex for every point"""
+        points = np.asarray(points, dtype=np.float64)
+        nearest = np.full(len(points), -1, dtype=np.int64)
+        distance = np.full(len(points), np.inf)
+
+        cells = self._cells(points)
+        inside = np.flatnonzero(((cells >= 0) & (cells < self.cell_counts)).all(axis=1))
+        # chunk_size bounds the number of candidate vertices held at once
+        points_per_chunk = max(1, int(chunk_size // (len(_NEIGHBOR_OFFSETS) * self.vertices_per_cell)))
+        for start in range(0, len(inside), points_per_chunk):
+            rows = inside[start:start + points_per_chunk]
+            # All 27 neighbor cells of every point at once, point by point
+            keys = self._cell_keys((cells[rows, None, :] + _NEIGHBOR_OFFSETS[None, :, :]).reshape(-1, 3))
+            starts = np.searchsorted(self.sorted_keys, keys, 'left')
+            counts = np.searchsorted(self.sorted_keys, keys, 'right') - starts
+            pair, positions = _expand_ranges(starts, counts)
+            owner = pair // len(_NEIGHBOR_OFFSETS)
+            candidates = self.vertex_order[positions]
+            delta = self.positions[candidates] - points[rows[owner]]
+            candidate_distance = np.einsum('ij,ij->i', delta, delta)
+
+            best = _first_minimum(owner, candidate_distance, len(rows))
+            found = best >= 0
+            nearest[rows[found]] = candidates[best[found]]
+            distance[rows[found]] = candidate_distance[best[found]]
+
+        # Only a vertex within one cell size is guaranteed to be in the searched cells
+        unresolved = np.flatnonzero(distance > self.cell_size ** 2)
+        step = max(1, chunk_size // max(len(self.positions), 1))
+        for start in range(0, len(unresolved), step):
+            rows = unresolved[start:start + step]
+            delta = points[rows, None, :] - self.positions[None, :, :]
+            chunk_distance = np.einsum('ijk,ijk->ij', delta, delta)
+            nearest[rows] = chunk_distance.argmin(axis=1)
+            distance[rows] = chunk_distance[np.arange(len(rows)), nearest[rows]]
+        return nearest, distance
+
+    def _closest_on_fans(self, points, point_rows, vertices):
+        """Best triangle around the given vertices per point: point_rows[i] owns vertices[i].
+        Returns (triangle index, squared distance, bary) per point, triangle -1 if none."""
+        vertices = self.welded[vertices]
+        starts = self.corner_starts[vertices]
+        counts = self.corner_starts[vertices + 1] - starts
+        pair, positions = _expand_ranges(starts, counts)
+        owner = point_rows[pair]
+        candidates = self.corner_order[positions] // 3
+        triangle_corners = self.triangles[candidates]
+        candidate_distance, candidate_bary = closest_points_on_triangles(
+            points[owner],
+            self.positions[triangle_corners[:, 0]],
+            self.positions[triangle_corners[:, 1]],
+            self.positions[triangle_corners[:, 2]],
+        )
+
+        best = _first_minimum(owner, candidate_distance, len(points))
+        found = best >= 0
+        triangle = np.full(len(points), -1, dtype=np.int64)
+        distance = np.full(len(points), np.inf)
+        bary = np.tile(np.array([1.0, 0.0, 0.0]), (len(points), 1))
+        triangle[found] = candidates[best[found]]
+        distance[found] = candidate_distance[best[found]]
+        bary[found] = candidate_bary[best[found]]
+        return triangle, distance, bary
+
+    def closest_points(self, points):
+        """Closest surface point for every point as (corners, bary): the source vertex
+        indices of its triangle (points x 3) and the barycentric coordinates on it."""
+        points = np.asarray(points, dtype=np.float64)
+        rows = np.arange(len(points))
+        nearest, _distance = self.nearest_vertices(points)
+
+        # Triangles around the nearest vertex, then around the corners of the best of them,
+        # which catches closest points across an edge of the first fan
+        triangle, distance, bary = self._closest_on_fans(points, rows, nearest)
+        found = np.flatnonzero(triangle >= 0)
+        ring_corners = self.triangles[triangle[found]]
+        second, second_distance, second_bary = self._closest_on_fans(
+            points, np.repeat(found, 3), ring_corners.ravel()
+        )
+        better = second_distance < distance
+        triangle[better] = second[better]
+        bary[better] = second_bary[better]
+
+        # Vertices without triangles map onto themselves
+        corners = np.repeat(nearest[:, None], 3, axis=1)
+        found = triangle >= 0
+        corners[found] = self.triangles[triangle[found]]
+        return corners.astype(np.int32), bary.astype(np.float32)
@@ -0,0 +1,61 @@
+import numpy as np
+from .naming import mirror_group_name
+
+def build_symmetry_map(positions, tolerance=1e-4, axis=0):
+    """Find the mirror partner of every vertex across the plane where the given axis is 0.
+
+    Returns an int32 array with the partner index per vertex, or -1 where no
+    single vertex lies within tolerance of the mirrored position. Vertices that
+    share a position with another vertex are left unmatched, since their
+    partner would be ambiguous.
+    """
+    mirrored = positions.copy()
+    mirrored[:, axis] *= -1
+    keys = np.round(positions / tolerance).astype(np.int64)
+    mirror_keys = np.round(mirrored / tolerance).astype(np.int64)
+
+    # Look up every mirrored position among the vertex positions through one shared key table
+    vertex_count = len(positions)
+    unique_keys, inverse = np.unique(np.concatenate([keys, mirror_keys]), axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    key_ids, mirror_key_ids = inverse[:vertex_count], inverse[vertex_count:]
+    counts = np.bincount(key_ids, minlength=len(unique_keys))
+    owner = np.full(len(unique_keys), -1, dtype=np.int32)
+    owner[key_ids] = np.arange(vertex_count, dtype=np.int32)
+
+    mirror = owner[mirror_key_ids]
+    mirror[counts[mirror_key_ids] != 1] = -1
+
+    # Rounding can pair points that straddle a grid cell, so check the real distance too
+    matched = np.flatnonzero(mirror >= 0)
+    distance = np.abs(positions[mirror[matched]] - mirrored[matched]).max(axis=1)
+    mirror[matched[distance > tolerance]] = -1
+
+    # Only keep pairs that agree in both directions
+    matched = np.flatnonzero(mirror >= 0)
+    mirror[matched[mirror[mirror[matched]] != matched]] = -1
+    return mirror
+
+def mirrored_vertices(positions, mirror, tolerance=1e-4, axis=0):
+    """Vertices on the negative side whose weights can be taken from their exact partner on the positive side"""
+    return np.flatnonzero((positions[:, axis] < -tolerance) & (mirror >= 0))
+
+def mirror_target_columns(targets, summed, group_names, weights, mirror, rows):
+    """Fill the given rows of folded target columns from the mirrored group at each row's partner vertex.
+
+    summed holds one column per name in targets, weights the unfolded groups. The
+    mirrored group of a target is looked up among the targets first and among the
+    unfolded groups second; if neither has it, the rows are cleared.
+    """
+    target_slot = {name: i for i, name in enumerate(targets)}
+    column = {name: i for i, name in enumerate(group_names)}
+    partners = mirror[rows]
+    for i, name in enumerate(targets):
+        mirrored_name = mirror_group_name(name)
+        if mirrored_name in target_slot:
+            summed[rows, i] = summed[partners, target_slot[mirrored_name]]
+        elif mirrored_name in column:
+            summed[rows, i] = weights[partners, column[mirrored_name]]
+        else:
+            summed[rows, i] = 0.0
+    return summed
@@ -0,0 +1,130 @@
+import hashlib
+import zlib
+import numpy as np
+
+# Vertices covered by one weight hash, small enough that a touch-up only dirties a few chunks
+HASH_CHUNK_VERTICES = 4096
+
+def fold_weights(group_names, weights, group_map):
+    """Add the weights of every source group onto its target group.
+
+    weights is a dense (vertices x groups) array whose columns follow group_names
+    and is not modified. Sources that are not in group_names are ignored, targets
+    that are not in group_names start from zero. Returns (targets, summed, sources):
+    the target names, their folded weight columns and the source names to drop.
+    """
+    column = {name: i for i, name in enumerate(group_names)}
+    group_map = {src: dst for src, dst in group_map.items() if src in column and src != dst}
+    if not group_map:
+        return [], np.zeros((len(weights), 0), dtype=weights.dtype), []
+
+    targets = sorted(set(group_map.values()))
+    summed = np.zeros((len(weights), len(targets)), dtype=weights.dtype)
+    existing = [i for i, name in enumerate(targets) if name in column]
+    summed[:, existing] = weights[:, [column[targets[i]] for i in existing]]
+
+    # Sum each target column with all of its source columns at once
+    target_slot = {name: i for i, name in enumerate(targets)}
+    source_columns = np.array([column[src] for src in group_map], dtype=np.intp)
+    source_targets = np.array([target_slot[dst] for dst in group_map.values()], dtype=np.intp)
+    order = np.argsort(source_targets, kind='stable')
+    source_columns, source_targets = source_columns[order], source_targets[order]
+    starts = np.flatnonzero(np.r_[True, source_targets[1:] != source_targets[:-1]])
+    summed[:, source_targets[starts]] += np.add.reduceat(weights[:, source_columns], starts, axis=1)
+
+    return targets, summed, list(group_map)
+
+def used_columns(weights, min_weight=1e-6):
+    """Boolean mask of the groups that influence at least one vertex"""
+    return (weights > min_weight).any(axis=0)
+
+def compact_order(group_names, used, bone_order):
+    """Column order that drops the unused groups and sorts the rest into bone order.
+
+    used is the mask from used_columns. Groups that are not bones keep their
+    relative order after the bone groups. Returns (order, removed_count).
+    """
+    keep = np.flatnonzero(used).tolist()
+    rank = {name: i for i, name in enumerate(bone_order)}
+    unknown_rank = len(rank)
+    order = sorted(keep, key=lambda i: (rank.get(group_names[i], unknown_rank), i))
+    return order, len(group_names) - len(keep)
+
+def chunk_rows(group_count, memory_budget, itemsize=4):
+    """Vertices per dense weight chunk, so that a chunk and its temporaries stay within memory_budget bytes"""
+    # A fold holds the chunk, the gathered source columns and the summed targets at the same time
+    return max(1, int(memory_budget // (3 * max(group_count, 1) * itemsize)))
+
+def group_id_dtype(group_count):
+    """Smallest unsigned integer type for vertex group indices: uint16 unless a mesh has more than 65536 groups"""
+    return np.uint16 if group_count <= 1 << 16 else np.uint32
+
+def sparse_influences(rows, weights, min_weight=1e-6):
+    """The influences of a dense weight chunk as compact (vertex indices, group ids, weights) arrays.
+
+    rows gives the vertex index of every chunk row. Vertex indices are int32,
+    group ids uint16 (see group_id_dtype) and weights float32.
+    """
+    local, groups = np.nonzero(weights > min_weight)
+    return (
+        rows[local].astype(np.int32),
+        groups.astype(group_id_dtype(weights.shape[1])),
+        weights[local, groups].astype(np.float32),
+    )
+
+def split_by_weight(column, min_weight=1e-6):
+    """Group the weighted vertices of one column by weight value.
+
+    Returns (empty, chunks): the indices at or below min_weight and a list of
+    (weight, indices) pairs, so a writer needs one call per distinct weight.
+    """
+    indices = np.flatnonzero(column > min_weight)
+    empty = np.flatnonzero(column <= min_weight)
+    if not len(indices):
+        return empty, []
+
+    values, inverse = np.unique(column[indices], return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    splits = np.cumsum(np.bincount(inverse, minlength=len(values)))[:-1]
+    return empty, list(zip(values.tolist(), np.split(indices[order], splits)))
+
+def interpolate_weights(source_weights, corners, bary):
+    """Source weights at the corresponded points: one row per target vertex"""
+    return (
+        source_weights[corners[:, 0]] * bary[:, 0, None]
+        + source_weights[corners[:, 1]] * bary[:, 1, None]
+        + source_weights[corners[:, 2]] * bary[:, 2, None]
+    )
+
+def influence_chunk_hashes(group_names, vertex_ids, group_ids, weights, chunks, chunk_vertices=HASH_CHUNK_VERTICES):
+    """Hash the influences of the given vertex chunks (chunk k covers vertices k * chunk_vertices onwards).
+
+    vertex_ids, group_ids and weights are compact influences in vertex order, as from
+    sparse_influences. Groups enter the hash by name, so adding, removing or reordering
+    groups leaves chunks that do not use them unchanged. Returns one hex digest per chunk.
+    """
+    name_codes = np.array([zlib.crc32(name.encode()) for name in group_names], dtype=np.uint32)
+    chunks = np.asarray(chunks, dtype=np.int64)
+    starts = np.searchsorted(vertex_ids, chunks * chunk_vertices)
+    ends = np.searchsorted(vertex_ids, (chunks + 1) * chunk_vertices)
+
+    hashes = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(vertex_ids[start:end].tobytes())
+        hasher.update(name_codes[group_ids[start:end]].tobytes())
+        hasher.update(weights[start:end].tobytes())
+        hashes.append(hasher.hexdigest())
+    return hashes
+
+def chunk_count(vertex_count, chunk_vertices=HASH_CHUNK_VERTICES):
+    return -(-vertex_count // chunk_vertices)
+
+def chunk_vertex_rows(chunks, vertex_count, chunk_vertices=HASH_CHUNK_VERTICES):
+    """Sorted int32 vertex indices covered by the given chunks"""
+    if not len(chunks):
+        return np.zeros(0, dtype=np.int32)
+    return np.concatenate([
+        np.arange(k * chunk_vertices, min((k + 1) * chunk_vertices, vertex_count), dtype=np.int32)
+        for k in sorted(chunks)
+    ])
@@ -0,0 +1,42 @@
+from ..core.hierarchy import ArmatureHierarchy
+
+# armature data name -> [bone count, hierarchy, skeleton hash (None until first asked)]
+_hierarchy_cache = {}
+
+def bone_parent_pairs(armature):
+    """(bone name, parent name or None) for every bone of an armature object, in bone order"""
+    return tuple((bone.name, bone.parent.name if bone.parent else None) for bone in armature.data.bones)
+
+def _cached_entry(armature):
+    data = armature.data
+    # Only the bone count is checked, so looking up the cache does not walk the bones. Renames and
+    # re-parenting keep the count: whatever edits bones calls invalidate_armature_hierarchy
+    bone_count = len(data.bones)
+
+    cached = _hierarchy_cache.get(data.name_full)
+    if cached and cached[0] == bone_count:
+        return cached
+
+    pairs = bone_parent_pairs(armature)
+    hierarchy = ArmatureHierarchy([name for name, _parent in pairs], [parent for _name, parent in pairs])
+    _hierarchy_cache[data.name_full] = [bone_count, hierarchy, None]
+    return _hierarchy_cache[data.name_full]
+
+def get_armature_hierarchy(armature):
+    """Return the hierarchy index of an armature object, cached until its bone count changes or it is invalidated"""
+    return _cached_entry(armature)[1]
+
+def get_skeleton_hash(armature):
+    """SHA-1 fingerprint of the bone tree (see core.remap.skeleton_hash), cached with the hierarchy"""
+    from ..core.remap import skeleton_hash
+
+    entry = _cached_entry(armature)
+    if entry[2] is None:
+        hierarchy = entry[1]
+        parent_names = [hierarchy.names[parent] if parent >= 0 else None for parent in hierarchy.parents.tolist()]
+        entry[2] = skeleton_hash(hierarchy.names, parent_names)
+    return entry[2]
+
+def invalidate_armature_hierarchy(armature):
+    """Forget the cached hierarchy after the bones were edited, and when an operator starts, since bones may have been edited by hand"""
+    _hierarchy_cache.pop(armature.data.name_full, None)
@@ -0,0 +1,69 @@
+import bpy
+import json
+import os
+from .lod_meshes import find_all_lod_meshes, get_lod_number
+
+def audit_lod_coherence(source, target, source_weight_data=None, worst_count=5):
+    """Compare a lower LOD's weights with LOD0's weights at the same surface points. Returns a report dict"""
+    from ..core.compare import weight_divergence
+    from ..core.weights import interpolate_weights
+    from .propagate_lod_weights import get_correspondence
+    from .vertex_weights import read_weight_matrix
+
+    corners, bary = get_correspondence(source, target)
+    source_names, source_weights = source_weight_data if source_weight_data is not None else read_weight_matrix(source)
+    target_names, target_weights = read_weight_matrix(target)
+
+    expected = interpolate_weights(source_weights, corners, bary)
+    report = weight_divergence(source_names, expected, target_names, target_weights, worst_count)
+    return {"source": source.name, "target": target.name, **report}
+
+def audit_lod_chain(lod_meshes):
+    """Audit every lower LOD against the lowest LOD number, reading LOD0's weights once"""
+    from .vertex_weights import read_weight_matrix
+
+    lod_meshes = sorted(lod_meshes, key=get_lod_number)
+    source = lod_meshes[0]
+    source_weight_data = read_weight_matrix(source)
+    return [audit_lod_coherence(source, target, source_weight_data) for target in lod_meshes[1:]]
+
+class AuditLodCoherenceOperator(bpy.types.Operator):
+    bl_idname = "object.audit_lod_coherence"
+    bl_label = "Audit LOD Coherence"
+    bl_description = "Compares the weights of every lower LOD with LOD0's weights at the same surface points and reports the bones and regions that drift apart"
+
+    filepath: bpy.props.StringProperty(
+        name="Report File",
+        description="Where to write the audit as JSON. Leave empty to only print it",
+        default="",
+        subtype='FILE_PATH'
+    )
+
+    def execute(self, context):
+        # Ensure a mesh object is selected
+        mesh = context.object
+        if not mesh or mesh.type != 'MESH':
+            self.report({'ERROR'}, "Please select a mesh object.")
+            return {'CANCELLED'}
+
+        lod_meshes = find_all_lod_meshes(mesh)
+        if len(lod_meshes) < 2:
+            self.report({'ERROR'}, "No other LOD meshes found.")
+            return {'CANCELLED'}
+
+        from ..core.compare import format_audit
+
+        reports = audit_lod_chain(lod_meshes)
+        for report in reports:
+            print(format_audit(report))
+
+        if self.filepath:
+            filepath = bpy.path.abspath(self.filepath)
+            os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+            with open(filepath, 'w') as f:
+                json.dump({"lods": reports}, f, indent=4)
+            print(f"Wrote LOD coherence audit to {filepath}")
+
+        worst = max(reports, key=lambda report: report["mean_divergence"])
+        self.report({'INFO'}, f"All done! Worst LOD: {worst['target']} (mean divergence {worst['mean_divergence']:.4f})")
+        return {'FINISHED'}
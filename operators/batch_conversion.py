@@ -0,0 +1,233 @@
+import bpy
+import fnmatch
+import json
+import os
+import sys
+import time
+from .deformation_qa import find_mesh_armature
+from .skeleton_conformance import conformance_failure
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+def load_batch_config():
+    """Load the datablock filters and checks for batch conversion from batch_conversion.json"""
+    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    json_path = os.path.join(addon_dir, "batch_conversion.json")
+
+    try:
+        with open(json_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Warning: batch_conversion.json not found at {json_path}")
+        return {}
+    except json.JSONDecodeError:
+        print(f"Error: Could not parse batch_conversion.json")
+        return {}
+
+def peak_memory_mb():
+    """Peak resident memory of this Blender process in MB, or None where the platform does not report it"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1048576 if sys.platform == "darwin" else peak / 1024
+
+def wanted_object_names(object_names, config):
+    """Object names that match an include pattern and no exclude pattern"""
+    include = config.get("include_objects", ["*"])
+    exclude = config.get("exclude_objects", [])
+    return [
+        name for name in object_names
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in include)
+        and not any(fnmatch.fnmatchcase(name, pattern) for pattern in exclude)
+    ]
+
+def append_conversion_sources(scene, source_path, config):
+    """Append the wanted objects of a .blend file into scene without opening the file.
+
+    Only the listed objects and the datablocks they depend on (mesh data, materials,
+    the deforming armature, parents) are read. Objects of other types are removed
+    again, and images too if the config asks for it. Returns the appended objects.
+    """
+    with bpy.data.libraries.load(source_path, link=False) as (data_from, data_to):
+        data_to.objects = wanted_object_names(data_from.objects, config)
+
+    # Armatures and parents come along as dependencies, but are not linked to the scene yet
+    appended = [obj for obj in data_to.objects if obj is not None]
+    for obj in list(appended):
+        for dependency in (find_mesh_armature(obj) if obj.type == 'MESH' else None, obj.parent):
+            if dependency and dependency not in appended:
+                appended.append(dependency)
+
+    keep_types = set(config.get("keep_object_types", ["MESH", "ARMATURE", "EMPTY"]))
+    for obj in list(appended):
+        if obj.type not in keep_types:
+            appended.remove(obj)
+            bpy.data.objects.remove(obj)
+    for obj in appended:
+        if obj.name not in scene.collection.objects:
+            scene.collection.objects.link(obj)
+
+    if config.get("remove_images", True):
+        for image in list(bpy.data.images):
+            bpy.data.images.remove(image)
+    bpy.data.orphans_purge(do_recursive=True)
+    return appended
+
+def convert_appended_objects(context, objects):
+    """Run In Place Conversion once per armature on the appended meshes it deforms.
+
+    Returns (armature, operator result, error) triples. bpy.ops raises RuntimeError
+    for every cancel path of the conversion, since they all report an error; that
+    armature then gets {'CANCELLED'} and the message, and the next one is converted.
+    """
+    parts = {}
+    for obj in objects:
+        armature = find_mesh_armature(obj) if obj.type == 'MESH' else None
+        if armature:
+            parts.setdefault(armature, []).append(obj)
+
+    results = []
+    for armature, meshes in parts.items():
+        for obj in context.scene.objects:
+            obj.select_set(False)
+        for mesh in meshes:
+            mesh.select_set(True)
+        armature.select_set(True)
+        context.view_layer.objects.active = meshes[0]
+        print(f"\n=== Batch converting {len(meshes)} mesh(es) on {armature.name} ===")
+        try:
+            results.append((armature, bpy.ops.object.in_place_conversion(), None))
+        except RuntimeError as e:
+            print(f"In Place Conversion was cancelled on {armature.name}: {e}")
+            results.append((armature, {'CANCELLED'}, str(e)))
+    return results
+
+def run_batch_checks(source_path, objects, config):
+    """Run the QA checks the batch config asks for on the converted meshes and record them on the meshes.
+
+    "check_bone_budgets" runs the skinning report against the LOD bone budgets,
+    "weight_snapshots" compares every mesh with its snapshot in that folder ("{source}"
+    is replaced with the source file's name) within "snapshot_tolerance". Returns
+    "mesh: summary" for every failed check.
+    """
+    from ..core.reduction import budget_for_lod
+    from .lod_bone_reduction import load_bone_budgets
+    from .lod_meshes import get_lod_number
+    from .skinning_report import record_skinning_report, skinning_failure, skinning_report
+    from .weight_snapshot import compare_with_snapshot, comparison_failure
+
+    meshes = [obj for obj in objects if obj.type == 'MESH' and find_mesh_armature(obj)]
+    failures = []
+    if config.get("check_bone_budgets", False):
+        budgets = load_bone_budgets()
+        for mesh in meshes:
+            record_skinning_report(mesh, skinning_report(mesh, budget_for_lod(budgets, get_lod_number(mesh))))
+            failure = skinning_failure(mesh)
+            if failure:
+                failures.append(f"{mesh.name}: over bone budget, {failure}")
+
+    if config.get("weight_snapshots"):
+        source_name = os.path.splitext(os.path.basename(source_path))[0]
+        directory = config["weight_snapshots"].replace("{source}", source_name)
+        for mesh in meshes:
+            if compare_with_snapshot(mesh, directory, config.get("snapshot_tolerance", 1e-4)) is None:
+                continue
+            failure = comparison_failure(mesh)
+            if failure:
+                failures.append(f"{mesh.name}: {failure}")
+    return failures
+
+def batch_output_path(source_path, output_dir):
+    """<output_dir>/<source name>.blend, with a _converted suffix if that is the source file itself"""
+    output_path = os.path.join(output_dir, os.path.basename(source_path))
+    if os.path.normcase(os.path.realpath(output_path)) == os.path.normcase(os.path.realpath(source_path)):
+        name, extension = os.path.splitext(output_path)
+        output_path = f"{name}_converted{extension}"
+    return output_path
+
+def batch_convert(source_paths, output_dir, settings=None, config=None):
+    """Convert MetaHuman .blend files one by one in a clean, empty worker file and save slim outputs.
+
+    Meant for background Blender. Every source starts from an empty file, only the
+    wanted objects are appended (batch_conversion.json, or config), the add-on settings
+    are applied from the settings dict, and the result is saved as
+    <output_dir>/<source name>.blend (<source name>_converted.blend if the output
+    folder is the source's own). A source is not saved if a conversion was cancelled
+    (result "cancelled": the armatures and their errors), its armature fails the skeleton check (result
+    "skeleton_failures"), a mesh fails a check of run_batch_checks (result "check_failures")
+    or it raised an error (result "error"); its output is then None and the batch goes
+    on with the next source. Returns one result dict per source.
+    """
+    config = config if config is not None else load_batch_config()
+    os.makedirs(output_dir, exist_ok=True)
+
+    results = []
+    for source_path in source_paths:
+        start = time.perf_counter()
+        result = {
+            "source": source_path,
+            "output": None,
+            "objects": 0,
+            "converted": 0,
+            "cancelled": [],
+            "skeleton_failures": [],
+            "check_failures": [],
+            "error": None,
+            "append_seconds": None,
+        }
+        try:
+            bpy.ops.wm.read_homefile(use_empty=True)
+            scene = bpy.context.scene
+            for key, value in (settings or {}).items():
+                setattr(scene.metahuman_to_manny_settings, key, value)
+
+            objects = append_conversion_sources(scene, source_path, config)
+            result["objects"] = len(objects)
+            result["append_seconds"] = time.perf_counter() - start
+            print(f"Appended {len(objects)} object(s) from {source_path} in {result['append_seconds']:.2f}s")
+
+            conversions = convert_appended_objects(bpy.context, objects)
+            for armature, conversion, error in conversions:
+                if 'FINISHED' in conversion:
+                    result["converted"] += 1
+                else:
+                    result["cancelled"].append(f"{armature.name}: {error}" if error else armature.name)
+                failure = conformance_failure(armature)
+                if failure:
+                    result["skeleton_failures"].append(f"{armature.name}: {failure}")
+
+            if not result["cancelled"]:
+                result["check_failures"] = run_batch_checks(source_path, objects, config)
+
+            # A cancelled conversion leaves the steps before the failing one applied, so it is not saved either
+            if not result["cancelled"] and not result["skeleton_failures"] and not result["check_failures"]:
+                output_path = batch_output_path(source_path, output_dir)
+                bpy.data.orphans_purge(do_recursive=True)
+                bpy.ops.wm.save_as_mainfile(filepath=output_path, check_existing=False)
+                result["output"] = output_path
+        except Exception as e:
+            result["error"] = str(e)
+
+        result["total_seconds"] = time.perf_counter() - start
+        result["peak_memory_mb"] = peak_memory_mb()
+        memory = f", peak memory {result['peak_memory_mb']:.0f} MB" if result["peak_memory_mb"] is not None else ""
+        if result["error"]:
+            print(f"Error: could not convert {source_path}: {result['error']}")
+        elif result["cancelled"]:
+            print(f"Not saving {source_path}, the conversion was cancelled on {', '.join(result['cancelled'])}")
+        elif result["skeleton_failures"]:
+            print(f"Not saving {source_path}, the skeleton check failed:")
+            for failure in result["skeleton_failures"]:
+                print(f"  {failure}")
+        elif result["check_failures"]:
+            print(f"Not saving {source_path}, the checks failed:")
+            for failure in result["check_failures"]:
+                print(f"  {failure}")
+        else:
+            print(f"Saved {result['output']} in {result['total_seconds']:.2f}s{memory}")
+        results.append(result)
+    return results
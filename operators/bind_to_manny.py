@@ -1,47 +1,10 @@
 import bpy
-import re
-
-def find_all_lod_meshes(base_mesh):
-    """Find all LOD meshes related to the selected mesh (LOD0, LOD1, LOD2, etc.)"""
-    all_meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-    lod_pattern = re.compile(r'_LOD\d+$')
-    
-    # Check if the base mesh itself has LOD suffix
-    base_name = base_mesh.name
-    match = lod_pattern.search(base_name)
-    
-    if match:
-        # Remove the LOD suffix to get the base name (e.g., "FaceMesh_LOD0" -> "FaceMesh")
-        prefix = base_name[:match.start()]
-    else:
-        # If no LOD suffix, use the full name as prefix
-        prefix = base_name
-    
-    print(f"Looking for LOD meshes with prefix: '{prefix}'")
-    
-    # Find all meshes that match: prefix + "_LOD" + digit(s)
-    lod_meshes = []
-    for obj in all_meshes:
-        match = lod_pattern.search(obj.name)
-        if match:
-            # Get the prefix of this object
-            obj_prefix = obj.name[:match.start()]
-            # Only include if the prefix matches exactly
-            if obj_prefix == prefix:
-                lod_meshes.append(obj)
-                print(f"  Found matching LOD: {obj.name}")
-    
-    # If we found LOD meshes, return them sorted; otherwise just return the base mesh
-    if lod_meshes:
-        lod_meshes.sort(key=lambda x: x.name)  # Sort for consistent ordering
-        return lod_meshes
-    else:
-        return [base_mesh]
+from .lod_meshes import find_all_lod_meshes
 
 class BindToMannyOperator(bpy.types.Operator):
     bl_idname = "object.bind_to_manny"
     bl_label = "Bind to Manny"
-    bl_description = "Binds selected mesh (and its LODs) to Manny skeleton with empty groups and scales to 0.01"
+    bl_description = "Binds selected mesh (and its LODs) to Manny skeleton and scales to 0.01"
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
@@ -80,14 +43,11 @@ class BindToMannyOperator(bpy.types.Operator):
         for idx, target_mesh in enumerate(meshes_to_process):
             print(f"\n=== Processing {target_mesh.name} ({idx + 1}/{total}) ===")
             
-            # Clear selection and select only the current mesh
-            bpy.ops.object.select_all(action='DESELECT')
-            target_mesh.select_set(True)
-            context.view_layer.objects.active = target_mesh
-            
             # Clear any existing parent with keep transform
             if target_mesh.parent:
-                bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
+                old_matrix = target_mesh.matrix_world.copy()
+                target_mesh.parent = None
+                target_mesh.matrix_world = old_matrix
                 print(f"Cleared parent from {target_mesh.name} (kept transform)")
             
             # Remove existing armature modifiers
@@ -95,14 +55,15 @@ class BindToMannyOperator(bpy.types.Operator):
                 if mod.type == 'ARMATURE':
                     target_mesh.modifiers.remove(mod)
             
-            # Select armature as well for parenting operation
-            armature.select_set(True)
-            context.view_layer.objects.active = armature
-            
-            # Set armature as parent with empty groups (using operator)
-            bpy.ops.object.parent_set(type='ARMATURE_NAME')
+            # Parent to the armature and deform with it, like parent_set(type='ARMATURE'),
+            # without creating an empty vertex group for every bone
+            target_mesh.parent = armature
+            target_mesh.parent_type = 'OBJECT'
+            target_mesh.matrix_parent_inverse = armature.matrix_world.inverted()
+            armature_mod = target_mesh.modifiers.new(name="Armature", type='ARMATURE')
+            armature_mod.object = armature
             
-            print(f"Bound {target_mesh.name} to {armature.name} with empty groups")
+            print(f"Bound {target_mesh.name} to {armature.name}")
             
             # Scale mesh to 0.01 (100 times smaller for Unreal to Blender conversion)
             target_mesh.scale = (0.01, 0.01, 0.01)
@@ -111,12 +72,3 @@ class BindToMannyOperator(bpy.types.Operator):
         
         self.report({'INFO'}, f"All done! Bound and scaled {total} mesh(es) to {armature.name}")
         return {'FINISHED'}
-
-def register():
-    bpy.utils.register_class(BindToMannyOperator)
-
-def unregister():
-    bpy.utils.unregister_class(BindToMannyOperator)
-
-if __name__ == "__main__":
-    register()
@@ -0,0 +1,81 @@
+import bpy
+from ..core.reduction import budget_for_lod
+from .lod_bone_reduction import load_bone_budgets
+from .lod_meshes import find_all_lod_meshes, get_lod_number
+
+def apply_bone_budget(mesh, armature, budget):
+    """Collapse bones on the mesh until it fits the budget. Returns the influencing bone count afterwards"""
+    from ..core.bone_budget import solve_bone_budget
+    from .armature_hierarchy import get_armature_hierarchy
+    import numpy as np
+    from .vertex_weights import fold_vertex_groups, iter_weight_chunks
+
+    hierarchy = get_armature_hierarchy(armature)
+    group_names = [vg.name for vg in mesh.vertex_groups]
+    # Whole-mesh weight per group, summed chunk by chunk so no dense matrix of the mesh is held
+    contributions = np.zeros(len(group_names), dtype=np.float64)
+    for _rows, weights in iter_weight_chunks(mesh):
+        contributions += weights.sum(axis=0, dtype=np.float64)
+
+    group_map = solve_bone_budget(hierarchy, group_names, contributions, budget)
+    fold_vertex_groups(mesh, group_map)
+
+    # The solver worked on the same contributions, so the remaining count follows from the map
+    influencing = {
+        group_map.get(name, name)
+        for name, contribution in zip(group_names, contributions.tolist())
+        if contribution > 1e-6 and hierarchy.has_bone(name)
+    }
+    print(f"{mesh.name}: collapsed {len(group_map)} bone(s), {len(influencing)} influencing bones (budget {budget})")
+    return len(influencing)
+
+class ApplyBoneBudgetOperator(bpy.types.Operator):
+    bl_idname = "object.apply_bone_budget"
+    bl_label = "Apply Bone Budget"
+    bl_description = "Collapses the least significant leaf bones into their parents until every LOD fits its bone budget from lod_bone_reduction.json"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+        selected_objects = context.selected_objects
+        mesh = None
+        armature = None
+
+        for obj in selected_objects:
+            if obj.type == 'MESH':
+                mesh = obj
+            elif obj.type == 'ARMATURE':
+                armature = obj
+
+        if not mesh or not armature:
+            self.report({'ERROR'}, "Please select both a mesh and an armature.")
+            return {'CANCELLED'}
+
+        # Bones may have been edited by hand since the hierarchy was cached
+        from .armature_hierarchy import invalidate_armature_hierarchy
+        invalidate_armature_hierarchy(armature)
+
+        budgets = load_bone_budgets()
+        if not budgets:
+            self.report({'ERROR'}, "No bone budgets found.")
+            return {'CANCELLED'}
+
+        # Find all LOD meshes if enabled
+        meshes_to_process = []
+        if settings.bAutoLookForLOD:
+            meshes_to_process = find_all_lod_meshes(mesh)
+            if len(meshes_to_process) > 1:
+                self.report({'INFO'}, f"Found {len(meshes_to_process)} LOD meshes to process")
+        else:
+            meshes_to_process = [mesh]
+
+        # Process each mesh
+        total = len(meshes_to_process)
+        for idx, target_mesh in enumerate(sorted(meshes_to_process, key=get_lod_number)):
+            print(f"\n=== Processing {target_mesh.name} ({idx + 1}/{total}) ===")
+            budget = budget_for_lod(budgets, get_lod_number(target_mesh))
+            bone_count = apply_bone_budget(target_mesh, armature, budget)
+            self.report({'INFO'}, f"{target_mesh.name}: {bone_count}/{budget} bones")
+
+        self.report({'INFO'}, f"All done! Processed {total} mesh(es) total")
+        return {'FINISHED'}
@@ -37,12 +37,3 @@ class CleanupAllVertexGroupsOperator(bpy.types.Operator):
         
         self.report({'INFO'}, "All vertex group cleanups completed!")
         return {'FINISHED'}
-
-def register():
-    bpy.utils.register_class(CleanupAllVertexGroupsOperator)
-
-def unregister():
-    bpy.utils.unregister_class(CleanupAllVertexGroupsOperator)
-
-if __name__ == "__main__":
-    register()
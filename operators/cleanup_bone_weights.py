@@ -1,42 +1,5 @@
 import bpy
-import re
-
-def find_all_lod_meshes(base_mesh):
-    """Find all LOD meshes related to the selected mesh (LOD0, LOD1, LOD2, etc.)"""
-    all_meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-    lod_pattern = re.compile(r'_LOD\d+$')
-    
-    # Check if the base mesh itself has LOD suffix
-    base_name = base_mesh.name
-    match = lod_pattern.search(base_name)
-    
-    if match:
-        # Remove the LOD suffix to get the base name (e.g., "FaceMesh_LOD0" -> "FaceMesh")
-        prefix = base_name[:match.start()]
-    else:
-        # If no LOD suffix, use the full name as prefix
-        prefix = base_name
-    
-    print(f"Looking for LOD meshes with prefix: '{prefix}'")
-    
-    # Find all meshes that match: prefix + "_LOD" + digit(s)
-    lod_meshes = []
-    for obj in all_meshes:
-        match = lod_pattern.search(obj.name)
-        if match:
-            # Get the prefix of this object
-            obj_prefix = obj.name[:match.start()]
-            # Only include if the prefix matches exactly
-            if obj_prefix == prefix:
-                lod_meshes.append(obj)
-                print(f"  Found matching LOD: {obj.name}")
-    
-    # If we found LOD meshes, return them sorted; otherwise just return the base mesh
-    if lod_meshes:
-        lod_meshes.sort(key=lambda x: x.name)  # Sort for consistent ordering
-        return lod_meshes
-    else:
-        return [base_mesh]
+from .lod_meshes import find_all_lod_meshes
 
 class CleanUpBoneWeightsOperator(bpy.types.Operator):
     bl_idname = "object.cleanup_bone_weights"
@@ -59,6 +22,10 @@ class CleanUpBoneWeightsOperator(bpy.types.Operator):
         if not mesh or not armature:
             self.report({'ERROR'}, "Please select both a mesh and an armature.")
             return {'CANCELLED'}
+
+        # Bones may have been edited by hand since the hierarchy was cached
+        from .armature_hierarchy import invalidate_armature_hierarchy
+        invalidate_armature_hierarchy(armature)
         
         # Find all LOD meshes if enabled
         meshes_to_process = []
@@ -74,7 +41,7 @@ class CleanUpBoneWeightsOperator(bpy.types.Operator):
         for idx, target_mesh in enumerate(meshes_to_process):
             context.window_manager.progress_update(idx)
             print(f"\n=== Processing {target_mesh.name} ({idx + 1}/{total}) ===")
-            cleanup_vertex_groups(target_mesh, armature)
+            cleanup_vertex_groups(target_mesh, armature, settings.bMirrorWeights)
             self.report({'INFO'}, f"Completed {target_mesh.name} ({idx + 1}/{total})")
         
         context.window_manager.progress_end()
@@ -85,75 +52,44 @@ class CleanUpBoneWeightsOperator(bpy.types.Operator):
         context.window_manager.progress_begin(0, 100)
         return self.execute(context)
 
-def merge_vertex_group_weights(obj, src_group_name, target_group_name):
-    if target_group_name not in obj.vertex_groups:
-        print(f"Creating target vertex group: {target_group_name}")
-        obj.vertex_groups.new(name=target_group_name)
-    
-    if src_group_name not in obj.vertex_groups:
-        print(f"Skipping merge: Source vertex group '{src_group_name}' not found.")
-        return
+COLLAPSE_TARGETS = ('head', 'neck_02', 'neck_01')
 
-    src_group = obj.vertex_groups[src_group_name]
-    target_group = obj.vertex_groups[target_group_name]
-    
-    for v in obj.data.vertices:
-        try:
-            src_weight = src_group.weight(v.index)
-        except RuntimeError:
-            src_weight = 0
-        
-        try:
-            target_weight = target_group.weight(v.index)
-        except RuntimeError:
-            target_weight = 0
-        
-        merged_weight = src_weight + target_weight
-        target_group.add([v.index], merged_weight, 'REPLACE')
-    
-    print(f"Deleting vertex group: {src_group_name}")
-    obj.vertex_groups.remove(src_group)
+def get_collapse_map(armature, targets=COLLAPSE_TARGETS):
+    """Map every bone below head, neck_02 and neck_01 to the one of them its weights are merged into"""
+    from .armature_hierarchy import get_armature_hierarchy
+    from .remap_tables import find_stored_remap
 
-def process_bones_recursive(obj, armature, parent_bone_name, target_group_name, excluded_groups):
-    bone = armature.pose.bones.get(parent_bone_name)
-    if not bone:
-        print(f"Bone '{parent_bone_name}' not found in armature.")
-        return
+    # Rigs matching a table in metahuman_remap_tables.json use it, other rigs walk their hierarchy
+    collapse_map = find_stored_remap(armature, "face_collapse", targets)
+    if collapse_map is not None:
+        return collapse_map
 
-    for child_bone in bone.children:
-        child_bone_name = child_bone.name
-        
-        if child_bone_name in excluded_groups or child_bone_name == target_group_name:
-            continue
-        
-        if child_bone_name in obj.vertex_groups:
-            merge_vertex_group_weights(obj, child_bone_name, target_group_name)
-        
-        process_bones_recursive(obj, armature, child_bone_name, target_group_name, excluded_groups)
+    hierarchy = get_armature_hierarchy(armature)
+    for target_group in targets:
+        if not hierarchy.has_bone(target_group):
+            print(f"Bone '{target_group}' not found in armature.")
+    return hierarchy.nearest_ancestor_map(targets)
+
+def collect_collapse_bones(armature):
+    """Collect the names of all bones whose weights cleanup_vertex_groups folds into head, neck_02 and neck_01"""
+    return set(get_collapse_map(armature))
 
-def cleanup_vertex_groups(obj, armature):
+def cleanup_vertex_groups(obj, armature, symmetric=False):
     if obj.type != 'MESH' or armature.type != 'ARMATURE':
         print("Error: Please select a mesh and an armature.")
         return
 
-    excluded_groups = ['head', 'neck_02', 'neck_01']
-    
-    for target_group in excluded_groups:
+    for target_group in COLLAPSE_TARGETS:
         if target_group not in obj.vertex_groups:
             print(f"Creating missing vertex group: {target_group}")
             obj.vertex_groups.new(name=target_group)
     
-    process_bones_recursive(obj, armature, 'head', 'head', excluded_groups)
-    process_bones_recursive(obj, armature, 'neck_02', 'neck_02', excluded_groups)
-    process_bones_recursive(obj, armature, 'neck_01', 'neck_01', excluded_groups)
-
-    print("\nWeight paint cleanup completed!")
+    from .symmetry import get_mesh_symmetry
+    from .vertex_weights import fold_vertex_groups
 
-def register():
-    bpy.utils.register_class(CleanUpBoneWeightsOperator)
+    collapse_map = get_collapse_map(armature)
+    symmetry = get_mesh_symmetry(obj) if symmetric else None
+    folded_count = fold_vertex_groups(obj, collapse_map, symmetry=symmetry)
+    print(f"Merged and deleted {folded_count} vertex groups.")
 
-def unregister():
-    bpy.utils.unregister_class(CleanUpBoneWeightsOperator)
-
-if __name__ == "__main__":
-    register()
+    print("\nWeight paint cleanup completed!")
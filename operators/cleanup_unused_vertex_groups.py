@@ -1,47 +1,10 @@
 import bpy
-import re
-
-def find_all_lod_meshes(base_mesh):
-    """Find all LOD meshes related to the selected mesh (LOD0, LOD1, LOD2, etc.)"""
-    all_meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-    lod_pattern = re.compile(r'_LOD\d+$')
-    
-    # Check if the base mesh itself has LOD suffix
-    base_name = base_mesh.name
-    match = lod_pattern.search(base_name)
-    
-    if match:
-        # Remove the LOD suffix to get the base name (e.g., "FaceMesh_LOD0" -> "FaceMesh")
-        prefix = base_name[:match.start()]
-    else:
-        # If no LOD suffix, use the full name as prefix
-        prefix = base_name
-    
-    print(f"Looking for LOD meshes with prefix: '{prefix}'")
-    
-    # Find all meshes that match: prefix + "_LOD" + digit(s)
-    lod_meshes = []
-    for obj in all_meshes:
-        match = lod_pattern.search(obj.name)
-        if match:
-            # Get the prefix of this object
-            obj_prefix = obj.name[:match.start()]
-            # Only include if the prefix matches exactly
-            if obj_prefix == prefix:
-                lod_meshes.append(obj)
-                print(f"  Found matching LOD: {obj.name}")
-    
-    # If we found LOD meshes, return them sorted; otherwise just return the base mesh
-    if lod_meshes:
-        lod_meshes.sort(key=lambda x: x.name)  # Sort for consistent ordering
-        return lod_meshes
-    else:
-        return [base_mesh]
+from .lod_meshes import find_all_lod_meshes
 
 class CleanUpUnusedVertexGroupsOperator(bpy.types.Operator):
     bl_idname = "object.cleanup_unused_vertex_groups"
     bl_label = "Clean Up Unused Vertex Groups"
-    bl_description = "Deletes vertex groups in the mesh that do not have a corresponding bone in the armature"
+    bl_description = "Deletes vertex groups in the mesh that do not have a corresponding bone in the armature or carry no weight, and sorts the rest in bone order"
 
     def execute(self, context):
         settings = context.scene.metahuman_to_manny_settings
@@ -63,6 +26,10 @@ class CleanUpUnusedVertexGroupsOperator(bpy.types.Operator):
         if not armature or not mesh:
             self.report({'ERROR'}, "Please select both an armature and a mesh.")
             return {'CANCELLED'}
+
+        # Bones may have been edited by hand since the hierarchy was cached
+        from .armature_hierarchy import invalidate_armature_hierarchy
+        invalidate_armature_hierarchy(armature)
         
         # Find all LOD meshes if enabled
         meshes_to_process = []
@@ -73,21 +40,26 @@ class CleanUpUnusedVertexGroupsOperator(bpy.types.Operator):
         else:
             meshes_to_process = [mesh]
         
+        from .armature_hierarchy import get_armature_hierarchy
+
         # Get the list of bones in the armature (once, used for all LODs)
-        bones_in_armature = {bone.name for bone in armature.pose.bones}
+        hierarchy = get_armature_hierarchy(armature)
+        bone_order = armature.data.bones.keys()
         
         # Process each mesh
         total = len(meshes_to_process)
         for idx, target_mesh in enumerate(meshes_to_process):
             print(f"\n=== Processing {target_mesh.name} ({idx + 1}/{total}) ===")
-            self.cleanup_unused_groups(target_mesh, bones_in_armature)
+            self.cleanup_unused_groups(target_mesh, hierarchy, bone_order)
             self.report({'INFO'}, f"Completed {target_mesh.name} ({idx + 1}/{total})")
         
         self.report({'INFO'}, f"All done! Processed {total} mesh(es) total")
         return {'FINISHED'}
     
-    def cleanup_unused_groups(self, mesh, bones_in_armature):
+    def cleanup_unused_groups(self, mesh, hierarchy, bone_order):
         """Clean up unused vertex groups for a single mesh"""
+        bones_in_armature = hierarchy.name_set
+
         # Go through each vertex group in the mesh and collect the ones to delete
         vertex_groups_to_delete = []
         for vg in mesh.vertex_groups:
@@ -103,11 +75,8 @@ class CleanUpUnusedVertexGroupsOperator(bpy.types.Operator):
         
         print(f"Unused vertex groups deleted: {len(vertex_groups_to_delete)}")
 
-def register():
-    bpy.utils.register_class(CleanUpUnusedVertexGroupsOperator)
-
-def unregister():
-    bpy.utils.unregister_class(CleanUpUnusedVertexGroupsOperator)
+        from .vertex_weights import compact_vertex_groups
 
-if __name__ == "__main__":
-    register()
+        # Drop groups that match a bone but carry no weight, and put the rest in the armature's bone order for a deterministic export
+        empty_count = compact_vertex_groups(mesh, bone_order)
+        print(f"Empty vertex groups deleted: {empty_count}")
@@ -0,0 +1,107 @@
+import hashlib
+
+# Custom property names stored on meshes and armatures touched by In Place Conversion
+STEPS_PROPERTY = "mh2m_conversion_steps"
+FINGERPRINT_PROPERTY = "mh2m_fingerprint"
+CHUNK_HASHES_PROPERTY = "mh2m_chunk_hashes"
+
+def mesh_fingerprint(obj, checkpoint=None):
+    """Hash the data the conversion steps read from a mesh: topology size, vertex group names and per-group weight sums.
+
+    checkpoint can pass in a weight checkpoint of the unchanged mesh to skip reading the weights again.
+    """
+    import numpy as np
+    from .weight_checkpoint import capture_weight_checkpoint
+
+    if checkpoint is None:
+        checkpoint = capture_weight_checkpoint(obj)
+    group_names = checkpoint["groups"]
+    group_sums = np.bincount(
+        checkpoint["group_ids"], weights=checkpoint["weights"].astype(np.float64), minlength=len(group_names)
+    ).tolist()
+    return weight_fingerprint(obj, group_names, group_sums)
+
+def weight_fingerprint(obj, group_names, group_sums):
+    """The mesh fingerprint from already known per-group weight sums"""
+    hasher = hashlib.sha1()
+    hasher.update(f"{len(obj.data.vertices)}|{len(obj.data.edges)}|{len(obj.data.polygons)}".encode())
+    for name, total in zip(group_names, group_sums):
+        # Round so float noise from unrelated edits does not invalidate the markers
+        hasher.update(f"|{name}:{total:.4f}".encode())
+    return hasher.hexdigest()
+
+def armature_fingerprint(armature):
+    """Hash the bone names and parent links of an armature"""
+    hasher = hashlib.sha1()
+    for bone in armature.data.bones:
+        parent_name = bone.parent.name if bone.parent else ""
+        hasher.update(f"|{bone.name}>{parent_name}".encode())
+    return hasher.hexdigest()
+
+def object_fingerprint(obj, checkpoint=None):
+    """Fingerprint a mesh or an armature"""
+    if obj.type == 'ARMATURE':
+        return armature_fingerprint(obj)
+    return mesh_fingerprint(obj, checkpoint)
+
+def clear_step_markers(obj):
+    """Remove all conversion markers from the object"""
+    for prop in (STEPS_PROPERTY, FINGERPRINT_PROPERTY, CHUNK_HASHES_PROPERTY):
+        if prop in obj:
+            del obj[prop]
+
+def clear_step_marker(obj, step_name):
+    """Forget that one step finished, so the next run does it again"""
+    steps = obj.get(STEPS_PROPERTY)
+    if steps and step_name in steps:
+        del steps[step_name]
+
+def save_step_markers(obj):
+    """Copy of the object's markers, to put back with restore_step_markers after a rollback"""
+    steps = obj.get(STEPS_PROPERTY)
+    return (steps.to_dict() if steps else None, obj.get(FINGERPRINT_PROPERTY))
+
+def restore_step_markers(obj, markers):
+    clear_step_markers(obj)
+    steps, fingerprint = markers
+    if steps:
+        obj[STEPS_PROPERTY] = steps
+    if fingerprint:
+        obj[FINGERPRINT_PROPERTY] = fingerprint
+
+def validate_step_markers(obj):
+    """Drop the markers if the object changed since the conversion last wrote to it.
+
+    Returns the number of steps that are still recorded as finished.
+    """
+    steps = obj.get(STEPS_PROPERTY)
+    if not steps:
+        return 0
+
+    if obj.get(FINGERPRINT_PROPERTY) != object_fingerprint(obj):
+        print(f"{obj.name} changed since the last conversion run, clearing step markers")
+        clear_step_markers(obj)
+        return 0
+
+    return len(steps)
+
+def is_step_done(obj, step_name, depends_on=None):
+    """Check whether the step already finished on this object (call validate_step_markers first).
+
+    depends_on is the current fingerprint of another object the step reads; the step
+    then only counts as done if it was recorded with that same fingerprint.
+    """
+    steps = obj.get(STEPS_PROPERTY)
+    if not steps or step_name not in steps:
+        return False
+    return depends_on is None or steps[step_name] == depends_on
+
+def mark_step_done(obj, step_name, depends_on=None, fingerprint=None):
+    """Record the step as finished, with the fingerprint of the object it read if any, and the object's resulting fingerprint.
+
+    fingerprint can pass in the object's fingerprint if the caller already computed it, to skip reading the object again.
+    """
+    if STEPS_PROPERTY not in obj:
+        obj[STEPS_PROPERTY] = {}
+    obj[STEPS_PROPERTY][step_name] = depends_on if depends_on is not None else True
+    obj[FINGERPRINT_PROPERTY] = fingerprint or object_fingerprint(obj)
@@ -0,0 +1,286 @@
+import bpy
+import json
+import math
+import os
+import time
+from .lod_meshes import find_all_lod_meshes
+
+def load_deformation_poses():
+    """Load the test poses and regions from deformation_poses.json"""
+    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    json_path = os.path.join(addon_dir, "deformation_poses.json")
+
+    try:
+        with open(json_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Warning: deformation_poses.json not found at {json_path}")
+        return {}
+    except json.JSONDecodeError:
+        print(f"Error: Could not parse deformation_poses.json")
+        return {}
+
+def find_mesh_armature(mesh):
+    """The armature deforming a mesh: its first armature modifier's object, or an armature parent"""
+    for mod in mesh.modifiers:
+        if mod.type == 'ARMATURE' and mod.object:
+            return mod.object
+    if mesh.parent and mesh.parent.type == 'ARMATURE':
+        return mesh.parent
+    return None
+
+def read_evaluated_positions(mesh, depsgraph):
+    """Deformed vertex positions of a mesh in its local space, as a (vertices x 3) float32 array"""
+    import numpy as np
+
+    mesh_eval = mesh.evaluated_get(depsgraph)
+    data = mesh_eval.to_mesh()
+    positions = np.empty(len(data.vertices) * 3, dtype=np.float32)
+    data.vertices.foreach_get("co", positions)
+    mesh_eval.to_mesh_clear()
+    return positions.reshape(-1, 3)
+
+def apply_test_pose(armatures, rotations):
+    """Put every armature in its rest pose, then rotate the listed bones (XYZ Euler degrees in bone space).
+
+    Bones missing on an armature are skipped. Returns how many bones were rotated.
+    """
+    from mathutils import Euler, Matrix
+
+    rotated = 0
+    for armature in armatures:
+        for pose_bone in armature.pose.bones:
+            pose_bone.matrix_basis = Matrix.Identity(4)
+        for bone_name, angles in rotations.items():
+            pose_bone = armature.pose.bones.get(bone_name)
+            if pose_bone is None:
+                continue
+            pose_bone.matrix_basis = Euler([math.radians(angle) for angle in angles], 'XYZ').to_matrix().to_4x4()
+            rotated += 1
+    return rotated
+
+def mesh_vertex_regions(mesh, region_patterns):
+    """vertex_regions of a mesh, read chunk by chunk so no dense weight matrix of the whole mesh is held"""
+    import numpy as np
+    from ..core.deformation import OTHER_REGION, vertex_regions
+    from .vertex_weights import iter_weight_chunks
+
+    group_names = [vg.name for vg in mesh.vertex_groups]
+    region_names = list(region_patterns) + [OTHER_REGION]
+    vertex_region = np.empty(len(mesh.data.vertices), dtype=np.int32)
+    for rows, weights in iter_weight_chunks(mesh):
+        region_names, vertex_region[rows] = vertex_regions(group_names, weights, region_patterns)
+    return region_names, vertex_region
+
+def capture_pose_deformation(context, meshes, config):
+    """Pose the armatures of the meshes through every test pose and read the deformed vertex positions.
+
+    All meshes are evaluated after one depsgraph update per pose. The armatures'
+    poses are restored afterwards. Returns {mesh name: capture} with captures of the
+    form {"mesh", "poses", "rest", "positions", "region_names", "vertex_region"},
+    where rest holds the undeformed vertex positions.
+    """
+    import numpy as np
+
+    poses = config.get("poses", [])
+    region_patterns = config.get("regions", {})
+    meshes = [mesh for mesh in meshes if find_mesh_armature(mesh)]
+    armatures = list({find_mesh_armature(mesh).name: find_mesh_armature(mesh) for mesh in meshes}.values())
+
+    captures = {}
+    for mesh in meshes:
+        region_names, vertex_region = mesh_vertex_regions(mesh, region_patterns)
+        rest = np.empty(len(mesh.data.vertices) * 3, dtype=np.float32)
+        mesh.data.vertices.foreach_get("co", rest)
+        captures[mesh.name] = {
+            "mesh": mesh.name,
+            "poses": [pose["name"] for pose in poses],
+            "rest": rest.reshape(-1, 3),
+            "positions": np.empty((len(poses), len(mesh.data.vertices), 3), dtype=np.float32),
+            "region_names": region_names,
+            "vertex_region": vertex_region,
+        }
+
+    # Remember the current pose so the QA run leaves the scene as it was
+    saved_state = [
+        (armature, armature.data.pose_position, {pose_bone.name: pose_bone.matrix_basis.copy() for pose_bone in armature.pose.bones})
+        for armature in armatures
+    ]
+    start = time.perf_counter()
+    try:
+        for armature in armatures:
+            armature.data.pose_position = 'POSE'
+        for pose_index, pose in enumerate(poses):
+            rotated = apply_test_pose(armatures, pose.get("rotations", {}))
+            context.view_layer.update()
+            depsgraph = context.evaluated_depsgraph_get()
+            for mesh in meshes:
+                captures[mesh.name]["positions"][pose_index] = read_evaluated_positions(mesh, depsgraph)
+            print(f"Pose '{pose['name']}': rotated {rotated} bone(s)")
+    finally:
+        for armature, pose_position, matrices in saved_state:
+            for pose_bone in armature.pose.bones:
+                pose_bone.matrix_basis = matrices[pose_bone.name]
+            armature.data.pose_position = pose_position
+        context.view_layer.update()
+
+    print(f"Captured {len(poses)} pose(s) on {len(meshes)} mesh(es) in {time.perf_counter() - start:.2f}s")
+    return captures
+
+def match_rest_vertices(reference_rest, candidate_rest):
+    """Index of the reference vertex closest to every candidate vertex, for meshes whose vertices were merged"""
+    import numpy as np
+    from mathutils.kdtree import KDTree
+
+    kd = KDTree(len(reference_rest))
+    for i, co in enumerate(reference_rest.tolist()):
+        kd.insert(co, i)
+    kd.balance()
+    return np.array([kd.find(co)[1] for co in candidate_rest.tolist()], dtype=np.int64)
+
+def compare_with_reference(reference, capture, tolerance=0.5):
+    """compare_deformation, matching vertices by rest position if the vertex counts differ (e.g. after Fix Seams)"""
+    from ..core.deformation import compare_deformation
+
+    vertex_map = None
+    if len(reference["rest"]) != len(capture["rest"]):
+        vertex_map = match_rest_vertices(reference["rest"], capture["rest"])
+    return compare_deformation(reference, capture, tolerance, vertex_map)
+
+def deformation_reference_path(directory, mesh_name):
+    return os.path.join(directory, f"{bpy.path.clean_name(mesh_name)}.npz")
+
+def save_deformation_reference(capture, filepath):
+    import numpy as np
+
+    np.savez_compressed(
+        filepath,
+        mesh=np.array(capture["mesh"]),
+        poses=np.array(capture["poses"], dtype=str),
+        rest=capture["rest"],
+        positions=capture["positions"],
+        region_names=np.array(capture["region_names"], dtype=str),
+        vertex_region=capture["vertex_region"],
+    )
+
+def load_deformation_reference(filepath):
+    import numpy as np
+
+    with np.load(filepath) as data:
+        return {
+            "mesh": str(data["mesh"]),
+            "poses": data["poses"].tolist(),
+            "rest": data["rest"],
+            "positions": data["positions"],
+            "region_names": data["region_names"].tolist(),
+            "vertex_region": data["vertex_region"],
+        }
+
+class SaveDeformationReferenceOperator(bpy.types.Operator):
+    bl_idname = "object.save_deformation_reference"
+    bl_label = "Save Deformation Reference"
+    bl_description = "Poses the original rig through the test poses (deformation_poses.json) and saves the deformed vertex positions of the selected mesh and its LODs"
+
+    directory: bpy.props.StringProperty(
+        name="Reference Folder",
+        default="//deformation_references/",
+        subtype='DIR_PATH'
+    )
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure a mesh object is selected
+        mesh = context.object
+        if not mesh or mesh.type != 'MESH':
+            self.report({'ERROR'}, "Please select a mesh object.")
+            return {'CANCELLED'}
+        if not find_mesh_armature(mesh):
+            self.report({'ERROR'}, f"{mesh.name} is not deformed by an armature.")
+            return {'CANCELLED'}
+
+        config = load_deformation_poses()
+        meshes_to_process = find_all_lod_meshes(mesh) if settings.bAutoLookForLOD else [mesh]
+        captures = capture_pose_deformation(context, meshes_to_process, config)
+
+        directory = bpy.path.abspath(self.directory)
+        os.makedirs(directory, exist_ok=True)
+        for mesh_name, capture in captures.items():
+            filepath = deformation_reference_path(directory, mesh_name)
+            save_deformation_reference(capture, filepath)
+            print(f"Saved deformation reference of {mesh_name} to {filepath}")
+
+        self.report({'INFO'}, f"All done! Saved {len(captures)} reference(s) to {directory}")
+        return {'FINISHED'}
+
+class DeformationQAOperator(bpy.types.Operator):
+    bl_idname = "object.deformation_qa"
+    bl_label = "Deformation QA"
+    bl_description = "Poses the rig through the test poses and reports how far the vertices of every region move away from the saved reference, or from a second selected mesh on the original rig"
+
+    directory: bpy.props.StringProperty(
+        name="Reference Folder",
+        default="//deformation_references/",
+        subtype='DIR_PATH'
+    )
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Largest allowed vertex displacement, in mesh units",
+        default=0.5,
+        min=0.0
+    )
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure a mesh object is selected
+        mesh = context.object
+        if not mesh or mesh.type != 'MESH':
+            self.report({'ERROR'}, "Please select a mesh object.")
+            return {'CANCELLED'}
+        if not find_mesh_armature(mesh):
+            self.report({'ERROR'}, f"{mesh.name} is not deformed by an armature.")
+            return {'CANCELLED'}
+
+        from ..core.deformation import format_deformation_report
+
+        config = load_deformation_poses()
+
+        # Two selected meshes: compare them directly (the other one, on the original rig, is the reference)
+        other_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH' and obj != mesh and find_mesh_armature(obj)]
+        reports = []
+        if other_meshes:
+            captures = capture_pose_deformation(context, [other_meshes[0], mesh], config)
+            reports.append(compare_with_reference(captures[other_meshes[0].name], captures[mesh.name], self.tolerance))
+        else:
+            directory = bpy.path.abspath(self.directory)
+            meshes_to_process = find_all_lod_meshes(mesh) if settings.bAutoLookForLOD else [mesh]
+            references = {}
+            for target_mesh in meshes_to_process:
+                filepath = deformation_reference_path(directory, target_mesh.name)
+                if not os.path.exists(filepath):
+                    print(f"No deformation reference for {target_mesh.name} at {filepath}")
+                    continue
+                references[target_mesh.name] = load_deformation_reference(filepath)
+
+            # Only run the poses the references were captured with
+            poses = {pose["name"]: pose for pose in config.get("poses", [])}
+            pose_names = {name for reference in references.values() for name in reference["poses"]}
+            config = {**config, "poses": [poses[name] for name in poses if name in pose_names]}
+            captures = capture_pose_deformation(context, [obj for obj in meshes_to_process if obj.name in references], config)
+            for mesh_name, reference in references.items():
+                reports.append(compare_with_reference(reference, captures[mesh_name], self.tolerance))
+
+        if not reports:
+            self.report({'ERROR'}, "Nothing to compare.")
+            return {'CANCELLED'}
+
+        for report in reports:
+            print(format_deformation_report(report))
+
+        failed = [report["candidate"] for report in reports if not report["passed"]]
+        if failed:
+            self.report({'WARNING'}, f"Deformation changed on: {', '.join(failed)}")
+        else:
+            self.report({'INFO'}, f"All done! {len(reports)} mesh(es) deform within {self.tolerance}")
+        return {'FINISHED'}
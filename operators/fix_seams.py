@@ -1,42 +1,73 @@
 import bpy
-import re
+from .lod_meshes import find_all_lod_meshes
 
-def find_all_lod_meshes(base_mesh):
-    """Find all LOD meshes related to the selected mesh (LOD0, LOD1, LOD2, etc.)"""
-    all_meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-    lod_pattern = re.compile(r'_LOD\d+$')
-    
-    # Check if the base mesh itself has LOD suffix
-    base_name = base_mesh.name
-    match = lod_pattern.search(base_name)
-    
-    if match:
-        # Remove the LOD suffix to get the base name (e.g., "FaceMesh_LOD0" -> "FaceMesh")
-        prefix = base_name[:match.start()]
-    else:
-        # If no LOD suffix, use the full name as prefix
-        prefix = base_name
-    
-    print(f"Looking for LOD meshes with prefix: '{prefix}'")
-    
-    # Find all meshes that match: prefix + "_LOD" + digit(s)
-    lod_meshes = []
-    for obj in all_meshes:
-        match = lod_pattern.search(obj.name)
-        if match:
-            # Get the prefix of this object
-            obj_prefix = obj.name[:match.start()]
-            # Only include if the prefix matches exactly
-            if obj_prefix == prefix:
-                lod_meshes.append(obj)
-                print(f"  Found matching LOD: {obj.name}")
-    
-    # If we found LOD meshes, return them sorted; otherwise just return the base mesh
-    if lod_meshes:
-        lod_meshes.sort(key=lambda x: x.name)  # Sort for consistent ordering
-        return lod_meshes
-    else:
-        return [base_mesh]
+SEAM_MERGE_DISTANCE = 0.0001
+
+def find_weld_clusters(positions, distance):
+    """Group vertices that Merge by Distance would weld. Returns one cluster label per vertex"""
+    import numpy as np
+    from mathutils.kdtree import KDTree
+
+    kd = KDTree(len(positions))
+    for i, co in enumerate(positions.tolist()):
+        kd.insert(co, i)
+    kd.balance()
+
+    # Union-find over all vertex pairs closer than the merge distance
+    labels = list(range(len(positions)))
+
+    def find(i):
+        while labels[i] != i:
+            labels[i] = labels[labels[i]]
+            i = labels[i]
+        return i
+
+    for i, co in enumerate(positions.tolist()):
+        for _co, j, _dist in kd.find_range(co, distance):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                labels[max(root_i, root_j)] = min(root_i, root_j)
+
+    return np.array([find(i) for i in range(len(positions))], dtype=np.int32)
+
+def average_welded_shape_keys(obj, distance):
+    """Give all selected vertices that are about to be welded the mean of their shape key deltas"""
+    import numpy as np
+
+    vertices = obj.data.vertices
+    selected = np.empty(len(vertices), dtype=bool)
+    vertices.foreach_get("select", selected)
+    selected = np.flatnonzero(selected)
+    if len(selected) < 2:
+        return
+
+    shape_keys = obj.data.shape_keys
+    basis = np.empty(len(vertices) * 3, dtype=np.float32)
+    shape_keys.reference_key.data.foreach_get("co", basis)
+    basis = basis.reshape(-1, 3)
+
+    labels = find_weld_clusters(basis[selected], distance)
+    _unique, clusters = np.unique(labels, return_inverse=True)
+    cluster_sizes = np.bincount(clusters)
+    if cluster_sizes.max() < 2:
+        return
+
+    positions = np.empty(len(vertices) * 3, dtype=np.float32)
+    for key_block in shape_keys.key_blocks:
+        if key_block == shape_keys.reference_key:
+            continue
+        key_block.data.foreach_get("co", positions)
+        key_positions = positions.reshape(-1, 3)
+
+        delta = key_positions[selected] - basis[selected]
+        mean_delta = np.stack([
+            np.bincount(clusters, weights=delta[:, axis]) / cluster_sizes
+            for axis in range(3)
+        ], axis=1)
+        key_positions[selected] = basis[selected] + mean_delta[clusters]
+        key_block.data.foreach_set("co", positions)
+
+    print(f"Averaged shape key offsets of {int((cluster_sizes > 1).sum())} welded vertex group(s)")
 
 class FixSeamsOperator(bpy.types.Operator):
     bl_idname = "object.fix_seams"
@@ -90,20 +121,16 @@ class FixSeamsOperator(bpy.types.Operator):
         # Select non-manifold vertices
         bpy.ops.mesh.select_non_manifold()
 
+        # Welding keeps only one vertex's shape key offsets, so make the welded vertices agree first
+        if obj.data.shape_keys:
+            bpy.ops.object.mode_set(mode='OBJECT')
+            average_welded_shape_keys(obj, SEAM_MERGE_DISTANCE)
+            bpy.ops.object.mode_set(mode='EDIT')
+
         # Merge by distance with a threshold of 0.0001m
-        bpy.ops.mesh.remove_doubles(threshold=0.0001)
+        bpy.ops.mesh.remove_doubles(threshold=SEAM_MERGE_DISTANCE)
 
         # Switch back to object mode
         bpy.ops.object.mode_set(mode='OBJECT')
         
         print("Seams fixed successfully!")
-
-
-def register():
-    bpy.utils.register_class(FixSeamsOperator)
-
-def unregister():
-    bpy.utils.unregister_class(FixSeamsOperator)
-
-if __name__ == "__main__":
-    register()
@@ -1,42 +1,6 @@
 import bpy
-import re
-
-def find_all_lod_meshes(base_mesh):
-    """Find all LOD meshes related to the selected mesh (LOD0, LOD1, LOD2, etc.)"""
-    all_meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-    lod_pattern = re.compile(r'_LOD\d+$')
-    
-    # Check if the base mesh itself has LOD suffix
-    base_name = base_mesh.name
-    match = lod_pattern.search(base_name)
-    
-    if match:
-        # Remove the LOD suffix to get the base name (e.g., "FaceMesh_LOD0" -> "FaceMesh")
-        prefix = base_name[:match.start()]
-    else:
-        # If no LOD suffix, use the full name as prefix
-        prefix = base_name
-    
-    print(f"Looking for LOD meshes with prefix: '{prefix}'")
-    
-    # Find all meshes that match: prefix + "_LOD" + digit(s)
-    lod_meshes = []
-    for obj in all_meshes:
-        match = lod_pattern.search(obj.name)
-        if match:
-            # Get the prefix of this object
-            obj_prefix = obj.name[:match.start()]
-            # Only include if the prefix matches exactly
-            if obj_prefix == prefix:
-                lod_meshes.append(obj)
-                print(f"  Found matching LOD: {obj.name}")
-    
-    # If we found LOD meshes, return them sorted; otherwise just return the base mesh
-    if lod_meshes:
-        lod_meshes.sort(key=lambda x: x.name)  # Sort for consistent ordering
-        return lod_meshes
-    else:
-        return [base_mesh]
+from ..core.naming import twist_renames
+from .lod_meshes import find_all_lod_meshes
 
 class FixTwistBoneNamesOperator(bpy.types.Operator):
     bl_idname = "object.fix_twist_bone_names"
@@ -76,41 +40,22 @@ class FixTwistBoneNamesOperator(bpy.types.Operator):
         """Process twist bone names for a single mesh"""
         print(f"Processing vertex groups for object: {mesh.name}")
         
-        # Get all the vertex groups
         vertex_groups = mesh.vertex_groups
-        twist_cor_groups = [vg for vg in vertex_groups if "twistCor" in vg.name]
+        renames, replaced = twist_renames([vg.name for vg in vertex_groups])
 
-        if not twist_cor_groups:
+        if not renames:
             print("No 'twistCor' vertex groups found.")
             return
 
-        print(f"Found twistCor groups: {[vg.name for vg in twist_cor_groups]}")
-
-        # Loop through each "twistCor" vertex group
-        for twist_cor_group in twist_cor_groups:
-            # Find the name of the corresponding group without "Cor"
-            corresponding_group_name = twist_cor_group.name.replace("twistCor", "twist")
-            corresponding_group = vertex_groups.get(corresponding_group_name)
+        print(f"Found twistCor groups: {list(renames)}")
 
-            # If the corresponding group exists, delete it
-            if corresponding_group:
-                print(f"Found corresponding group: {corresponding_group_name}, removing it.")
-                vertex_groups.remove(corresponding_group)
-            else:
-                print(f"No corresponding group found for: {twist_cor_group.name}")
+        # The twistCor groups replace their plain twist counterparts
+        for group_name in replaced:
+            print(f"Found corresponding group: {group_name}, removing it.")
+            vertex_groups.remove(vertex_groups[group_name])
 
-            # Rename the "twistCor" group by removing "Cor"
-            new_group_name = twist_cor_group.name.replace("twistCor", "twist")
-            print(f"Renaming group {twist_cor_group.name} to {new_group_name}")
-            twist_cor_group.name = new_group_name
+        for old_name, new_name in renames.items():
+            print(f"Renaming group {old_name} to {new_name}")
+            vertex_groups[old_name].name = new_name
 
         print("Finished processing 'twistCor' vertex groups.")
-
-def register():
-    bpy.utils.register_class(FixTwistBoneNamesOperator)
-
-def unregister():
-    bpy.utils.unregister_class(FixTwistBoneNamesOperator)
-
-if __name__ == "__main__":
-    register()
\ No newline at end of file
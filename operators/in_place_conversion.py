@@ -1,44 +1,38 @@
 import bpy
 import json
 import os
-import re
-
-def find_all_lod_meshes(base_mesh):
-    """Find all LOD meshes related to the selected mesh (LOD0, LOD1, LOD2, etc.)"""
-    all_meshes = [obj for obj in bpy.data.objects if obj.type == 'MESH']
-    lod_pattern = re.compile(r'_LOD\d+$')
-    
-    # Check if the base mesh itself has LOD suffix
-    base_name = base_mesh.name
-    match = lod_pattern.search(base_name)
-    
-    if match:
-        # Remove the LOD suffix to get the base name (e.g., "FaceMesh_LOD0" -> "FaceMesh")
-        prefix = base_name[:match.start()]
-    else:
-        # If no LOD suffix, use the full name as prefix
-        prefix = base_name
-    
-    print(f"Looking for LOD meshes with prefix: '{prefix}'")
-    
-    # Find all meshes that match: prefix + "_LOD" + digit(s)
-    lod_meshes = []
-    for obj in all_meshes:
-        match = lod_pattern.search(obj.name)
-        if match:
-            # Get the prefix of this object
-            obj_prefix = obj.name[:match.start()]
-            # Only include if the prefix matches exactly
-            if obj_prefix == prefix:
-                lod_meshes.append(obj)
-                print(f"  Found matching LOD: {obj.name}")
-    
-    # If we found LOD meshes, return them sorted; otherwise just return the base mesh
-    if lod_meshes:
-        lod_meshes.sort(key=lambda x: x.name)  # Sort for consistent ordering
-        return lod_meshes
-    else:
-        return [base_mesh]
+from ..core.naming import bones_outside_keep_list
+from .conversion_markers import (
+    CHUNK_HASHES_PROPERTY,
+    FINGERPRINT_PROPERTY,
+    clear_step_marker,
+    clear_step_markers,
+    is_step_done,
+    mark_step_done,
+    mesh_fingerprint,
+    object_fingerprint,
+    restore_step_markers,
+    save_step_markers,
+    validate_step_markers,
+)
+from ..core.reduction import rules_for_lod
+from .audit_lod_coherence import audit_lod_chain
+from .cleanup_bone_weights import collect_collapse_bones
+from .deformation_qa import capture_pose_deformation, compare_with_reference, load_deformation_poses
+from .incremental_reconversion import reconvert_changed_vertices, refresh_chunk_hashes
+from .lod_bone_reduction import load_bone_budgets, load_lod_reduction_profiles
+from .lod_meshes import find_all_lod_meshes, get_lod_number
+from .reorder_material_sections import has_ordered_sections, load_section_order
+from .skeleton_conformance import CONFORMANCE_PROPERTY, check_skeleton_conformance, conformance_failure, record_conformance
+from .slim_for_export import load_slimming_profile
+from .weight_checkpoint import (
+    capture_bone_checkpoint,
+    capture_weight_checkpoint,
+    checkpoint_active_groups,
+    checkpoint_size,
+    restore_bone_checkpoint,
+    restore_weight_checkpoint,
+)
 
 def load_bone_keep_list():
     """Load the bone keep list from bone_keep_list.json"""
@@ -58,6 +52,53 @@ def load_bone_keep_list():
         print(f"Error: Could not parse bone_keep_list.json")
         return {"head", "spine_01", "spine_02", "spine_03"}
 
+# Per-mesh steps of the conversion, in order: (operator name, label, needs armature selected)
+CONVERSION_STEPS = [
+    ("cleanup_bone_weights", "Clean Up Face Bone Weights", True),
+    ("cleanup_all_vertex_groups", "Cleanup All Vertex Groups", False),
+    ("prune_shape_keys", "Prune Shape Keys", False),
+    ("fix_seams", "Fix Seams", False),
+    ("reorder_material_sections", "Reorder Material Sections", False),
+    ("apply_lod_bone_reduction", "Apply LOD Bone Reduction", True),
+    ("apply_bone_budget", "Apply Bone Budget", True),
+    ("slim_for_export", "Slim For Export", False),
+]
+
+# Steps for LOD1..LODn when their weights are propagated from LOD0 instead of cleaned on their own
+PROPAGATED_LOD_STEPS = [
+    ("prune_shape_keys", "Prune Shape Keys", False),
+    ("fix_seams", "Fix Seams", False),
+    ("reorder_material_sections", "Reorder Material Sections", False),
+    ("propagate_lod_weights", "Propagate LOD0 Weights", False),
+    ("apply_lod_bone_reduction", "Apply LOD Bone Reduction", True),
+    ("apply_bone_budget", "Apply Bone Budget", True),
+    ("slim_for_export", "Slim For Export", False),
+]
+
+PROPAGATE_STEP = "propagate_lod_weights"
+ARMATURE_STEP = "delete_unwanted_bones"
+FOLD_STEP = "fold_pruned_bone_weights"
+COMPACT_STEP = "compact_vertex_groups"
+
+# Custom property on the armature: pruned bone -> kept ancestor, for meshes converted after pruning
+PRUNED_BONE_MAP_PROPERTY = "mh2m_pruned_bone_map"
+
+# Steps that change more than vertex groups. The weight checkpoint only covers the groups, so these
+# changes stay in place when the step fails
+NOT_RESTORABLE_CHANGES = {
+    "prune_shape_keys": "shape key",
+    "fix_seams": "geometry",
+    "reorder_material_sections": "material slot",
+    "slim_for_export": "UV map, attribute and custom property",
+}
+
+# Steps that leave the vertex groups and the topology alone: they get no weight checkpoint, and
+# the weight read after the step before still describes the mesh
+NO_WEIGHT_STEPS = {"prune_shape_keys", "reorder_material_sections"}
+
+# Steps that change the topology: a weight checkpoint cannot be restored once the vertex count changed
+TOPOLOGY_STEPS = {"fix_seams"}
+
 class InPlaceConversionOperator(bpy.types.Operator):
     bl_idname = "object.in_place_conversion"
     bl_label = "In Place Conversion"
@@ -67,75 +108,353 @@ class InPlaceConversionOperator(bpy.types.Operator):
     def execute(self, context):
         settings = context.scene.metahuman_to_manny_settings
         selected_objects = context.selected_objects
-        mesh = None
+        meshes = []
         armature = None
 
-        # Find mesh and armature from selection
+        # Find mesh parts (body, face, torso, legs, feet...) and armature from selection
         for obj in selected_objects:
             if obj.type == 'MESH':
-                mesh = obj
+                meshes.append(obj)
             elif obj.type == 'ARMATURE':
                 armature = obj
 
-        if not mesh or not armature:
-            self.report({'ERROR'}, "Please select both a mesh and an armature.")
+        if not meshes or not armature:
+            self.report({'ERROR'}, "Please select at least one mesh and an armature.")
             return {'CANCELLED'}
 
+        # Bones may have been edited by hand since the hierarchy was cached
+        from .armature_hierarchy import invalidate_armature_hierarchy
+        invalidate_armature_hierarchy(armature)
+
         print("\n=== Starting In Place Conversion ===")
-        
-        # Step 1: Run cleanup_bone_weights (requires both mesh and armature selected)
-        print("\n[1/4] Running Clean Up Face Bone Weights...")
-        bpy.ops.object.select_all(action='DESELECT')
-        mesh.select_set(True)
-        armature.select_set(True)
-        context.view_layer.objects.active = mesh
-        bpy.ops.object.cleanup_bone_weights()
-        
-        # Step 2: Run cleanup_all_vertex_groups (mesh only)
-        print("\n[2/4] Running Cleanup All Vertex Groups...")
-        bpy.ops.object.select_all(action='DESELECT')
-        mesh.select_set(True)
-        context.view_layer.objects.active = mesh
-        bpy.ops.object.cleanup_all_vertex_groups()
-        
-        # Step 3: Run fix_seams (mesh only)
-        print("\n[3/4] Running Fix Seams...")
-        bpy.ops.object.select_all(action='DESELECT')
-        mesh.select_set(True)
-        context.view_layer.objects.active = mesh
-        bpy.ops.object.fix_seams()
-        
-        # Step 4: Delete bones not in keep list
-        print("\n[4/4] Cleaning up armature bones...")
-        bones_to_keep = load_bone_keep_list()
-        print(f"Keeping {len(bones_to_keep)} bones: {sorted(bones_to_keep)}")
-        
-        bpy.ops.object.select_all(action='DESELECT')
-        armature.select_set(True)
-        context.view_layer.objects.active = armature
-        
-        deleted_count = self.delete_unwanted_bones(armature, bones_to_keep)
-        print(f"Deleted {deleted_count} bones from armature")
-        
+
+        from .vertex_weights import reset_weight_memory_peak, weight_memory_peak
+        reset_weight_memory_peak()
+
+        # Group the selection into parts, each with its LODs; selecting several LODs of one part converts it once
+        parts = []
+        seen_meshes = set()
+        for mesh in sorted(meshes, key=lambda x: x.name):
+            if mesh.name in seen_meshes:
+                continue
+            if settings.bAutoLookForLOD:
+                part_meshes = [obj for obj in find_all_lod_meshes(mesh) if obj.name not in seen_meshes]
+            else:
+                part_meshes = [mesh]
+            seen_meshes.update(obj.name for obj in part_meshes)
+
+            # Propagation mode converts LOD0 only and derives the other LODs from it afterwards
+            if settings.bPropagateLODWeights:
+                part_meshes.sort(key=get_lod_number)
+            parts.append(part_meshes)
+
+        all_meshes = [obj for part_meshes in parts for obj in part_meshes]
+        print(f"Converting {len(parts)} part(s), {len(all_meshes)} mesh(es): {[obj.name for obj in all_meshes]}")
+
+        # Converted meshes an artist touched up since only redo the weight fixes on the changed vertex chunks
+        reconverted = set()
+        # Meshes a step or the bone fold rewrote during this run, whose chunk hashes have to be stored again
+        modified = set()
+        if settings.bResumeConversion:
+            for part_meshes in parts:
+                for lod_idx, mesh in enumerate(part_meshes):
+                    if CHUNK_HASHES_PROPERTY not in mesh:
+                        continue
+                    changed_count = reconvert_changed_vertices(mesh, armature, settings)
+                    if changed_count is None:
+                        continue
+                    reconverted.add(mesh.name)
+                    # Lower LODs propagated from a touched-up LOD0 take its new weights again
+                    if changed_count and lod_idx == 0 and settings.bPropagateLODWeights:
+                        for lod_mesh in part_meshes[1:]:
+                            clear_step_marker(lod_mesh, PROPAGATE_STEP)
+
+        # Drop markers that no longer describe the objects, or all of them for a fresh run
+        for obj in all_meshes + [armature]:
+            if settings.bResumeConversion:
+                validate_step_markers(obj)
+            else:
+                clear_step_markers(obj)
+
+        # Pose the rig once before anything changes, so the converted rig can be checked against it at the end
+        deformation_config = load_deformation_poses() if settings.bDeformationQA else {}
+        deformation_references = capture_pose_deformation(context, all_meshes, deformation_config) if settings.bDeformationQA else {}
+
+        # Analysis shared by every part: which vertex groups the face bone collapse folds away and the LOD settings
+        analysis = {
+            "face_bones": collect_collapse_bones(armature),
+            "reduction_profiles": load_lod_reduction_profiles() if settings.bApplyLODReduction else [],
+            "bone_budgets": load_bone_budgets() if settings.bApplyBoneBudget else [],
+            "section_order": load_section_order() if settings.bReorderMaterialSections else [],
+            "prune_shape_keys": settings.bPruneShapeKeys,
+            "slimming_profile": load_slimming_profile(settings.SlimmingProfile) if settings.bSlimForExport else None,
+        }
+
+        total = len(all_meshes)
+        processed = 0
+        skipped_count = 0
+        largest_checkpoint = 0
+
+        # The LOD loop lives here, so the individual operators only touch the mesh they are given
+        auto_look_for_lod = settings.bAutoLookForLOD
+        settings.bAutoLookForLOD = False
+        try:
+            for part_meshes in parts:
+                propagate_weights = settings.bPropagateLODWeights and len(part_meshes) > 1
+
+                for lod_idx, target_mesh in enumerate(part_meshes):
+                    processed += 1
+                    print(f"\n=== Converting {target_mesh.name} ({processed}/{total}) ===")
+
+                    steps = PROPAGATED_LOD_STEPS if propagate_weights and lod_idx > 0 else CONVERSION_STEPS
+                    total_steps = len(steps)
+                    step_ran = False
+                    # Weights of target_mesh as they are now, from the read after the last step that ran
+                    weight_read = None
+                    for step_idx, (step_name, label, needs_armature) in enumerate(steps):
+                        # Propagated weights are only current while LOD0 is in the state they came from
+                        depends_on = self.source_fingerprint(part_meshes[0]) if step_name == PROPAGATE_STEP else None
+                        # Once a step runs again, the steps after it work on new input and run again too
+                        if not step_ran and is_step_done(target_mesh, step_name, depends_on):
+                            print(f"\n[{step_idx + 1}/{total_steps}] Skipping {label}, already done on {target_mesh.name}")
+                            skipped_count += 1
+                            continue
+
+                        if not self.step_applies(step_name, target_mesh, analysis):
+                            print(f"\n[{step_idx + 1}/{total_steps}] Skipping {label}, not needed on {target_mesh.name}")
+                            continue
+
+                        print(f"\n[{step_idx + 1}/{total_steps}] Running {label}...")
+                        step_ran = True
+                        modified.add(target_mesh.name)
+                        bpy.ops.object.select_all(action='DESELECT')
+                        target_mesh.select_set(True)
+                        if needs_armature:
+                            armature.select_set(True)
+                        context.view_layer.objects.active = target_mesh
+
+                        checkpoint = None
+                        if step_name not in NO_WEIGHT_STEPS and step_name not in TOPOLOGY_STEPS:
+                            checkpoint = weight_read if weight_read is not None else capture_weight_checkpoint(target_mesh)
+                            largest_checkpoint = max(largest_checkpoint, checkpoint_size(checkpoint))
+                        try:
+                            result = getattr(bpy.ops.object, step_name)()
+                        except RuntimeError as e:
+                            failed = self.roll_back_meshes(context, [target_mesh], {target_mesh.name: checkpoint}) if checkpoint else []
+                            self.report({'ERROR'}, f"{label} failed on {target_mesh.name}: {e}. {self.rollback_summary(step_name, failed, checkpoint is not None)}")
+                            return {'CANCELLED'}
+                        if 'FINISHED' not in result:
+                            # A cancelled step is not recorded, so the next run retries it
+                            failed = self.roll_back_meshes(context, [target_mesh], {target_mesh.name: checkpoint}) if checkpoint else []
+                            self.report({'ERROR'}, f"{label} was cancelled on {target_mesh.name}. {self.rollback_summary(step_name, failed, checkpoint is not None)}")
+                            return {'CANCELLED'}
+
+                        # One read after the step gives its fingerprint and the checkpoint of the next step
+                        if step_name not in NO_WEIGHT_STEPS or weight_read is None:
+                            weight_read = capture_weight_checkpoint(target_mesh)
+                        mark_step_done(target_mesh, step_name, depends_on, mesh_fingerprint(target_mesh, weight_read))
+                        if step_name == "apply_lod_bone_reduction":
+                            print(f"LOD{get_lod_number(target_mesh)}: {checkpoint_active_groups(weight_read)} active bone(s) on {target_mesh.name} after reduction")
+        finally:
+            settings.bAutoLookForLOD = auto_look_for_lod
+
+        # Last step, once for all parts: Delete bones not in keep list. Meshes converted after the
+        # armature was pruned still get the pruned bones' weights folded and their groups compacted
+        print("\nCleaning up armature bones...")
+        deleted_count = 0
+        armature_done = is_step_done(armature, ARMATURE_STEP)
+        fold_meshes = [mesh for mesh in all_meshes if not is_step_done(mesh, FOLD_STEP)]
+        compact_meshes = [mesh for mesh in all_meshes if not is_step_done(mesh, COMPACT_STEP)]
+        if armature_done and not fold_meshes and not compact_meshes:
+            print(f"Skipping, bones were already pruned on {armature.name}")
+            skipped_count += 1
+        else:
+            bones_to_keep = load_bone_keep_list()
+            print(f"Keeping {len(bones_to_keep)} bones: {sorted(bones_to_keep)}")
+
+            bpy.ops.object.select_all(action='DESELECT')
+            armature.select_set(True)
+            context.view_layer.objects.active = armature
+
+            # Folding touches every mesh, so all of them and the bone list are checkpointed together
+            checkpoints = {mesh.name: capture_weight_checkpoint(mesh) for mesh in all_meshes}
+            bone_checkpoint = capture_bone_checkpoint(armature)
+            markers = {obj.name: save_step_markers(obj) for obj in all_meshes + [armature]}
+            largest_checkpoint = max(largest_checkpoint, sum(checkpoint_size(checkpoint) for checkpoint in checkpoints.values()))
+            try:
+                self.fold_pruned_bone_weights(armature, bones_to_keep, fold_meshes, settings.bMirrorWeights)
+                if armature_done:
+                    print(f"Bones were already pruned on {armature.name}, folded {len(fold_meshes)} newly converted mesh(es)")
+                else:
+                    deleted_count = self.delete_unwanted_bones(armature, bones_to_keep)
+                    mark_step_done(armature, ARMATURE_STEP)
+                    print(f"Deleted {deleted_count} bones from armature")
+
+                self.compact_mesh_groups(armature, compact_meshes)
+                modified.update(mesh.name for mesh in fold_meshes + compact_meshes)
+            except Exception as e:
+                failed = self.roll_back_meshes(context, all_meshes, checkpoints)
+                restore_bone_checkpoint(context, armature, bone_checkpoint)
+                for obj in all_meshes + [armature]:
+                    restore_step_markers(obj, markers[obj.name])
+                if failed:
+                    self.report({'ERROR'}, f"Pruning bones failed on {armature.name}: {e}. The bones were rolled back, but the vertex groups of {', '.join(failed)} could not be because their vertex count changed. Reload the file before converting again.")
+                else:
+                    self.report({'ERROR'}, f"Pruning bones failed on {armature.name}: {e}. The bones and vertex groups were rolled back, run the conversion again to resume.")
+                return {'CANCELLED'}
+
+        # Pruning changed LOD0 and the propagated LODs alike, so the propagation stays current for LOD0's final state
+        for part_meshes in parts:
+            for lod_mesh in part_meshes[1:]:
+                if is_step_done(lod_mesh, PROPAGATE_STEP):
+                    mark_step_done(lod_mesh, PROPAGATE_STEP, self.source_fingerprint(part_meshes[0]))
+
+        # Hash the converted weights per vertex chunk, so the next run after touch-ups only redoes the changed vertices
+        refresh_chunk_hashes(all_meshes, current=reconverted - modified)
+
+        # Check the pruned armature against the reference Manny skeleton before anything is exported.
+        # The outcome is recorded on the armature, so batch conversion does not save a failed rig
+        skeleton_passed = True
+        if CONFORMANCE_PROPERTY in armature:
+            del armature[CONFORMANCE_PROPERTY]
+        if settings.bCheckSkeleton:
+            from ..core.skeleton import format_conformance
+
+            print("\nChecking skeleton conformance...")
+            skeleton_report = check_skeleton_conformance(armature, settings.SkeletonProfile)
+            if skeleton_report:
+                print(format_conformance(skeleton_report))
+            skeleton_passed = record_conformance(armature, skeleton_report, settings.SkeletonProfile)
+
+        # Check that the LODs of every part still agree with their LOD0
+        if settings.bAuditLODCoherence:
+            from ..core.compare import format_audit
+
+            print("\nAuditing LOD weight coherence...")
+            for part_meshes in parts:
+                if len(part_meshes) > 1:
+                    for report in audit_lod_chain(part_meshes):
+                        print(format_audit(report))
+
+        # Pose the converted rig the same way and compare the deformation with the original
+        if settings.bDeformationQA:
+            from ..core.deformation import format_deformation_report
+
+            print("\nChecking deformation against the original rig...")
+            captures = capture_pose_deformation(context, all_meshes, deformation_config)
+            for mesh_name, reference in deformation_references.items():
+                print(format_deformation_report(compare_with_reference(reference, captures[mesh_name])))
+
         # Restore original selection
         bpy.ops.object.select_all(action='DESELECT')
-        mesh.select_set(True)
+        for mesh in meshes:
+            mesh.select_set(True)
         armature.select_set(True)
-        context.view_layer.objects.active = mesh
-        
-        self.report({'INFO'}, f"In Place Conversion complete! Removed {deleted_count} bones.")
+        context.view_layer.objects.active = meshes[0]
+
+        if not skeleton_passed:
+            # A warning, not an error: bpy.ops raises on operators that report errors, and batch
+            # conversion reads the recorded outcome instead
+            self.report({'WARNING'}, f"Skeleton check failed on {armature.name}: {conformance_failure(armature)}")
+        print(f"Largest weight checkpoint: {largest_checkpoint / 1048576:.1f} MB")
+        print(f"Peak weight buffer memory: {weight_memory_peak() / 1048576:.1f} MB (largest set of weight buffers held at once, chunks budgeted at {settings.WeightMemoryBudget} MB)")
+        self.report({'INFO'}, f"In Place Conversion complete! Converted {len(parts)} part(s), removed {deleted_count} bones, skipped {skipped_count} finished step(s).")
         print("\n=== In Place Conversion Complete ===")
         return {'FINISHED'}
 
+    def step_applies(self, step_name, mesh, analysis):
+        """Part-specific steps only run on meshes that carry the data they clean up"""
+        if step_name == "cleanup_bone_weights":
+            # Only parts weighted to facial bones (face, head-wearing parts) need the collapse
+            return any(vg.name in analysis["face_bones"] for vg in mesh.vertex_groups)
+        if step_name == "apply_lod_bone_reduction":
+            return bool(rules_for_lod(analysis["reduction_profiles"], get_lod_number(mesh)))
+        if step_name == "apply_bone_budget":
+            return bool(analysis["bone_budgets"])
+        if step_name == "slim_for_export":
+            return analysis["slimming_profile"] is not None
+        if step_name == "prune_shape_keys":
+            return analysis["prune_shape_keys"] and mesh.data.shape_keys is not None
+        if step_name == "reorder_material_sections":
+            # Only the face mesh uses the canonical section names
+            return has_ordered_sections(mesh, analysis["section_order"])
+        return True
+
+    def source_fingerprint(self, lod0):
+        """LOD0's fingerprint as recorded by its last finished step, or read from the mesh"""
+        return lod0.get(FINGERPRINT_PROPERTY) or object_fingerprint(lod0)
+
+    def roll_back_meshes(self, context, meshes, checkpoints):
+        """Restore the vertex groups of meshes a failed step left half-processed. Returns the names of the meshes that could not be restored"""
+        if context.object and context.object.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        return [mesh.name for mesh in meshes if not restore_weight_checkpoint(mesh, checkpoints[mesh.name])]
+
+    def rollback_summary(self, step_name, failed, checkpointed=True):
+        """What a rollback after a failed step restored, and what the user has to do next"""
+        if step_name in TOPOLOGY_STEPS:
+            return (f"Its {NOT_RESTORABLE_CHANGES[step_name]} and vertex groups were not restored, topology changes cannot be rolled back. "
+                    f"Reload the file before converting again.")
+        if not checkpointed:
+            return f"Its {NOT_RESTORABLE_CHANGES[step_name]} changes cannot be rolled back. Reload the file or undo before converting again."
+        if failed:
+            return "Its vertex groups could not be rolled back because its vertex count changed. Reload the file before converting again."
+        if step_name in NOT_RESTORABLE_CHANGES:
+            return (f"Its vertex groups were rolled back, but its {NOT_RESTORABLE_CHANGES[step_name]} changes cannot be. "
+                    f"Reload the file or undo before converting again.")
+        return "Its vertex groups were rolled back, run the conversion again to resume."
+
+    def fold_pruned_bone_weights(self, armature, bones_to_keep, meshes, symmetric=False):
+        """Move the weights of bones about to be deleted, or deleted by an earlier run, onto their nearest kept ancestor on every mesh"""
+        from .armature_hierarchy import get_armature_hierarchy
+        from .remap_tables import find_stored_remap
+        from .symmetry import get_mesh_symmetry
+        from .vertex_weights import fold_vertex_groups
+
+        # Rigs matching a table in metahuman_remap_tables.json use it, other rigs walk their hierarchy
+        fold_map = find_stored_remap(armature, "keep_list_fold", bones_to_keep)
+        if fold_map is None:
+            fold_map = get_armature_hierarchy(armature).nearest_ancestor_map(bones_to_keep)
+        fold_map = dict(fold_map)
+
+        # Bones pruned by an earlier run are gone from the armature, meshes converted since use their stored targets
+        stored_map = armature.get(PRUNED_BONE_MAP_PROPERTY)
+        if stored_map:
+            bones = armature.data.bones
+            for bone_name, target_name in stored_map.items():
+                if bone_name not in bones:
+                    fold_map.setdefault(bone_name, target_name)
+        armature[PRUNED_BONE_MAP_PROPERTY] = fold_map
+
+        orphaned = [name for name in armature.data.bones.keys() if name not in bones_to_keep and name not in fold_map]
+        if orphaned:
+            print(f"No kept ancestor for {len(orphaned)} bone(s), their weights are not folded: {orphaned}")
+
+        for mesh in meshes:
+            symmetry = get_mesh_symmetry(mesh) if symmetric else None
+            folded_count = fold_vertex_groups(mesh, fold_map, symmetry=symmetry)
+            if folded_count:
+                print(f"Folded {folded_count} pruned bone group(s) into their kept ancestors on {mesh.name}")
+            # Keep the mesh markers valid for the next run
+            mark_step_done(mesh, FOLD_STEP)
+
+    def compact_mesh_groups(self, armature, meshes):
+        """Remove weightless vertex groups and sort the rest in the pruned armature's bone order"""
+        from .vertex_weights import compact_vertex_groups
+
+        # The armature's own bone order (as in the outliner and the exported skeleton), not the depth-first hierarchy order
+        bone_order = armature.data.bones.keys()
+        for mesh in meshes:
+            removed_count = compact_vertex_groups(mesh, bone_order)
+            print(f"{mesh.name}: removed {removed_count} empty vertex group(s), sorted the rest in bone order")
+            mark_step_done(mesh, COMPACT_STEP)
+
     def delete_unwanted_bones(self, armature, bones_to_keep):
         """Delete all bones from armature that are not in the keep list"""
         bpy.ops.object.mode_set(mode='EDIT')
         edit_bones = armature.data.edit_bones
         
-        bones_to_delete = []
-        for bone in edit_bones:
-            if bone.name not in bones_to_keep:
-                bones_to_delete.append(bone.name)
+        bones_to_delete = bones_outside_keep_list(edit_bones.keys(), bones_to_keep)
         
         # Delete bones
         deleted_count = 0
@@ -146,13 +465,6 @@ class InPlaceConversionOperator(bpy.types.Operator):
                 deleted_count += 1
         
         bpy.ops.object.mode_set(mode='OBJECT')
+        from .armature_hierarchy import invalidate_armature_hierarchy
+        invalidate_armature_hierarchy(armature)
         return deleted_count
-
-def register():
-    bpy.utils.register_class(InPlaceConversionOperator)
-
-def unregister():
-    bpy.utils.unregister_class(InPlaceConversionOperator)
-
-if __name__ == "__main__":
-    register()
@@ -0,0 +1,167 @@
+import time
+from ..core.naming import bulge_merge_map, toe_merge_map
+from ..core.reduction import budget_for_lod, compile_reduction_map, rules_for_lod
+from .conversion_markers import CHUNK_HASHES_PROPERTY, FINGERPRINT_PROPERTY, mesh_fingerprint, weight_fingerprint
+from .lod_meshes import get_lod_number
+
+def store_chunk_hashes(obj, checkpoint=None):
+    """Record a hash per vertex chunk of the mesh's weights, so a later run can tell which chunks an artist changed.
+
+    checkpoint can pass in a weight checkpoint of the unchanged mesh to skip reading it again.
+    """
+    from ..core.weights import HASH_CHUNK_VERTICES, chunk_count, influence_chunk_hashes
+    from .weight_checkpoint import capture_weight_checkpoint
+
+    if checkpoint is None:
+        checkpoint = capture_weight_checkpoint(obj)
+    vertex_count = checkpoint["vertex_count"]
+    hashes = influence_chunk_hashes(
+        checkpoint["groups"], checkpoint["vertex_ids"], checkpoint["group_ids"], checkpoint["weights"],
+        range(chunk_count(vertex_count)),
+    )
+    # IDProperties cannot hold string lists, so the hashes are stored comma separated
+    obj[CHUNK_HASHES_PROPERTY] = {
+        "vertex_count": vertex_count,
+        "chunk_vertices": HASH_CHUNK_VERTICES,
+        "hashes": ",".join(hashes),
+    }
+
+def refresh_chunk_hashes(meshes, current=()):
+    """Store new chunk hashes on the meshes, except the ones named in current whose stored hashes still match their weights.
+
+    Every mesh a conversion step rewrote must be left out of current, or the next
+    run would take the conversion's own output for an artist's touch-up.
+    """
+    for mesh in meshes:
+        if mesh.name not in current or CHUNK_HASHES_PROPERTY not in mesh:
+            store_chunk_hashes(mesh)
+
+def find_dirty_chunks(obj, checkpoint):
+    """Indices of the vertex chunks whose weights differ from the stored hashes, or None if they cannot be compared"""
+    from ..core.weights import HASH_CHUNK_VERTICES, chunk_count, influence_chunk_hashes
+
+    stored = obj.get(CHUNK_HASHES_PROPERTY)
+    if not stored or stored["chunk_vertices"] != HASH_CHUNK_VERTICES or stored["vertex_count"] != checkpoint["vertex_count"]:
+        return None
+
+    stored_hashes = stored["hashes"].split(",")
+    current_hashes = influence_chunk_hashes(
+        checkpoint["groups"], checkpoint["vertex_ids"], checkpoint["group_ids"], checkpoint["weights"],
+        range(chunk_count(checkpoint["vertex_count"])),
+    )
+    return [k for k, (old, new) in enumerate(zip(stored_hashes, current_hashes)) if old != new]
+
+def reconvert_changed_vertices(mesh, armature, settings):
+    """Redo the weight fixes of a converted mesh on the vertex chunks changed since its chunk hashes were stored.
+
+    Runs the toe and finger bulge merges and the LOD bone reduction on the vertices
+    of the dirty chunks only, then checks the bone budget against the whole mesh (from
+    the same read) and only refolds everything if it is exceeded. A fold deletes its
+    source groups from the whole mesh, so sources that still carry weight on the clean
+    chunks are folded on the whole mesh instead. Bones pruned by the conversion no
+    longer exist, so the face collapse and keep-list fold have nothing left to do.
+    Afterwards the chunk hashes and the resume fingerprint are updated, without
+    reading the clean chunks again unless a whole-mesh fold changed them. Returns the
+    number of reprocessed vertices, or None if the mesh has no usable chunk hashes
+    and needs a regular conversion.
+    """
+    import numpy as np
+    from ..core.weights import HASH_CHUNK_VERTICES, chunk_vertex_rows, influence_chunk_hashes
+    from .armature_hierarchy import get_armature_hierarchy
+    from .bone_budget import apply_bone_budget
+    from .lod_bone_reduction import load_bone_budgets, load_lod_reduction_profiles
+    from .vertex_weights import fold_vertex_groups, read_sparse_influences
+    from .weight_checkpoint import capture_weight_checkpoint
+
+    start = time.perf_counter()
+    checkpoint = capture_weight_checkpoint(mesh)
+    dirty_chunks = find_dirty_chunks(mesh, checkpoint)
+    if dirty_chunks is None:
+        return None
+    if not dirty_chunks:
+        print(f"{mesh.name}: weights unchanged since the last conversion")
+        return 0
+
+    vertex_count = checkpoint["vertex_count"]
+    rows = chunk_vertex_rows(dirty_chunks, vertex_count)
+    print(f"{mesh.name}: {len(dirty_chunks)} changed chunk(s), reconverting {len(rows)}/{vertex_count} vertices")
+
+    # Weight of every group on the clean chunks, from the checkpoint
+    clean = np.ones(vertex_count, dtype=bool)
+    clean[rows] = False
+    clean_entries = clean[checkpoint["vertex_ids"]]
+    clean_sums = np.bincount(
+        checkpoint["group_ids"][clean_entries],
+        weights=checkpoint["weights"][clean_entries].astype(np.float64),
+        minlength=len(checkpoint["groups"]),
+    )
+    clean_totals = dict(zip(checkpoint["groups"], clean_sums.tolist()))
+
+    whole_mesh_folds = 0
+    def fold(group_map):
+        nonlocal whole_mesh_folds
+        # Only sources without weight on the clean chunks can be folded on the changed vertices alone
+        spread = {src: dst for src, dst in group_map.items() if clean_totals.get(src, 0.0) > 0.0}
+        local = {src: dst for src, dst in group_map.items() if src not in spread}
+        count = fold_vertex_groups(mesh, local, rows=rows)
+        if spread:
+            spread_count = fold_vertex_groups(mesh, spread)
+            whole_mesh_folds += spread_count
+            count += spread_count
+        return count
+
+    folded_count = fold(toe_merge_map([vg.name for vg in mesh.vertex_groups]))
+    bulge_map, missing_targets = bulge_merge_map([vg.name for vg in mesh.vertex_groups])
+    for target_name in missing_targets:
+        print(f"Warning: Target vertex group '{target_name}' not found.")
+    folded_count += fold(bulge_map)
+
+    hierarchy = get_armature_hierarchy(armature)
+    rules = rules_for_lod(load_lod_reduction_profiles(), get_lod_number(mesh)) if settings.bApplyLODReduction else []
+    if rules:
+        folded_count += fold(compile_reduction_map(rules, hierarchy))
+    print(f"{mesh.name}: folded {folded_count} group(s), {whole_mesh_folds} of them on the whole mesh")
+
+    if whole_mesh_folds:
+        # The clean chunks changed too, so the sums come from a fresh read of the whole mesh
+        current = capture_weight_checkpoint(mesh)
+        group_names = current["groups"]
+        group_sums = np.bincount(
+            current["group_ids"], weights=current["weights"].astype(np.float64), minlength=len(group_names)
+        ).tolist()
+    else:
+        # Whole-mesh group sums: the clean chunks from the checkpoint, the changed ones read again
+        current = None
+        group_names, vertex_ids, group_ids, weights = read_sparse_influences(mesh, min_weight=0.0, rows=rows)
+        dirty_sums = np.bincount(group_ids, weights=weights.astype(np.float64), minlength=len(group_names)).tolist()
+        group_sums = [clean_totals.get(name, 0.0) + total for name, total in zip(group_names, dirty_sums)]
+
+    budget = budget_for_lod(load_bone_budgets(), get_lod_number(mesh)) if settings.bApplyBoneBudget else None
+    influencing = sum(1 for name, total in zip(group_names, group_sums) if total > 1e-6 and hierarchy.has_bone(name))
+    if budget is not None and influencing > budget:
+        # The budget solver ranks bones by their whole-mesh weight, so it needs the full pass
+        print(f"{mesh.name}: {influencing} influencing bones exceed the budget of {budget}, applying it to the whole mesh")
+        apply_bone_budget(mesh, armature, budget)
+        store_chunk_hashes(mesh)
+        if FINGERPRINT_PROPERTY in mesh:
+            mesh[FINGERPRINT_PROPERTY] = mesh_fingerprint(mesh)
+    elif current is not None:
+        store_chunk_hashes(mesh, current)
+        if FINGERPRINT_PROPERTY in mesh:
+            mesh[FINGERPRINT_PROPERTY] = weight_fingerprint(mesh, group_names, group_sums)
+    else:
+        stored = mesh[CHUNK_HASHES_PROPERTY]
+        hashes = stored["hashes"].split(",")
+        for k, chunk_hash in zip(dirty_chunks, influence_chunk_hashes(group_names, vertex_ids, group_ids, weights, dirty_chunks)):
+            hashes[k] = chunk_hash
+        mesh[CHUNK_HASHES_PROPERTY] = {
+            "vertex_count": vertex_count,
+            "chunk_vertices": HASH_CHUNK_VERTICES,
+            "hashes": ",".join(hashes),
+        }
+        # Keep the resume markers valid, so the other steps stay skipped
+        if FINGERPRINT_PROPERTY in mesh:
+            mesh[FINGERPRINT_PROPERTY] = weight_fingerprint(mesh, group_names, group_sums)
+
+    print(f"{mesh.name}: reconverted {len(rows)} vertices in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return len(rows)
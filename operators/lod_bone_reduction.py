@@ -0,0 +1,95 @@
+import bpy
+import json
+import os
+from ..core.reduction import compile_reduction_map, rules_for_lod
+from .lod_meshes import find_all_lod_meshes, get_lod_number
+
+def load_lod_reduction_config():
+    """Load the per-LOD bone reduction settings from lod_bone_reduction.json"""
+    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    json_path = os.path.join(addon_dir, "lod_bone_reduction.json")
+
+    try:
+        with open(json_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Warning: lod_bone_reduction.json not found at {json_path}")
+        return {}
+    except json.JSONDecodeError:
+        print(f"Error: Could not parse lod_bone_reduction.json")
+        return {}
+
+def load_lod_reduction_profiles():
+    """Load the per-LOD collapse profiles"""
+    return load_lod_reduction_config().get("profiles", [])
+
+def load_bone_budgets():
+    """Load the maximum number of influencing bones per LOD; the last entry covers all higher LODs"""
+    return load_lod_reduction_config().get("bone_budgets", [])
+
+def reduce_lod_bones(mesh, armature, profiles, symmetric=False):
+    """Apply the reduction profiles matching the mesh's LOD. Returns the active bone count afterwards"""
+    from .armature_hierarchy import get_armature_hierarchy
+    from .symmetry import get_mesh_symmetry
+    from .vertex_weights import count_active_groups, fold_vertex_groups
+
+    lod_number = get_lod_number(mesh)
+    rules = rules_for_lod(profiles, lod_number)
+    if rules:
+        group_map = compile_reduction_map(rules, get_armature_hierarchy(armature))
+        symmetry = get_mesh_symmetry(mesh) if symmetric else None
+        folded_count = fold_vertex_groups(mesh, group_map, symmetry=symmetry)
+        print(f"LOD{lod_number}: collapsed {folded_count} vertex group(s) on {mesh.name}")
+    else:
+        print(f"LOD{lod_number}: no reduction profile for {mesh.name}")
+    return count_active_groups(mesh)
+
+class ApplyLodBoneReductionOperator(bpy.types.Operator):
+    bl_idname = "object.apply_lod_bone_reduction"
+    bl_label = "Apply LOD Bone Reduction"
+    bl_description = "Collapses bone weights on lower LODs into their parents according to lod_bone_reduction.json"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+        selected_objects = context.selected_objects
+        mesh = None
+        armature = None
+
+        for obj in selected_objects:
+            if obj.type == 'MESH':
+                mesh = obj
+            elif obj.type == 'ARMATURE':
+                armature = obj
+
+        if not mesh or not armature:
+            self.report({'ERROR'}, "Please select both a mesh and an armature.")
+            return {'CANCELLED'}
+
+        # Bones may have been edited by hand since the hierarchy was cached
+        from .armature_hierarchy import invalidate_armature_hierarchy
+        invalidate_armature_hierarchy(armature)
+
+        profiles = load_lod_reduction_profiles()
+        if not profiles:
+            self.report({'ERROR'}, "No LOD bone reduction profiles found.")
+            return {'CANCELLED'}
+
+        # Find all LOD meshes if enabled
+        meshes_to_process = []
+        if settings.bAutoLookForLOD:
+            meshes_to_process = find_all_lod_meshes(mesh)
+            if len(meshes_to_process) > 1:
+                self.report({'INFO'}, f"Found {len(meshes_to_process)} LOD meshes to process")
+        else:
+            meshes_to_process = [mesh]
+
+        # Process each mesh
+        total = len(meshes_to_process)
+        for idx, target_mesh in enumerate(sorted(meshes_to_process, key=get_lod_number)):
+            print(f"\n=== Processing {target_mesh.name} ({idx + 1}/{total}) ===")
+            active_count = reduce_lod_bones(target_mesh, armature, profiles, settings.bMirrorWeights)
+            self.report({'INFO'}, f"{target_mesh.name}: {active_count} active bones")
+
+        self.report({'INFO'}, f"All done! Processed {total} mesh(es) total")
+        return {'FINISHED'}
@@ -0,0 +1,26 @@
+import bpy
+from ..core.naming import LOD_SUFFIX, lod_number, lod_prefix
+
+def find_all_lod_meshes(base_mesh):
+    """Find all LOD meshes related to the selected mesh (LOD0, LOD1, LOD2, etc.)"""
+    # Without a LOD suffix the full name is the prefix (e.g., "FaceMesh_LOD0" -> "FaceMesh")
+    prefix = lod_prefix(base_mesh.name)
+    print(f"Looking for LOD meshes with prefix: '{prefix}'")
+
+    # Find all meshes that match: prefix + "_LOD" + digit(s)
+    lod_meshes = []
+    for obj in bpy.data.objects:
+        if obj.type == 'MESH' and LOD_SUFFIX.search(obj.name) and lod_prefix(obj.name) == prefix:
+            lod_meshes.append(obj)
+            print(f"  Found matching LOD: {obj.name}")
+
+    # If we found LOD meshes, return them sorted; otherwise just return the base mesh
+    if lod_meshes:
+        lod_meshes.sort(key=lambda x: x.name)  # Sort for consistent ordering
+        return lod_meshes
+    else:
+        return [base_mesh]
+
+def get_lod_number(obj):
+    """Return the LOD index from a '_LOD<n>' name suffix, or 0 for meshes without one"""
+    return lod_number(obj.name)
@@ -0,0 +1,123 @@
+import bpy
+import hashlib
+from .lod_meshes import find_all_lod_meshes, get_lod_number
+
+# (source name, target name) -> (source geometry hash, target geometry hash, triangle corners, barycentric weights)
+_correspondence_cache = {}
+# source name -> (source geometry hash, surface index), shared by all LODs mapped onto the same source
+_surface_index_cache = {}
+
+def read_vertex_positions(obj):
+    """Read vertex positions of a mesh as an (N, 3) float32 array in object space"""
+    import numpy as np
+
+    positions = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    obj.data.vertices.foreach_get("co", positions)
+    return positions.reshape(-1, 3)
+
+def geometry_hash(positions):
+    """Cheap hash used to tell whether a cached correspondence still matches the mesh"""
+    return hashlib.sha1(positions.tobytes()).hexdigest()
+
+def get_surface_index(source, source_positions, source_hash):
+    """Return the closest point index of the source surface, built once per source geometry"""
+    import numpy as np
+    from ..core.surface import SurfaceIndex
+
+    cached = _surface_index_cache.get(source.name)
+    if cached and cached[0] == source_hash:
+        return cached[1]
+
+    source.data.calc_loop_triangles()
+    triangles = np.empty(len(source.data.loop_triangles) * 3, dtype=np.int32)
+    source.data.loop_triangles.foreach_get("vertices", triangles)
+
+    surface_index = SurfaceIndex(source_positions, triangles.reshape(-1, 3))
+    _surface_index_cache[source.name] = (source_hash, surface_index)
+    return surface_index
+
+def compute_correspondence(source, target, target_positions, surface_index):
+    """Map every target vertex to the closest point on the source surface, all vertices in one vectorized query.
+
+    Returns (corners, bary): the source vertex indices of the closest triangle per
+    target vertex and the barycentric coordinates of the closest point on it.
+    """
+    import numpy as np
+
+    # Bring target vertices into the source's object space
+    to_source = np.array(source.matrix_world.inverted() @ target.matrix_world, dtype=np.float32)
+    points = target_positions @ to_source[:3, :3].T + to_source[:3, 3]
+    return surface_index.closest_points(points)
+
+def get_correspondence(source, target):
+    """Return the cached correspondence for this LOD pair, recomputing it only if either mesh changed"""
+    source_positions = read_vertex_positions(source)
+    target_positions = read_vertex_positions(target)
+    source_hash = geometry_hash(source_positions)
+    target_hash = geometry_hash(target_positions)
+
+    key = (source.name, target.name)
+    cached = _correspondence_cache.get(key)
+    if cached and cached[0] == source_hash and cached[1] == target_hash:
+        print(f"Using cached correspondence {source.name} -> {target.name}")
+        return cached[2], cached[3]
+
+    print(f"Computing correspondence {source.name} -> {target.name}")
+    surface_index = get_surface_index(source, source_positions, source_hash)
+    corners, bary = compute_correspondence(source, target, target_positions, surface_index)
+    _correspondence_cache[key] = (source_hash, target_hash, corners, bary)
+    return corners, bary
+
+def transfer_lod_weights(source, target):
+    """Replace the target's vertex groups with the source's weights interpolated over the closest source triangle"""
+    from ..core.weights import interpolate_weights
+    from .vertex_weights import read_weight_matrix, write_weight_matrix
+
+    corners, bary = get_correspondence(source, target)
+    group_names, source_weights = read_weight_matrix(source)
+
+    target_weights = interpolate_weights(source_weights, corners, bary)
+
+    write_weight_matrix(target, group_names, target_weights)
+    print(f"Transferred {len(group_names)} vertex groups from {source.name} to {target.name}")
+
+class PropagateLodWeightsOperator(bpy.types.Operator):
+    bl_idname = "object.propagate_lod_weights"
+    bl_label = "Propagate LOD0 Weights"
+    bl_description = "Copies the vertex group weights of LOD0 onto the other LOD meshes through the closest LOD0 surface point"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure a mesh object is selected
+        mesh = context.object
+        if not mesh or mesh.type != 'MESH':
+            self.report({'ERROR'}, "Please select a mesh object.")
+            return {'CANCELLED'}
+
+        lod_meshes = find_all_lod_meshes(mesh)
+        if len(lod_meshes) < 2:
+            self.report({'ERROR'}, "No other LOD meshes found.")
+            return {'CANCELLED'}
+        source = min(lod_meshes, key=get_lod_number)
+
+        # With LOD lookup disabled only the selected mesh receives the weights
+        if settings.bAutoLookForLOD:
+            meshes_to_process = [obj for obj in lod_meshes if obj != source]
+        else:
+            meshes_to_process = [mesh] if mesh != source else []
+
+        if not meshes_to_process:
+            self.report({'ERROR'}, f"Select a lower LOD than {source.name}.")
+            return {'CANCELLED'}
+
+        # Process each mesh
+        total = len(meshes_to_process)
+        for idx, target_mesh in enumerate(meshes_to_process):
+            print(f"\n=== Processing {target_mesh.name} ({idx + 1}/{total}) ===")
+            transfer_lod_weights(source, target_mesh)
+            self.report({'INFO'}, f"Completed {target_mesh.name} ({idx + 1}/{total})")
+
+        self.report({'INFO'}, f"All done! Propagated {source.name} weights to {total} mesh(es)")
+        return {'FINISHED'}
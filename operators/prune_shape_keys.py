@@ -0,0 +1,148 @@
+import bpy
+import json
+import os
+import re
+from .lod_meshes import find_all_lod_meshes, get_lod_number
+
+# FBX stores a morph target as the indices (int32), position deltas and normal deltas (3 doubles each) of its moved vertices
+FBX_BYTES_PER_MORPH_VERTEX = 4 + 3 * 8 + 3 * 8
+
+def load_shape_key_pruning():
+    """Load the shape key pruning settings from shape_key_pruning.json"""
+    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    json_path = os.path.join(addon_dir, "shape_key_pruning.json")
+
+    try:
+        with open(json_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Warning: shape_key_pruning.json not found at {json_path}")
+        return {}
+    except json.JSONDecodeError:
+        print(f"Error: Could not parse shape_key_pruning.json")
+        return {}
+
+def read_shape_key_positions(key_block, vertex_count):
+    import numpy as np
+
+    positions = np.empty(vertex_count * 3, dtype=np.float32)
+    key_block.data.foreach_get("co", positions)
+    return positions.reshape(-1, 3)
+
+def estimate_morph_size(mesh, threshold):
+    """Estimated FBX size in bytes of all shape keys: only vertices that move more than threshold are stored"""
+    import numpy as np
+
+    shape_keys = mesh.data.shape_keys
+    if not shape_keys:
+        return 0
+
+    vertex_count = len(mesh.data.vertices)
+    basis = read_shape_key_positions(shape_keys.reference_key, vertex_count)
+    moved_vertices = 0
+    for key_block in shape_keys.key_blocks:
+        if key_block == shape_keys.reference_key:
+            continue
+        delta = read_shape_key_positions(key_block, vertex_count) - basis
+        moved_vertices += int((np.abs(delta).max(axis=1) > threshold).sum())
+    return moved_vertices * FBX_BYTES_PER_MORPH_VERTEX
+
+def removed_morph_group_patterns(morph_groups, lod_number):
+    """Compiled name patterns of the morph groups that are dropped on this LOD"""
+    return [
+        re.compile(group["pattern"])
+        for group in morph_groups
+        if lod_number >= group.get("min_lod", 0)
+    ]
+
+def prune_shape_keys(mesh, threshold, morph_groups=()):
+    """Remove shape keys that barely move the mesh or belong to a dropped morph group, and snap tiny deltas to zero.
+
+    Returns (removed key count, estimated size before, estimated size after).
+    """
+    import numpy as np
+
+    shape_keys = mesh.data.shape_keys
+    if not shape_keys:
+        return 0, 0, 0
+
+    size_before = estimate_morph_size(mesh, 0.0)
+    patterns = removed_morph_group_patterns(morph_groups, get_lod_number(mesh))
+
+    vertex_count = len(mesh.data.vertices)
+    basis = read_shape_key_positions(shape_keys.reference_key, vertex_count)
+    keys_to_remove = []
+    for key_block in shape_keys.key_blocks:
+        if key_block == shape_keys.reference_key:
+            continue
+        if any(pattern.search(key_block.name) for pattern in patterns):
+            keys_to_remove.append(key_block.name)
+            continue
+
+        positions = read_shape_key_positions(key_block, vertex_count)
+        delta = positions - basis
+        small = np.abs(delta).max(axis=1) <= threshold
+        if small.all():
+            keys_to_remove.append(key_block.name)
+            continue
+
+        # Snap sub-threshold deltas back onto the basis so FBX does not store them
+        if small.any():
+            positions[small] = basis[small]
+            key_block.data.foreach_set("co", positions.ravel())
+
+    for key_name in keys_to_remove:
+        mesh.shape_key_remove(shape_keys.key_blocks[key_name])
+
+    # Removing the last non-basis key leaves only the basis, which exports as nothing
+    if mesh.data.shape_keys and len(mesh.data.shape_keys.key_blocks) == 1:
+        mesh.shape_key_clear()
+
+    size_after = estimate_morph_size(mesh, 0.0)
+    mesh.data.update()
+    print(f"{mesh.name}: removed {len(keys_to_remove)} shape key(s), morph data {size_before / 1024:.1f} KB -> {size_after / 1024:.1f} KB")
+    return len(keys_to_remove), size_before, size_after
+
+class PruneShapeKeysOperator(bpy.types.Operator):
+    bl_idname = "object.prune_shape_keys"
+    bl_label = "Prune Shape Keys"
+    bl_description = "Removes shape keys that barely move the mesh, zeroes tiny per-vertex deltas and drops morph groups on lower LODs (shape_key_pruning.json)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure a mesh object is selected
+        mesh = context.object
+        if not mesh or mesh.type != 'MESH':
+            self.report({'ERROR'}, "Please select a mesh object.")
+            return {'CANCELLED'}
+
+        config = load_shape_key_pruning()
+        threshold = config.get("delta_threshold", 0.0001)
+        morph_groups = config.get("morph_groups", [])
+
+        # Find all LOD meshes if enabled
+        meshes_to_process = []
+        if settings.bAutoLookForLOD:
+            meshes_to_process = find_all_lod_meshes(mesh)
+            if len(meshes_to_process) > 1:
+                self.report({'INFO'}, f"Found {len(meshes_to_process)} LOD meshes to process")
+        else:
+            meshes_to_process = [mesh]
+
+        # Process each mesh
+        total = len(meshes_to_process)
+        removed_total = 0
+        size_before_total = 0
+        size_after_total = 0
+        for idx, target_mesh in enumerate(meshes_to_process):
+            print(f"\n=== Processing {target_mesh.name} ({idx + 1}/{total}) ===")
+            removed, size_before, size_after = prune_shape_keys(target_mesh, threshold, morph_groups)
+            removed_total += removed
+            size_before_total += size_before
+            size_after_total += size_after
+
+        self.report({'INFO'}, f"All done! Removed {removed_total} shape key(s), morph data "
+                              f"{size_before_total / 1048576:.2f} MB -> {size_after_total / 1048576:.2f} MB")
+        return {'FINISHED'}
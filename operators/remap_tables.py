@@ -0,0 +1,125 @@
+import bpy
+import json
+import os
+
+REMAP_TABLES_VERSION = 1
+
+# Contents of metahuman_remap_tables.json, loaded on first use
+_remap_tables = None
+
+def remap_tables_path():
+    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    return os.path.join(addon_dir, "metahuman_remap_tables.json")
+
+def load_remap_tables():
+    """Load the precomputed remap tables from metahuman_remap_tables.json, once per session"""
+    global _remap_tables
+    if _remap_tables is not None:
+        return _remap_tables
+
+    json_path = remap_tables_path()
+    try:
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        print(f"Warning: metahuman_remap_tables.json not found at {json_path}")
+        data = {}
+    except json.JSONDecodeError:
+        print(f"Error: Could not parse metahuman_remap_tables.json")
+        data = {}
+
+    if data.get("version", REMAP_TABLES_VERSION) != REMAP_TABLES_VERSION:
+        print(f"Warning: Ignoring remap tables of version {data.get('version')}, expected {REMAP_TABLES_VERSION}")
+        data = {}
+    _remap_tables = data.get("tables", {})
+    return _remap_tables
+
+def armature_skeleton_hash(armature):
+    """Skeleton hash of an armature object, computed once per bone tree along with its cached hierarchy"""
+    from .armature_hierarchy import get_skeleton_hash
+
+    return get_skeleton_hash(armature)
+
+def find_stored_remap(armature, table_name, targets):
+    """The precomputed map of a table if the armature is the skeleton it was made for, else None"""
+    from ..core.remap import find_remap_table
+
+    tables = load_remap_tables()
+    if table_name not in tables:
+        return None
+    remap = find_remap_table(tables, table_name, armature_skeleton_hash(armature), targets)
+    if remap is None:
+        print(f"{armature.name} does not match the precomputed '{table_name}' table, walking the bone hierarchy")
+    return remap
+
+def save_remap_tables(tables):
+    """Write the tables to metahuman_remap_tables.json and use them for the rest of the session"""
+    global _remap_tables
+
+    with open(remap_tables_path(), 'w') as f:
+        json.dump({"version": REMAP_TABLES_VERSION, "tables": tables}, f, indent=4)
+    _remap_tables = tables
+
+def build_remap_tables(armature):
+    """The face bone collapse and keep-list fold tables of an armature object"""
+    from ..core.remap import build_remap_table
+    from .armature_hierarchy import get_armature_hierarchy
+    from .cleanup_bone_weights import COLLAPSE_TARGETS
+    from .in_place_conversion import load_bone_keep_list
+
+    hierarchy = get_armature_hierarchy(armature)
+    signature = armature_skeleton_hash(armature)
+    bones_to_keep = load_bone_keep_list()
+    return {
+        "face_collapse": build_remap_table(signature, COLLAPSE_TARGETS, hierarchy.nearest_ancestor_map(COLLAPSE_TARGETS)),
+        "keep_list_fold": build_remap_table(signature, bones_to_keep, hierarchy.nearest_ancestor_map(bones_to_keep)),
+    }
+
+def generate_remap_tables(source_path, armature_name=None):
+    """Build and save the remap tables from an armature in a .blend file, without opening it.
+
+    Meant for background Blender. Only the armature data is appended; armature_name
+    picks one by name, by default the one with the most bones. Returns the tables.
+    """
+    with bpy.data.libraries.load(source_path, link=False) as (data_from, data_to):
+        data_to.armatures = [name for name in data_from.armatures if armature_name in (None, name)]
+    if not data_to.armatures:
+        raise ValueError(f"No armature '{armature_name}' in {source_path}" if armature_name else f"No armature in {source_path}")
+
+    armature_data = max(data_to.armatures, key=lambda data: len(data.bones))
+    armature = bpy.data.objects.new(armature_data.name, armature_data)
+    # The appended data can take the name of an armature whose hierarchy is still cached
+    from .armature_hierarchy import invalidate_armature_hierarchy
+    invalidate_armature_hierarchy(armature)
+    try:
+        tables = build_remap_tables(armature)
+    finally:
+        bpy.data.objects.remove(armature)
+    save_remap_tables(tables)
+    for table_name, table in tables.items():
+        print(f"Saved '{table_name}' table with {len(table['map'])} entries for skeleton {table['skeleton_hash']}")
+    return tables
+
+class SaveRemapTablesOperator(bpy.types.Operator):
+    bl_idname = "object.save_remap_tables"
+    bl_label = "Save Remap Tables"
+    bl_description = "Precomputes the face bone collapse and keep-list fold maps of the selected standard MetaHuman armature and stores them in metahuman_remap_tables.json"
+
+    def execute(self, context):
+        # Ensure an armature is selected
+        armature = context.object
+        if not armature or armature.type != 'ARMATURE':
+            self.report({'ERROR'}, "Please select an armature.")
+            return {'CANCELLED'}
+
+        # Bones may have been edited by hand since the hierarchy was cached
+        from .armature_hierarchy import invalidate_armature_hierarchy
+        invalidate_armature_hierarchy(armature)
+
+        tables = build_remap_tables(armature)
+        save_remap_tables(tables)
+        for table_name, table in tables.items():
+            print(f"Saved '{table_name}' table with {len(table['map'])} entries for skeleton {table['skeleton_hash']}")
+
+        self.report({'INFO'}, f"All done! Saved remap tables for {armature.name} ({len(armature.data.bones)} bones)")
+        return {'FINISHED'}
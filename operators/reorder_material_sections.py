@@ -0,0 +1,115 @@
+import bpy
+import json
+import os
+from .lod_meshes import find_all_lod_meshes
+
+def load_section_order():
+    """Load the canonical material section order from material_section_order.json"""
+    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    json_path = os.path.join(addon_dir, "material_section_order.json")
+
+    try:
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+            return data.get("section_order", [])
+    except FileNotFoundError:
+        print(f"Warning: material_section_order.json not found at {json_path}")
+        return []
+    except json.JSONDecodeError:
+        print(f"Error: Could not parse material_section_order.json")
+        return []
+
+def section_rank(material_name, section_order):
+    """Position of a material in the canonical order, matching 'name.001' style duplicates too"""
+    lowered = material_name.lower()
+    for rank, name in enumerate(section_order):
+        if lowered == name.lower() or lowered.startswith(name.lower() + "."):
+            return rank
+    return None
+
+def has_ordered_sections(mesh, section_order):
+    """Check whether any material of the mesh is part of the canonical order"""
+    return any(
+        material and section_rank(material.name, section_order) is not None
+        for material in mesh.data.materials
+    )
+
+def reorder_material_sections(mesh, section_order):
+    """Sort the mesh's materials into the canonical order and remap every polygon to its new slot.
+
+    Materials not in the order keep their relative order after the known ones.
+    Returns True if anything moved.
+    """
+    import numpy as np
+
+    materials = list(mesh.data.materials)
+    ranks = [section_rank(material.name, section_order) if material else None for material in materials]
+    unknown_rank = len(section_order)
+    new_order = sorted(range(len(materials)), key=lambda i: (unknown_rank if ranks[i] is None else ranks[i], i))
+    if new_order == list(range(len(materials))):
+        return False
+
+    if any(slot.link == 'OBJECT' for slot in mesh.material_slots):
+        print(f"Warning: {mesh.name} has object-linked material slots, they are not reordered")
+        return False
+
+    # old slot index -> new slot index
+    remap = np.empty(len(materials), dtype=np.int32)
+    remap[new_order] = np.arange(len(materials), dtype=np.int32)
+
+    polygons = mesh.data.polygons
+    material_indices = np.empty(len(polygons), dtype=np.int32)
+    polygons.foreach_get("material_index", material_indices)
+
+    mesh.data.materials.clear()
+    for i in new_order:
+        mesh.data.materials.append(materials[i])
+
+    # Indices past the last slot stay as they are, Blender treats them as the last slot anyway
+    in_range = material_indices < len(materials)
+    material_indices[in_range] = remap[material_indices[in_range]]
+    polygons.foreach_set("material_index", material_indices)
+    mesh.data.update()
+
+    print(f"Reordered sections of {mesh.name}: {[materials[i].name if materials[i] else '' for i in new_order]}")
+    return True
+
+class ReorderMaterialSectionsOperator(bpy.types.Operator):
+    bl_idname = "object.reorder_material_sections"
+    bl_label = "Reorder Material Sections"
+    bl_description = "Sorts the material slots of the selected mesh and its LODs into the order from material_section_order.json"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure a mesh object is selected
+        mesh = context.object
+        if not mesh or mesh.type != 'MESH':
+            self.report({'ERROR'}, "Please select a mesh object.")
+            return {'CANCELLED'}
+
+        section_order = load_section_order()
+        if not section_order:
+            self.report({'ERROR'}, "No material section order found.")
+            return {'CANCELLED'}
+
+        # Find all LOD meshes if enabled
+        meshes_to_process = []
+        if settings.bAutoLookForLOD:
+            meshes_to_process = find_all_lod_meshes(mesh)
+            if len(meshes_to_process) > 1:
+                self.report({'INFO'}, f"Found {len(meshes_to_process)} LOD meshes to process")
+        else:
+            meshes_to_process = [mesh]
+
+        # Process each mesh
+        total = len(meshes_to_process)
+        reordered = 0
+        for idx, target_mesh in enumerate(meshes_to_process):
+            print(f"\n=== Processing {target_mesh.name} ({idx + 1}/{total}) ===")
+            if reorder_material_sections(target_mesh, section_order):
+                reordered += 1
+
+        self.report({'INFO'}, f"All done! Reordered {reordered} of {total} mesh(es)")
+        return {'FINISHED'}
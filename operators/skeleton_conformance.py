@@ -0,0 +1,138 @@
+import bpy
+import os
+import time
+
+DEFAULT_SKELETON_PROFILE = "default"
+
+# Custom property on a converted armature: outcome of the last conformance check of In Place Conversion
+CONFORMANCE_PROPERTY = "mh2m_skeleton_conformance"
+
+def reference_skeleton_path(profile=""):
+    """Where the reference skeleton of a keep-list profile is stored, inside the add-on's reference_skeletons folder"""
+    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    return os.path.join(addon_dir, "reference_skeletons", f"{bpy.path.clean_name(profile or DEFAULT_SKELETON_PROFILE)}.npz")
+
+def capture_skeleton(armature):
+    """Bone names, parent indices and armature-space rest matrices of an armature as arrays"""
+    import numpy as np
+
+    bones = armature.data.bones
+    names = bones.keys()
+    index = {name: i for i, name in enumerate(names)}
+    parents = np.array([index[bone.parent.name] if bone.parent else -1 for bone in bones], dtype=np.int32)
+
+    # Matrices come out of foreach_get column-major, transpose them to row-major
+    rest = np.empty(len(bones) * 16, dtype=np.float32)
+    bones.foreach_get("matrix_local", rest)
+    rest = rest.reshape(-1, 4, 4).transpose(0, 2, 1)
+    return {"armature": armature.name, "names": names, "parents": parents, "rest": rest}
+
+def save_reference_skeleton(skeleton, filepath):
+    import numpy as np
+
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    np.savez_compressed(
+        filepath,
+        armature=np.array(skeleton["armature"]),
+        names=np.array(skeleton["names"], dtype=str),
+        parents=skeleton["parents"],
+        rest=skeleton["rest"],
+    )
+
+def load_reference_skeleton(filepath):
+    import numpy as np
+
+    with np.load(filepath) as data:
+        return {
+            "armature": str(data["armature"]),
+            "names": data["names"].tolist(),
+            "parents": data["parents"],
+            "rest": data["rest"],
+        }
+
+def check_skeleton_conformance(armature, profile=""):
+    """Compare an armature with the stored reference skeleton of a profile. Returns the report, or None without reference"""
+    from ..core.skeleton import compare_skeletons
+
+    filepath = reference_skeleton_path(profile)
+    if not os.path.exists(filepath):
+        print(f"No reference skeleton at {filepath}")
+        return None
+
+    start = time.perf_counter()
+    report = compare_skeletons(load_reference_skeleton(filepath), capture_skeleton(armature))
+    print(f"Checked {armature.name} against {os.path.basename(filepath)} in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return report
+
+def record_conformance(armature, report, profile=""):
+    """Store the outcome of a conformance check on the armature, so batch scripts can reject it.
+
+    A missing reference counts as a failure: the armature could not be verified.
+    Returns True if the armature passed.
+    """
+    from ..core.skeleton import format_conformance
+
+    if report is None:
+        passed = False
+        summary = f"No reference skeleton at {reference_skeleton_path(profile)}, save one with Save Reference Skeleton"
+    else:
+        passed = report["passed"]
+        summary = format_conformance(report).splitlines()[0]
+    armature[CONFORMANCE_PROPERTY] = {"passed": passed, "summary": summary}
+    return passed
+
+def conformance_failure(armature):
+    """Summary of the failed conformance check recorded on the armature, or None if it passed or was not checked"""
+    status = armature.get(CONFORMANCE_PROPERTY)
+    if status is None or status["passed"]:
+        return None
+    return status["summary"]
+
+class SaveReferenceSkeletonOperator(bpy.types.Operator):
+    bl_idname = "object.save_reference_skeleton"
+    bl_label = "Save Reference Skeleton"
+    bl_description = "Stores the bone names, parents and rest matrices of the selected armature (a known good Manny) as the reference skeleton of the current profile"
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure an armature is selected
+        armature = context.object
+        if not armature or armature.type != 'ARMATURE':
+            self.report({'ERROR'}, "Please select an armature.")
+            return {'CANCELLED'}
+
+        filepath = reference_skeleton_path(settings.SkeletonProfile)
+        save_reference_skeleton(capture_skeleton(armature), filepath)
+        print(f"Saved reference skeleton of {armature.name} to {filepath}")
+
+        self.report({'INFO'}, f"All done! Saved {len(armature.data.bones)} bones to {filepath}")
+        return {'FINISHED'}
+
+class CheckSkeletonConformanceOperator(bpy.types.Operator):
+    bl_idname = "object.check_skeleton_conformance"
+    bl_label = "Check Skeleton"
+    bl_description = "Compares the selected armature with the reference skeleton of the current profile and reports missing or extra bones, wrong parents and rest pose differences"
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure an armature is selected
+        armature = context.object
+        if not armature or armature.type != 'ARMATURE':
+            self.report({'ERROR'}, "Please select an armature.")
+            return {'CANCELLED'}
+
+        report = check_skeleton_conformance(armature, settings.SkeletonProfile)
+        if report is None:
+            self.report({'ERROR'}, "No reference skeleton saved for this profile.")
+            return {'CANCELLED'}
+
+        from ..core.skeleton import format_conformance
+
+        print(format_conformance(report))
+        if report["passed"]:
+            self.report({'INFO'}, f"All done! {armature.name} matches the reference skeleton")
+        else:
+            self.report({'WARNING'}, f"{armature.name} does not match the reference skeleton, see the console")
+        return {'FINISHED'}
@@ -0,0 +1,189 @@
+import bpy
+import csv
+import json
+import os
+from ..core.reduction import budget_for_lod
+from .lod_bone_reduction import load_bone_budgets
+from .lod_meshes import find_all_lod_meshes, get_lod_number
+
+MAX_INFLUENCES = 12
+
+# Custom property on a reported mesh: whether it was within its bone budget at its last skinning report
+SKINNING_PROPERTY = "mh2m_skinning_report"
+
+def influence_slots(max_influences):
+    """Unreal skins every vertex of a section with a fixed number of influences: 4, 8 or 12"""
+    for slots in (4, 8, MAX_INFLUENCES):
+        if max_influences <= slots:
+            return slots
+    return MAX_INFLUENCES
+
+def section_vertex_masks(mesh):
+    """One boolean vertex mask per material section"""
+    import numpy as np
+
+    data = mesh.data
+    material_indices = np.empty(len(data.polygons), dtype=np.int32)
+    data.polygons.foreach_get("material_index", material_indices)
+    loop_totals = np.empty(len(data.polygons), dtype=np.int32)
+    data.polygons.foreach_get("loop_total", loop_totals)
+    loop_vertices = np.empty(len(data.loops), dtype=np.int32)
+    data.loops.foreach_get("vertex_index", loop_vertices)
+
+    # Polygons store their loops contiguously, so repeating the material per loop lines them up
+    loop_materials = np.repeat(material_indices, loop_totals)
+    section_count = max(len(mesh.material_slots), int(material_indices.max(initial=0)) + 1)
+
+    masks = np.zeros((section_count, len(data.vertices)), dtype=bool)
+    masks[loop_materials, loop_vertices] = True
+    return masks
+
+def skinning_report(mesh, budget=None, min_weight=1e-6, bone_names=None):
+    """Skinning statistics of a single mesh as a plain dict.
+
+    Only vertex groups named after a bone in bone_names count as influences (default:
+    the bones of the armature deforming the mesh, or every group without one), since
+    helper groups are not skinned.
+    """
+    import numpy as np
+    from .deformation_qa import find_mesh_armature
+    from .vertex_weights import read_weight_matrix
+
+    if bone_names is None:
+        armature = find_mesh_armature(mesh)
+        bone_names = set(armature.data.bones.keys()) if armature else None
+    group_names, weights = read_weight_matrix(mesh)
+    if bone_names is not None:
+        weights = weights[:, [i for i, name in enumerate(group_names) if name in bone_names]]
+    influences = weights > min_weight
+    per_vertex = influences.sum(axis=1)
+
+    # Index 0 counts unweighted vertices, the last bucket everything at or above MAX_INFLUENCES
+    histogram = np.bincount(np.minimum(per_vertex, MAX_INFLUENCES), minlength=MAX_INFLUENCES + 1)
+    bone_count = int(influences.any(axis=0).sum())
+
+    sections = []
+    skinning_cost = 0
+    for section_index, mask in enumerate(section_vertex_masks(mesh)):
+        vertex_count = int(mask.sum())
+        if not vertex_count:
+            continue
+        max_influences = int(per_vertex[mask].max())
+        slots = influence_slots(max_influences)
+        cost = vertex_count * slots
+        skinning_cost += cost
+
+        slot = mesh.material_slots[section_index] if section_index < len(mesh.material_slots) else None
+        sections.append({
+            "section": section_index,
+            "material": slot.name if slot else "",
+            "vertices": vertex_count,
+            "bones": int(influences[mask].any(axis=0).sum()),
+            "max_influences": max_influences,
+            "skinning_cost": cost,
+        })
+
+    return {
+        "mesh": mesh.name,
+        "lod": get_lod_number(mesh),
+        "vertices": len(mesh.data.vertices),
+        "bones": bone_count,
+        "bone_budget": budget,
+        "within_budget": budget is None or bone_count <= budget,
+        "unweighted_vertices": int(histogram[0]),
+        "influence_histogram": histogram[1:].tolist(),
+        "total_influences": int(per_vertex.sum()),
+        "skinning_cost": skinning_cost,
+        "sections": sections,
+    }
+
+def record_skinning_report(mesh, report):
+    """Store whether the mesh is within its bone budget, so batch scripts can reject it. Returns True if it is"""
+    summary = f"{report['bones']} bones, budget {report['bone_budget']}"
+    mesh[SKINNING_PROPERTY] = {"passed": report["within_budget"], "summary": summary}
+    return report["within_budget"]
+
+def skinning_failure(mesh):
+    """Summary of the over-budget skinning report recorded on the mesh, or None if it was within budget or not reported"""
+    status = mesh.get(SKINNING_PROPERTY)
+    if status is None or status["passed"]:
+        return None
+    return status["summary"]
+
+def write_skinning_report(reports, filepath):
+    """Write the reports as JSON, or as CSV with one row per section if the path ends in .csv"""
+    if filepath.lower().endswith(".csv"):
+        with open(filepath, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow([
+                "mesh", "lod", "vertices", "bones", "bone_budget", "within_budget", "skinning_cost",
+                *[f"influences_{i}" for i in range(1, MAX_INFLUENCES + 1)],
+                "section", "material", "section_vertices", "section_bones", "section_max_influences", "section_skinning_cost",
+            ])
+            for report in reports:
+                mesh_columns = [
+                    report["mesh"], report["lod"], report["vertices"], report["bones"], report["bone_budget"],
+                    report["within_budget"], report["skinning_cost"], *report["influence_histogram"],
+                ]
+                for section in report["sections"] or [{}]:
+                    writer.writerow(mesh_columns + [
+                        section.get("section"), section.get("material"), section.get("vertices"),
+                        section.get("bones"), section.get("max_influences"), section.get("skinning_cost"),
+                    ])
+    else:
+        with open(filepath, 'w') as f:
+            json.dump({"meshes": reports}, f, indent=4)
+
+class SkinningReportOperator(bpy.types.Operator):
+    bl_idname = "object.skinning_report"
+    bl_label = "Skinning Report"
+    bl_description = "Reports vertex count, influencing bones, influence histogram, bones per section and estimated skinning cost of every LOD"
+
+    filepath: bpy.props.StringProperty(
+        name="Report File",
+        description="Where to write the report (.json or .csv). Leave empty to only print it",
+        default="//skinning_report.json",
+        subtype='FILE_PATH'
+    )
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure a mesh object is selected
+        mesh = context.object
+        if not mesh or mesh.type != 'MESH':
+            self.report({'ERROR'}, "Please select a mesh object.")
+            return {'CANCELLED'}
+
+        # Find all LOD meshes if enabled
+        meshes_to_process = []
+        if settings.bAutoLookForLOD:
+            meshes_to_process = find_all_lod_meshes(mesh)
+        else:
+            meshes_to_process = [mesh]
+
+        budgets = load_bone_budgets()
+        reports = []
+        for target_mesh in sorted(meshes_to_process, key=get_lod_number):
+            budget = budget_for_lod(budgets, get_lod_number(target_mesh))
+            report = skinning_report(target_mesh, budget)
+            record_skinning_report(target_mesh, report)
+            reports.append(report)
+            print(f"{report['mesh']}: {report['vertices']} vertices, {report['bones']} bones (budget {budget}), "
+                  f"cost {report['skinning_cost']}, influences {report['influence_histogram']}")
+            for section in report["sections"]:
+                print(f"  Section {section['section']} ({section['material']}): {section['vertices']} vertices, "
+                      f"{section['bones']} bones, up to {section['max_influences']} influences")
+
+        if self.filepath:
+            filepath = bpy.path.abspath(self.filepath)
+            os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+            write_skinning_report(reports, filepath)
+            print(f"Wrote skinning report to {filepath}")
+
+        over_budget = [report["mesh"] for report in reports if not report["within_budget"]]
+        if over_budget:
+            self.report({'WARNING'}, f"Over bone budget: {', '.join(over_budget)}")
+        else:
+            self.report({'INFO'}, f"All done! Reported {len(reports)} mesh(es)")
+        return {'FINISHED'}
@@ -0,0 +1,152 @@
+import bpy
+import fnmatch
+import json
+import os
+from .lod_meshes import find_all_lod_meshes
+
+# Rough per-element sizes used for the savings report: (bytes in memory, bytes in the FBX file)
+UV_BYTES_PER_LOOP = (8, 2 * 8 + 4)
+COLOR_BYTES_PER_ELEMENT = {'FLOAT_COLOR': (16, 4 * 8 + 4), 'BYTE_COLOR': (4, 4 * 8 + 4)}
+CUSTOM_NORMAL_BYTES_PER_LOOP = (4, 0)  # Normals are exported either way
+FBX_BYTES_PER_EMPTY_CLUSTER = 300  # Deformer cluster with its two bind matrices
+
+def load_slimming_profile(profile_name=""):
+    """Load one profile from slimming_profiles.json, or the default one if no name is given"""
+    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    json_path = os.path.join(addon_dir, "slimming_profiles.json")
+
+    try:
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        print(f"Warning: slimming_profiles.json not found at {json_path}")
+        return None
+    except json.JSONDecodeError:
+        print(f"Error: Could not parse slimming_profiles.json")
+        return None
+
+    profile_name = profile_name or data.get("default_profile", "")
+    profile = data.get("profiles", {}).get(profile_name)
+    if profile is None:
+        print(f"Error: Slimming profile '{profile_name}' not found")
+    return profile
+
+def matches_any(name, patterns):
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+def remove_custom_properties(id_data, keep_patterns):
+    """Delete custom properties of an object or mesh that are not whitelisted. Returns how many were removed"""
+    registered = type(id_data).bl_rna.properties
+    keys_to_remove = [
+        key for key in id_data.keys()
+        if key not in registered and not matches_any(key, keep_patterns)
+    ]
+    for key in keys_to_remove:
+        del id_data[key]
+    return len(keys_to_remove)
+
+def slim_mesh(context, obj, profile):
+    """Strip the data Unreal does not need from a mesh. Returns (summary, memory bytes saved, FBX bytes saved)"""
+    mesh = obj.data
+    loop_count = len(mesh.loops)
+    removed = []
+    memory_saved = 0
+    fbx_saved = 0
+
+    # UV maps: keep whitelisted names and the first max_uv_maps
+    keep_uv_maps = profile.get("keep_uv_maps", [])
+    max_uv_maps = profile.get("max_uv_maps", 1)
+    uv_maps_to_remove = [
+        uv_map.name for index, uv_map in enumerate(mesh.uv_layers)
+        if index >= max_uv_maps and not matches_any(uv_map.name, keep_uv_maps)
+    ]
+    for uv_name in uv_maps_to_remove:
+        mesh.uv_layers.remove(mesh.uv_layers[uv_name])
+        memory_saved += loop_count * UV_BYTES_PER_LOOP[0]
+        fbx_saved += loop_count * UV_BYTES_PER_LOOP[1]
+    if uv_maps_to_remove:
+        removed.append(f"{len(uv_maps_to_remove)} UV map(s)")
+
+    # Color attributes
+    keep_colors = profile.get("keep_color_attributes", [])
+    colors_to_remove = [attr.name for attr in mesh.color_attributes if not matches_any(attr.name, keep_colors)]
+    for color_name in colors_to_remove:
+        attr = mesh.color_attributes[color_name]
+        element_count = len(attr.data)
+        memory_bytes, fbx_bytes = COLOR_BYTES_PER_ELEMENT.get(attr.data_type, COLOR_BYTES_PER_ELEMENT['FLOAT_COLOR'])
+        memory_saved += element_count * memory_bytes
+        fbx_saved += loop_count * fbx_bytes
+        mesh.color_attributes.remove(attr)
+    if colors_to_remove:
+        removed.append(f"{len(colors_to_remove)} color attribute(s)")
+
+    # Custom split normals
+    if mesh.has_custom_normals and not profile.get("keep_custom_normals", False):
+        with context.temp_override(object=obj, active_object=obj):
+            bpy.ops.mesh.customdata_custom_splitnormals_clear()
+        memory_saved += loop_count * CUSTOM_NORMAL_BYTES_PER_LOOP[0]
+        fbx_saved += loop_count * CUSTOM_NORMAL_BYTES_PER_LOOP[1]
+        removed.append("custom normals")
+
+    # Empty vertex groups
+    if profile.get("remove_empty_vertex_groups", True):
+        from .vertex_weights import find_empty_groups
+
+        empty_groups = find_empty_groups(obj)
+        for group_name in empty_groups:
+            obj.vertex_groups.remove(obj.vertex_groups[group_name])
+        fbx_saved += len(empty_groups) * FBX_BYTES_PER_EMPTY_CLUSTER
+        if empty_groups:
+            removed.append(f"{len(empty_groups)} empty vertex group(s)")
+
+    # Custom properties on the object and its mesh data
+    keep_properties = profile.get("keep_custom_properties", [])
+    property_count = remove_custom_properties(obj, keep_properties) + remove_custom_properties(mesh, keep_properties)
+    if property_count:
+        removed.append(f"{property_count} custom properties")
+
+    summary = ", ".join(removed) if removed else "nothing to remove"
+    return summary, memory_saved, fbx_saved
+
+class SlimForExportOperator(bpy.types.Operator):
+    bl_idname = "object.slim_for_export"
+    bl_label = "Slim For Export"
+    bl_description = "Removes UV maps, color attributes, custom normals, custom properties and empty vertex groups Unreal does not need (slimming_profiles.json)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure a mesh object is selected
+        mesh = context.object
+        if not mesh or mesh.type != 'MESH':
+            self.report({'ERROR'}, "Please select a mesh object.")
+            return {'CANCELLED'}
+
+        profile = load_slimming_profile(settings.SlimmingProfile)
+        if profile is None:
+            self.report({'ERROR'}, f"Slimming profile '{settings.SlimmingProfile}' not found.")
+            return {'CANCELLED'}
+
+        # Find all LOD meshes if enabled
+        meshes_to_process = []
+        if settings.bAutoLookForLOD:
+            meshes_to_process = find_all_lod_meshes(mesh)
+            if len(meshes_to_process) > 1:
+                self.report({'INFO'}, f"Found {len(meshes_to_process)} LOD meshes to process")
+        else:
+            meshes_to_process = [mesh]
+
+        # Process each mesh
+        total = len(meshes_to_process)
+        memory_total = 0
+        fbx_total = 0
+        for idx, target_mesh in enumerate(meshes_to_process):
+            print(f"\n=== Processing {target_mesh.name} ({idx + 1}/{total}) ===")
+            summary, memory_saved, fbx_saved = slim_mesh(context, target_mesh, profile)
+            memory_total += memory_saved
+            fbx_total += fbx_saved
+            print(f"{target_mesh.name}: {summary}; saved ~{memory_saved / 1024:.1f} KB memory, ~{fbx_saved / 1024:.1f} KB FBX")
+
+        self.report({'INFO'}, f"All done! Saved ~{memory_total / 1048576:.2f} MB memory, ~{fbx_total / 1048576:.2f} MB FBX on {total} mesh(es)")
+        return {'FINISHED'}
@@ -0,0 +1,24 @@
+# mesh data name -> (geometry hash, mirror, mirrored rows)
+_symmetry_cache = {}
+
+def get_mesh_symmetry(mesh, tolerance=1e-4):
+    """Return (mirror, mirrored rows) for a mesh, built once per vertex layout.
+
+    mirror holds the partner vertex across the X = 0 plane (-1 where there is no
+    exact partner) and mirrored rows the vertices on the -X side that have one.
+    """
+    from ..core.symmetry import build_symmetry_map, mirrored_vertices
+    from .propagate_lod_weights import geometry_hash, read_vertex_positions
+
+    positions = read_vertex_positions(mesh)
+    positions_hash = geometry_hash(positions)
+    cached = _symmetry_cache.get(mesh.data.name_full)
+    if cached and cached[0] == positions_hash:
+        return cached[1], cached[2]
+
+    mirror = build_symmetry_map(positions, tolerance)
+    mirrored_rows = mirrored_vertices(positions, mirror, tolerance)
+    fallback_count = len(mirror) - len(mirrored_rows) * 2
+    print(f"Symmetry map for {mesh.name}: {len(mirrored_rows)} mirrored vertices, {fallback_count} processed directly")
+    _symmetry_cache[mesh.data.name_full] = (positions_hash, mirror, mirrored_rows)
+    return mirror, mirrored_rows
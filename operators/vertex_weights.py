@@ -0,0 +1,242 @@
+import bpy
+import numpy as np
+from ..core.naming import mirror_group_name
+from ..core.symmetry import mirror_target_columns
+from ..core.weights import (
+    chunk_rows,
+    compact_order,
+    fold_weights,
+    sparse_influences,
+    split_by_weight,
+    used_columns,
+)
+
+DEFAULT_WEIGHT_MEMORY_BUDGET_MB = 256
+
+# Largest weight working set (bytes) recorded since the last reset, for the memory report
+_weight_memory_peak = 0
+
+def weight_memory_budget():
+    """Bytes a dense weight chunk may use, from the Weight Memory Budget setting (in MB)"""
+    scene = bpy.context.scene
+    settings = getattr(scene, "metahuman_to_manny_settings", None) if scene else None
+    megabytes = settings.WeightMemoryBudget if settings else DEFAULT_WEIGHT_MEMORY_BUDGET_MB
+    return megabytes * 1024 * 1024
+
+def track_weight_memory(*arrays):
+    """Record the combined size of arrays that are held at the same time.
+
+    The peak is the largest single record, not a live total across calls: every
+    caller passes all the weight buffers it keeps alive at that point, including
+    whole-mesh ones such as the mirrored fold's target columns.
+    """
+    global _weight_memory_peak
+    _weight_memory_peak = max(_weight_memory_peak, sum(array.nbytes for array in arrays))
+
+def weight_memory_peak():
+    return _weight_memory_peak
+
+def reset_weight_memory_peak():
+    global _weight_memory_peak
+    _weight_memory_peak = 0
+
+def read_weight_matrix(obj, rows=None):
+    """Read all vertex group weights of a mesh into a dense (vertices x groups) float32 array.
+
+    Returns (group_names, weights). Column i of weights belongs to group_names[i].
+    With rows given, only those vertex indices are read and all other rows stay zero.
+    """
+    group_names = [vg.name for vg in obj.vertex_groups]
+    vertices = obj.data.vertices
+    weights = np.zeros((len(vertices), len(group_names)), dtype=np.float32)
+
+    for v in (vertices if rows is None else (vertices[i] for i in rows)):
+        for g in v.groups:
+            weights[v.index, g.group] = g.weight
+
+    track_weight_memory(weights)
+    return group_names, weights
+
+def iter_weight_chunks(obj, rows=None, memory_budget=None):
+    """Read the vertex group weights of a mesh in dense (chunk vertices x groups) float32 blocks.
+
+    Yields (rows, weights) pairs, where rows holds the vertex index of every chunk
+    row. Each chunk stays within memory_budget bytes (default: weight_memory_budget()),
+    so the peak memory does not grow with the vertex count. With rows given, only
+    those vertex indices are read.
+    """
+    vertices = obj.data.vertices
+    group_count = len(obj.vertex_groups)
+    count = len(vertices) if rows is None else len(rows)
+    step = chunk_rows(group_count, memory_budget or weight_memory_budget())
+
+    for start in range(0, count, step):
+        if rows is None:
+            chunk = np.arange(start, min(start + step, count), dtype=np.int32)
+        else:
+            chunk = rows[start:start + step]
+        weights = np.zeros((len(chunk), group_count), dtype=np.float32)
+        for local, i in enumerate(chunk.tolist()):
+            for g in vertices[i].groups:
+                weights[local, g.group] = g.weight
+        track_weight_memory(chunk, weights)
+        yield chunk, weights
+
+def write_group_weights(vg, column, min_weight=1e-6, remove_empty=True, rows=None):
+    """Set a vertex group to the given per-vertex weights, removing vertices that drop to zero.
+
+    rows gives the vertex index of every entry of column; by default entry i is vertex i.
+    """
+    empty, chunks = split_by_weight(column, min_weight)
+    if rows is not None:
+        empty = rows[empty]
+        chunks = [(value, rows[chunk]) for value, chunk in chunks]
+    if remove_empty and len(empty):
+        vg.remove(empty.tolist())
+
+    # One add() call per distinct weight value instead of one per vertex
+    for value, chunk in chunks:
+        vg.add(chunk.tolist(), value, 'REPLACE')
+
+def write_weight_matrix(obj, group_names, weights, min_weight=1e-6):
+    """Replace all vertex groups of a mesh with the given names and dense weight array"""
+    obj.vertex_groups.clear()
+
+    for col, name in enumerate(group_names):
+        vg = obj.vertex_groups.new(name=name)
+        write_group_weights(vg, weights[:, col], min_weight, remove_empty=False)
+
+def fold_vertex_groups(obj, group_map, weight_data=None, symmetry=None, rows=None):
+    """Add the weights of every source group onto its target group and delete the sources, in one pass.
+
+    group_map maps source group names to target group names. Sources missing on the
+    mesh are ignored, missing targets are created. weight_data can pass in the result of
+    an earlier read_weight_matrix call on the unchanged mesh to skip reading it again;
+    otherwise the weights are read and written back chunk by chunk.
+    symmetry can pass in (mirror, mirrored rows) from get_mesh_symmetry: the mirrored
+    rows are then neither read nor folded, their target weights are mirrored from
+    their partner vertices instead. rows limits the chunked fold to these vertex
+    indices; the sources are still deleted, so only pass it when the sources carry no
+    weight outside those rows. Returns the number of folded groups.
+    """
+    group_map = {src: dst for src, dst in group_map.items() if src in obj.vertex_groups and src != dst}
+    if not group_map:
+        return 0
+
+    missing_targets = [name for name in set(group_map.values()) if name not in obj.vertex_groups]
+    for target_name in missing_targets:
+        obj.vertex_groups.new(name=target_name)
+
+    if weight_data is not None and not missing_targets and symmetry is None and rows is None:
+        group_names, weights = weight_data
+        targets, summed, _sources = fold_weights(group_names, weights, group_map)
+        for i, target_name in enumerate(targets):
+            write_group_weights(obj.vertex_groups[target_name], summed[:, i])
+    elif symmetry is None or rows is not None:
+        # Fold and write back one vertex chunk at a time; only the sources are removed at the end
+        group_names = [vg.name for vg in obj.vertex_groups]
+        for chunk, weights in iter_weight_chunks(obj, rows):
+            targets, summed, _sources = fold_weights(group_names, weights, group_map)
+            track_weight_memory(chunk, weights, summed)
+            for i, target_name in enumerate(targets):
+                write_group_weights(obj.vertex_groups[target_name], summed[:, i], rows=chunk)
+    else:
+        # Mirrored rows copy from partners anywhere on the mesh, so the target columns
+        # (and the unfolded groups they mirror from) are kept for all vertices
+        mirror, mirrored_rows = symmetry
+        group_names = [vg.name for vg in obj.vertex_groups]
+        column = {name: i for i, name in enumerate(group_names)}
+        targets = sorted(set(group_map.values()))
+        mirror_names = sorted(({mirror_group_name(name) for name in targets} - set(targets)) & set(column))
+        vertex_count = len(obj.data.vertices)
+        summed = np.zeros((vertex_count, len(targets)), dtype=np.float32)
+        mirror_weights = np.zeros((vertex_count, len(mirror_names)), dtype=np.float32)
+
+        read_rows = np.setdiff1d(np.arange(vertex_count, dtype=np.int32), mirrored_rows)
+        for rows, weights in iter_weight_chunks(obj, read_rows):
+            _targets, chunk_summed, _sources = fold_weights(group_names, weights, group_map)
+            summed[rows] = chunk_summed
+            mirror_weights[rows] = weights[:, [column[name] for name in mirror_names]]
+            track_weight_memory(read_rows, weights, chunk_summed, summed, mirror_weights)
+
+        mirror_target_columns(targets, summed, mirror_names, mirror_weights, mirror, mirrored_rows)
+        for i, target_name in enumerate(targets):
+            write_group_weights(obj.vertex_groups[target_name], summed[:, i])
+
+    sources = list(group_map)
+    for src in sources:
+        obj.vertex_groups.remove(obj.vertex_groups[src])
+    return len(sources)
+
+def find_used_groups(obj, min_weight=1e-6):
+    """Boolean mask of the vertex groups that influence at least one vertex, read chunk by chunk"""
+    used = np.zeros(len(obj.vertex_groups), dtype=bool)
+    for _rows, weights in iter_weight_chunks(obj):
+        used |= used_columns(weights, min_weight)
+    return used
+
+def count_active_groups(obj, min_weight=1e-6):
+    """Count the vertex groups that influence at least one vertex"""
+    return int(find_used_groups(obj, min_weight).sum())
+
+def find_empty_groups(obj, min_weight=1e-6, weight_data=None):
+    """Names of vertex groups that do not influence any vertex"""
+    if weight_data is not None:
+        group_names, weights = weight_data
+        used = used_columns(weights, min_weight)
+    else:
+        group_names = [vg.name for vg in obj.vertex_groups]
+        used = find_used_groups(obj, min_weight)
+    return [name for name, is_used in zip(group_names, used.tolist()) if not is_used]
+
+def read_sparse_influences(obj, min_weight=1e-6, rows=None):
+    """Read all influences above min_weight as compact arrays, chunk by chunk.
+
+    Returns (group_names, vertex_ids, group_ids, weights) with int32 vertex ids,
+    uint16 group ids (see group_id_dtype) and float32 weights, in vertex order.
+    With rows given (sorted), only those vertex indices are read.
+    """
+    group_names = [vg.name for vg in obj.vertex_groups]
+    influences = [sparse_influences(chunk, weights, min_weight) for chunk, weights in iter_weight_chunks(obj, rows)]
+    if not influences:
+        influences = [sparse_influences(np.zeros(0, dtype=np.int32), np.zeros((0, len(group_names)), dtype=np.float32))]
+    vertex_ids, group_ids, weights = (np.concatenate(parts) for parts in zip(*influences))
+    track_weight_memory(vertex_ids, group_ids, weights)
+    return group_names, vertex_ids, group_ids, weights
+
+def write_sparse_influences(obj, group_names, vertex_ids, group_ids, weights, order=None, min_weight=1e-6):
+    """Replace all vertex groups of a mesh with compact influences from read_sparse_influences.
+
+    order lists the group ids to create, in order (default: all groups as they are).
+    """
+    by_group = np.argsort(group_ids, kind='stable')
+    starts = np.searchsorted(group_ids[by_group], np.arange(len(group_names) + 1))
+    track_weight_memory(vertex_ids, group_ids, weights, by_group)
+
+    obj.vertex_groups.clear()
+    for i in (range(len(group_names)) if order is None else order):
+        vg = obj.vertex_groups.new(name=group_names[i])
+        entries = by_group[starts[i]:starts[i + 1]]
+        write_group_weights(vg, weights[entries], min_weight, remove_empty=False, rows=vertex_ids[entries])
+
+def compact_vertex_groups(obj, bone_order, min_weight=1e-6):
+    """Remove vertex groups without any weight and sort the rest into bone order, from a single weight read.
+
+    Groups that are not bones keep their relative order after the bone groups.
+    The weights are read chunk by chunk and kept as compact (vertex, group id, weight)
+    influences in case the groups have to be rewritten. Returns the number of removed groups.
+    """
+    group_names, vertex_ids, group_ids, weights = read_sparse_influences(obj, min_weight)
+    used = np.bincount(group_ids, minlength=len(group_names)) > 0
+    order, removed_count = compact_order(group_names, used, bone_order)
+
+    if order == sorted(order):
+        # Already in order, only drop the empty groups
+        kept = set(order)
+        for i, name in enumerate(group_names):
+            if i not in kept:
+                obj.vertex_groups.remove(obj.vertex_groups[name])
+        return removed_count
+
+    write_sparse_influences(obj, group_names, vertex_ids, group_ids, weights, order, min_weight)
+    return removed_count
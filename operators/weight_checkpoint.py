@@ -0,0 +1,87 @@
+import bpy
+
+def capture_weight_checkpoint(obj):
+    """Compact in-memory copy of a mesh's vertex groups, for rolling a failed step back.
+
+    Holds the group names and every non-zero influence as (int32 vertex, uint16
+    group id, float32 weight) arrays; zero weight memberships are not kept.
+    """
+    from .vertex_weights import read_sparse_influences
+
+    group_names, vertex_ids, group_ids, weights = read_sparse_influences(obj, min_weight=0.0)
+    return {
+        "vertex_count": len(obj.data.vertices),
+        "groups": group_names,
+        "vertex_ids": vertex_ids,
+        "group_ids": group_ids,
+        "weights": weights,
+    }
+
+def checkpoint_active_groups(checkpoint, min_weight=1e-6):
+    """Number of vertex groups with at least one influence above min_weight in a weight checkpoint"""
+    import numpy as np
+
+    return len(np.unique(checkpoint["group_ids"][checkpoint["weights"] > min_weight]))
+
+def checkpoint_size(checkpoint):
+    """Bytes held by a weight checkpoint's arrays"""
+    return sum(checkpoint[key].nbytes for key in ("vertex_ids", "group_ids", "weights"))
+
+def restore_weight_checkpoint(obj, checkpoint):
+    """Put a mesh's vertex groups back to the checkpoint. Returns False if the topology changed since"""
+    from .vertex_weights import write_sparse_influences
+
+    if len(obj.data.vertices) != checkpoint["vertex_count"]:
+        print(f"Cannot roll back {obj.name}: its vertex count changed from {checkpoint['vertex_count']} to {len(obj.data.vertices)}")
+        return False
+
+    write_sparse_influences(
+        obj, checkpoint["groups"], checkpoint["vertex_ids"], checkpoint["group_ids"], checkpoint["weights"], min_weight=0.0
+    )
+    print(f"Rolled back the vertex groups of {obj.name}")
+    return True
+
+def capture_bone_checkpoint(armature):
+    """Name, parent, rest transform and flags of every bone of an armature"""
+    return [
+        {
+            "name": bone.name,
+            "parent": bone.parent.name if bone.parent else None,
+            "head": bone.head_local.copy(),
+            "tail": bone.tail_local.copy(),
+            "matrix": bone.matrix_local.copy(),
+            "use_connect": bone.use_connect,
+            "use_deform": bone.use_deform,
+        }
+        for bone in armature.data.bones
+    ]
+
+def restore_bone_checkpoint(context, armature, checkpoint):
+    """Recreate the bones deleted since the checkpoint and restore all parent links. Returns the recreated bone count"""
+    from .armature_hierarchy import invalidate_armature_hierarchy
+
+    context.view_layer.objects.active = armature
+    bpy.ops.object.mode_set(mode='EDIT')
+    edit_bones = armature.data.edit_bones
+
+    recreated = 0
+    for entry in checkpoint:
+        if entry["name"] in edit_bones:
+            continue
+        edit_bone = edit_bones.new(entry["name"])
+        edit_bone.head = entry["head"]
+        edit_bone.tail = entry["tail"]
+        edit_bone.matrix = entry["matrix"]
+        edit_bone.use_deform = entry["use_deform"]
+        recreated += 1
+
+    # Deleting a bone re-parents its children, so restore the links of every bone
+    for entry in checkpoint:
+        edit_bone = edit_bones[entry["name"]]
+        edit_bone.parent = edit_bones[entry["parent"]] if entry["parent"] else None
+        edit_bone.use_connect = entry["use_connect"]
+
+    bpy.ops.object.mode_set(mode='OBJECT')
+    invalidate_armature_hierarchy(armature)
+    print(f"Rolled back {armature.name}: recreated {recreated} bone(s)")
+    return recreated
@@ -0,0 +1,153 @@
+import bpy
+import os
+from .lod_meshes import find_all_lod_meshes
+
+# Custom property on a compared mesh: outcome of its last weight comparison
+COMPARISON_PROPERTY = "mh2m_weight_comparison"
+
+def capture_weight_snapshot(obj):
+    """Weight state of a mesh as plain data: {"mesh", "groups", "weights"}"""
+    from .vertex_weights import read_weight_matrix
+
+    group_names, weights = read_weight_matrix(obj)
+    return {"mesh": obj.name, "groups": group_names, "weights": weights}
+
+def snapshot_path(directory, mesh_name):
+    return os.path.join(directory, f"{bpy.path.clean_name(mesh_name)}.npz")
+
+def save_weight_snapshot(snapshot, filepath):
+    import numpy as np
+
+    np.savez_compressed(
+        filepath,
+        mesh=np.array(snapshot["mesh"]),
+        groups=np.array(snapshot["groups"], dtype=str),
+        weights=snapshot["weights"],
+    )
+
+def load_weight_snapshot(filepath):
+    import numpy as np
+
+    with np.load(filepath) as data:
+        return {
+            "mesh": str(data["mesh"]),
+            "groups": data["groups"].tolist(),
+            "weights": data["weights"],
+        }
+
+def record_weight_comparison(mesh, report):
+    """Store the outcome of a weight comparison on the mesh, so batch scripts can reject it. Returns True if it passed"""
+    from ..core.compare import format_comparison
+
+    mesh[COMPARISON_PROPERTY] = {"passed": report["passed"], "summary": format_comparison(report)}
+    return report["passed"]
+
+def comparison_failure(mesh):
+    """Summary of the failed weight comparison recorded on the mesh, or None if it passed or was not compared"""
+    status = mesh.get(COMPARISON_PROPERTY)
+    if status is None or status["passed"]:
+        return None
+    return status["summary"]
+
+def compare_with_snapshot(mesh, directory, tolerance=1e-4):
+    """Compare a mesh with its snapshot in directory and record the outcome. Returns the report, or None without snapshot"""
+    from ..core.compare import compare_weight_snapshots
+
+    filepath = snapshot_path(directory, mesh.name)
+    if not os.path.exists(filepath):
+        print(f"No snapshot for {mesh.name} at {filepath}")
+        return None
+    report = compare_weight_snapshots(load_weight_snapshot(filepath), capture_weight_snapshot(mesh), tolerance)
+    record_weight_comparison(mesh, report)
+    return report
+
+class SaveWeightSnapshotOperator(bpy.types.Operator):
+    bl_idname = "object.save_weight_snapshot"
+    bl_label = "Save Weight Snapshot"
+    bl_description = "Saves the vertex group weights of the selected mesh and its LODs as reference snapshots"
+
+    directory: bpy.props.StringProperty(
+        name="Snapshot Folder",
+        default="//weight_snapshots/",
+        subtype='DIR_PATH'
+    )
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure a mesh object is selected
+        mesh = context.object
+        if not mesh or mesh.type != 'MESH':
+            self.report({'ERROR'}, "Please select a mesh object.")
+            return {'CANCELLED'}
+
+        meshes_to_process = find_all_lod_meshes(mesh) if settings.bAutoLookForLOD else [mesh]
+
+        directory = bpy.path.abspath(self.directory)
+        os.makedirs(directory, exist_ok=True)
+        for target_mesh in meshes_to_process:
+            filepath = snapshot_path(directory, target_mesh.name)
+            save_weight_snapshot(capture_weight_snapshot(target_mesh), filepath)
+            print(f"Saved weight snapshot of {target_mesh.name} to {filepath}")
+
+        self.report({'INFO'}, f"All done! Saved {len(meshes_to_process)} snapshot(s) to {directory}")
+        return {'FINISHED'}
+
+class CompareWeightSnapshotOperator(bpy.types.Operator):
+    bl_idname = "object.compare_weight_snapshot"
+    bl_label = "Compare Weights"
+    bl_description = "Compares the weights of the selected mesh and its LODs with their saved snapshots, or the active mesh with a second selected mesh"
+
+    directory: bpy.props.StringProperty(
+        name="Snapshot Folder",
+        default="//weight_snapshots/",
+        subtype='DIR_PATH'
+    )
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Largest allowed weight difference",
+        default=1e-4,
+        min=0.0
+    )
+
+    def execute(self, context):
+        settings = context.scene.metahuman_to_manny_settings
+
+        # Ensure a mesh object is selected
+        mesh = context.object
+        if not mesh or mesh.type != 'MESH':
+            self.report({'ERROR'}, "Please select a mesh object.")
+            return {'CANCELLED'}
+
+        from ..core.compare import compare_weight_snapshots, format_comparison
+
+        # Two selected meshes: compare them directly (the other one is the reference)
+        other_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH' and obj != mesh]
+        reports = []
+        if other_meshes:
+            report = compare_weight_snapshots(capture_weight_snapshot(other_meshes[0]), capture_weight_snapshot(mesh), self.tolerance)
+            record_weight_comparison(mesh, report)
+            reports.append(report)
+        else:
+            directory = bpy.path.abspath(self.directory)
+            meshes_to_process = find_all_lod_meshes(mesh) if settings.bAutoLookForLOD else [mesh]
+            for target_mesh in meshes_to_process:
+                report = compare_with_snapshot(target_mesh, directory, self.tolerance)
+                if report is not None:
+                    reports.append(report)
+
+        if not reports:
+            self.report({'ERROR'}, "Nothing to compare.")
+            return {'CANCELLED'}
+
+        for report in reports:
+            print(format_comparison(report))
+            for group_name, difference in sorted(report.get("changed_groups", {}).items(), key=lambda item: -item[1]):
+                print(f"  {group_name}: {difference:.6f}")
+
+        failed = [report["candidate"] for report in reports if not report["passed"]]
+        if failed:
+            self.report({'WARNING'}, f"Weights changed on: {', '.join(failed)}")
+        else:
+            self.report({'INFO'}, f"All done! {len(reports)} mesh(es) match within {self.tolerance}")
+        return {'FINISHED'}
@@ -0,0 +1,13 @@
+import os
+import sys
+import pytest
+
+# The core package is importable without Blender once the add-on folder is on sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture
+def fake_bpy():
+    """The stand-in bpy module from fake_blender; operator modules are then importable as addon.operators.*"""
+    import fake_blender
+
+    return fake_blender.install()
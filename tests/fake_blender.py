@@ -0,0 +1,158 @@
+"""Just enough of bpy to run the weight operators on plain Python meshes.
+
+install() puts a stand-in bpy module into sys.modules and makes the add-on
+folder importable as the package "addon" without running its __init__.py, so
+tests can import addon.operators.* outside Blender. The objects below model only
+what the operators read and write: vertex groups, vertex group memberships,
+custom properties and bones.
+"""
+import os
+import sys
+import types
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class IDProperties:
+    """Custom properties of an object (obj["name"])"""
+
+    def __init__(self):
+        self.props = {}
+
+    def __getitem__(self, key):
+        return self.props[key]
+
+    def __setitem__(self, key, value):
+        self.props[key] = value
+
+    def __delitem__(self, key):
+        del self.props[key]
+
+    def __contains__(self, key):
+        return key in self.props
+
+    def get(self, key, default=None):
+        return self.props.get(key, default)
+
+class VertexGroup:
+    def __init__(self, name, index):
+        self.name = name
+        self.index = index
+        self.weights = {}
+
+    def add(self, indices, weight, mode):
+        for i in indices:
+            self.weights[i] = weight
+
+    def remove(self, indices):
+        for i in indices:
+            self.weights.pop(i, None)
+
+class VertexGroups(list):
+    def __contains__(self, name):
+        return any(vg.name == name for vg in self)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return next(vg for vg in self if vg.name == key)
+        return list.__getitem__(self, key)
+
+    def get(self, name, default=None):
+        return next((vg for vg in self if vg.name == name), default)
+
+    def new(self, name="Group"):
+        vg = VertexGroup(name, len(self))
+        self.append(vg)
+        return vg
+
+    def remove(self, vg):
+        list.remove(self, vg)
+        for i, other in enumerate(self):
+            other.index = i
+
+    def clear(self):
+        del self[:]
+
+class GroupElement:
+    def __init__(self, group, weight):
+        self.group = group
+        self.weight = weight
+
+class Vertex:
+    def __init__(self, mesh, index):
+        self.mesh = mesh
+        self.index = index
+
+    @property
+    def groups(self):
+        return [GroupElement(vg.index, vg.weights[self.index]) for vg in self.mesh.vertex_groups if self.index in vg.weights]
+
+class Mesh(IDProperties):
+    type = 'MESH'
+
+    def __init__(self, name, vertex_count):
+        super().__init__()
+        self.name = name
+        self.parent = None
+        self.modifiers = []
+        self.selected = False
+        self.vertex_groups = VertexGroups()
+        self.data = types.SimpleNamespace(
+            vertices=[Vertex(self, i) for i in range(vertex_count)], edges=[], polygons=[]
+        )
+
+    def select_set(self, state):
+        self.selected = state
+
+    def group_weights(self, name):
+        return dict(self.vertex_groups[name].weights)
+
+class Bone:
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+
+class Bones(list):
+    def keys(self):
+        return [bone.name for bone in self]
+
+class Armature(IDProperties):
+    type = 'ARMATURE'
+
+    def __init__(self, name, bone_parents):
+        """bone_parents: (bone name, parent name or None) pairs, parents first"""
+        super().__init__()
+        self.name = name
+        bones = {}
+        for bone_name, parent_name in bone_parents:
+            bones[bone_name] = Bone(bone_name, bones.get(parent_name))
+        self.data = types.SimpleNamespace(bones=Bones(bones.values()), name_full=f"{name}Data")
+        self.selected = False
+
+    def select_set(self, state):
+        self.selected = state
+
+def _property(**_kwargs):
+    return None
+
+def install():
+    """Install the stand-in bpy and register the add-on folder as the package "addon". Returns the bpy module"""
+    if "bpy" in sys.modules and getattr(sys.modules["bpy"], "is_fake", False):
+        return sys.modules["bpy"]
+
+    bpy = types.ModuleType("bpy")
+    bpy.is_fake = True
+    bpy.types = types.SimpleNamespace(Operator=object, PropertyGroup=object, Panel=object)
+    bpy.props = types.SimpleNamespace(
+        StringProperty=_property, BoolProperty=_property, IntProperty=_property,
+        FloatProperty=_property, EnumProperty=_property, PointerProperty=_property,
+    )
+    bpy.context = types.SimpleNamespace(scene=None)
+    bpy.ops = types.SimpleNamespace()
+    bpy.data = types.SimpleNamespace()
+    bpy.path = types.SimpleNamespace(clean_name=lambda name: name)
+    sys.modules["bpy"] = bpy
+
+    addon = types.ModuleType("addon")
+    addon.__path__ = [ADDON_DIR]
+    sys.modules["addon"] = addon
+    return bpy
@@ -0,0 +1,46 @@
+import fake_blender
+
+def count_bone_walks(monkeypatch):
+    from addon.operators import armature_hierarchy
+
+    walks = []
+    bone_parent_pairs = armature_hierarchy.bone_parent_pairs
+    def counting_bone_parent_pairs(armature):
+        walks.append(armature.name)
+        return bone_parent_pairs(armature)
+    monkeypatch.setattr(armature_hierarchy, "bone_parent_pairs", counting_bone_parent_pairs)
+    return walks
+
+def test_hierarchy_is_cached_without_walking_the_bones(fake_bpy, monkeypatch):
+    from addon.operators.armature_hierarchy import get_armature_hierarchy, get_skeleton_hash, invalidate_armature_hierarchy
+
+    walks = count_bone_walks(monkeypatch)
+    armature = fake_blender.Armature("CachedBody", [("root", None), ("pelvis", "root"), ("spine_01", "pelvis")])
+    invalidate_armature_hierarchy(armature)
+    hierarchy = get_armature_hierarchy(armature)
+    signature = get_skeleton_hash(armature)
+    for _ in range(5):
+        assert get_armature_hierarchy(armature) is hierarchy
+        assert get_skeleton_hash(armature) == signature
+    assert walks == ["CachedBody"]
+
+def test_hierarchy_is_rebuilt_after_bone_edits(fake_bpy, monkeypatch):
+    from addon.operators.armature_hierarchy import get_armature_hierarchy, get_skeleton_hash, invalidate_armature_hierarchy
+
+    walks = count_bone_walks(monkeypatch)
+    armature = fake_blender.Armature("EditedBody", [("root", None), ("pelvis", "root"), ("spine_01", "pelvis")])
+    invalidate_armature_hierarchy(armature)
+    signature = get_skeleton_hash(armature)
+
+    # Deleting a bone changes the count, which is noticed without invalidating
+    del armature.data.bones[2]
+    assert get_armature_hierarchy(armature).names == ["root", "pelvis"]
+    assert len(walks) == 2
+
+    # A rename keeps the count, so the editing code invalidates the cache
+    armature.data.bones[1].name = "hips"
+    assert get_armature_hierarchy(armature).names == ["root", "pelvis"]
+    invalidate_armature_hierarchy(armature)
+    assert get_armature_hierarchy(armature).names == ["root", "hips"]
+    assert get_skeleton_hash(armature) != signature
+    assert len(walks) == 3
@@ -0,0 +1,159 @@
+import types
+import pytest
+import fake_blender
+
+@pytest.fixture
+def batch(fake_bpy, monkeypatch):
+    """batch_conversion on a stand-in Blender: sources are lists of appended objects, saves are recorded"""
+    import addon.operators.batch_conversion as batch_conversion
+
+    saved = []
+    sources = {}
+    scene = types.SimpleNamespace(metahuman_to_manny_settings=types.SimpleNamespace(), objects=[])
+    context = types.SimpleNamespace(scene=scene, view_layer=types.SimpleNamespace(objects=types.SimpleNamespace(active=None)))
+    monkeypatch.setattr(fake_bpy, "context", context)
+    monkeypatch.setattr(fake_bpy, "data", types.SimpleNamespace(orphans_purge=lambda do_recursive: None))
+    monkeypatch.setattr(fake_bpy, "ops", types.SimpleNamespace(
+        wm=types.SimpleNamespace(
+            read_homefile=lambda use_empty: None,
+            save_as_mainfile=lambda filepath, check_existing: saved.append(filepath),
+        ),
+        object=types.SimpleNamespace(),
+    ))
+
+    def append_conversion_sources(scene, source_path, config):
+        objects = sources[source_path]
+        if isinstance(objects, Exception):
+            raise objects
+        scene.objects = objects
+        return objects
+
+    monkeypatch.setattr(batch_conversion, "append_conversion_sources", append_conversion_sources)
+    return types.SimpleNamespace(module=batch_conversion, bpy=fake_bpy, sources=sources, saved=saved)
+
+def rigged_mesh(armature):
+    mesh = fake_blender.Mesh(f"{armature.name}_Mesh", 1)
+    mesh.modifiers.append(types.SimpleNamespace(type='ARMATURE', object=armature))
+    return [mesh, armature]
+
+def active_armature(bpy):
+    return bpy.context.view_layer.objects.active.modifiers[0].object
+
+def test_failed_skeleton_check_is_not_saved(batch, tmp_path):
+    from addon.operators.skeleton_conformance import CONFORMANCE_PROPERTY
+
+    good = fake_blender.Armature("Good", [("root", None)])
+    bad = fake_blender.Armature("Bad", [("root", None)])
+    batch.sources["ada.blend"] = rigged_mesh(bad) + rigged_mesh(good)
+
+    converted = []
+    def in_place_conversion():
+        armature = active_armature(batch.bpy)
+        converted.append(armature.name)
+        armature[CONFORMANCE_PROPERTY] = {"passed": armature is good, "summary": "FAIL Bad against Manny"}
+        return {'FINISHED'}
+    batch.bpy.ops.object.in_place_conversion = in_place_conversion
+
+    result, = batch.module.batch_convert(["ada.blend"], str(tmp_path), config={})
+    assert converted == ["Bad", "Good"]
+    assert result["converted"] == 2
+    assert result["skeleton_failures"] == ["Bad: FAIL Bad against Manny"]
+    assert result["output"] is None and result["error"] is None
+    assert batch.saved == []
+
+def test_cancelled_conversion_is_not_saved(batch, tmp_path):
+    first = fake_blender.Armature("First", [("root", None)])
+    second = fake_blender.Armature("Second", [("root", None)])
+    batch.sources["ada.blend"] = rigged_mesh(first) + rigged_mesh(second)
+
+    converted = []
+    def in_place_conversion():
+        # Like bpy.ops for an operator that reports an error before returning CANCELLED
+        armature = active_armature(batch.bpy)
+        if armature is first:
+            raise RuntimeError("Error: Fix Seams failed on First_Mesh")
+        converted.append(armature.name)
+        return {'FINISHED'}
+    batch.bpy.ops.object.in_place_conversion = in_place_conversion
+
+    result, = batch.module.batch_convert(["ada.blend"], str(tmp_path), config={})
+    assert converted == ["Second"]
+    assert result["converted"] == 1
+    assert result["cancelled"] == ["First: Error: Fix Seams failed on First_Mesh"]
+    assert result["output"] is None and result["error"] is None
+    assert batch.saved == []
+
+def test_unreadable_source_does_not_stop_the_batch(batch, tmp_path):
+    armature = fake_blender.Armature("Body", [("root", None)])
+    batch.sources["broken.blend"] = OSError("not a blend file")
+    batch.sources["ada.blend"] = rigged_mesh(armature)
+    batch.bpy.ops.object.in_place_conversion = lambda: {'FINISHED'}
+
+    broken, ada = batch.module.batch_convert(["broken.blend", "ada.blend"], str(tmp_path), config={})
+    assert broken["error"] == "not a blend file" and broken["output"] is None
+    assert ada["error"] is None and ada["output"] == str(tmp_path / "ada.blend")
+    assert batch.saved == [str(tmp_path / "ada.blend")]
+
+def test_output_never_overwrites_the_source(fake_bpy, tmp_path):
+    from addon.operators.batch_conversion import batch_output_path
+
+    source = str(tmp_path / "ada.blend")
+    assert batch_output_path(source, str(tmp_path / "out")) == str(tmp_path / "out" / "ada.blend")
+    assert batch_output_path(source, str(tmp_path)) == str(tmp_path / "ada_converted.blend")
+    assert batch_output_path(source, str(tmp_path / "out" / "..")).endswith("ada_converted.blend")
+
+def test_failed_weight_comparison_is_not_saved(batch, tmp_path):
+    from addon.operators.weight_snapshot import (
+        COMPARISON_PROPERTY, capture_weight_snapshot, comparison_failure, save_weight_snapshot, snapshot_path,
+    )
+
+    armature = fake_blender.Armature("Ada", [("root", None)])
+    mesh, _armature = objects = rigged_mesh(armature)
+    mesh.vertex_groups.new("root").add([0], 1.0, 'REPLACE')
+    batch.sources["/sources/ada.blend"] = objects
+    snapshots = tmp_path / "snapshots" / "ada"
+    snapshots.mkdir(parents=True)
+    save_weight_snapshot(capture_weight_snapshot(mesh), snapshot_path(str(snapshots), mesh.name))
+
+    # The conversion changes the weights the snapshot was taken of
+    def in_place_conversion():
+        mesh.vertex_groups["root"].add([0], 0.5, 'REPLACE')
+        return {'FINISHED'}
+    batch.bpy.ops.object.in_place_conversion = in_place_conversion
+
+    config = {"weight_snapshots": str(tmp_path / "snapshots" / "{source}")}
+    result, = batch.module.batch_convert(["/sources/ada.blend"], str(tmp_path / "out"), config=config)
+    assert result["converted"] == 1
+    assert len(result["check_failures"]) == 1
+    assert result["check_failures"][0].startswith("Ada_Mesh: FAIL Ada_Mesh")
+    assert result["output"] is None and batch.saved == []
+    assert not mesh[COMPARISON_PROPERTY]["passed"]
+    assert comparison_failure(mesh) == result["check_failures"][0][len("Ada_Mesh: "):]
+
+    # Within tolerance the same source is saved
+    mesh.vertex_groups["root"].add([0], 1.0, 'REPLACE')
+    batch.bpy.ops.object.in_place_conversion = lambda: {'FINISHED'}
+    result, = batch.module.batch_convert(["/sources/ada.blend"], str(tmp_path / "out"), config=config)
+    assert result["check_failures"] == [] and comparison_failure(mesh) is None
+    assert batch.saved == [str(tmp_path / "out" / "ada.blend")]
+
+def test_over_bone_budget_is_not_saved(batch, tmp_path, monkeypatch):
+    from addon.operators import batch_conversion, lod_bone_reduction, skinning_report
+
+    armature = fake_blender.Armature("Ada", [("root", None)])
+    mesh, _armature = objects = rigged_mesh(armature)
+    batch.sources["ada.blend"] = objects
+    batch.bpy.ops.object.in_place_conversion = lambda: {'FINISHED'}
+    monkeypatch.setattr(lod_bone_reduction, "load_bone_budgets", lambda: [60])
+    monkeypatch.setattr(skinning_report, "skinning_report", lambda mesh, budget: {
+        "bones": 75, "bone_budget": budget, "within_budget": 75 <= budget,
+    })
+
+    # Only checked when the config asks for it
+    result, = batch_conversion.batch_convert(["ada.blend"], str(tmp_path), config={})
+    assert result["check_failures"] == [] and len(batch.saved) == 1
+    assert skinning_report.skinning_failure(mesh) is None
+
+    result, = batch_conversion.batch_convert(["ada.blend"], str(tmp_path), config={"check_bone_budgets": True})
+    assert result["check_failures"] == ["Ada_Mesh: over bone budget, 75 bones, budget 60"]
+    assert result["output"] is None and len(batch.saved) == 1
@@ -0,0 +1,53 @@
+from core.bone_budget import solve_bone_budget
+from core.hierarchy import ArmatureHierarchy
+from core.reduction import budget_for_lod
+
+def make_hierarchy():
+    # hand_l -> (index_01_l -> index_02_l -> index_03_l, thumb_01_l -> thumb_02_l)
+    bone_names = ["hand_l", "index_01_l", "index_02_l", "index_03_l", "thumb_01_l", "thumb_02_l"]
+    parent_names = [None, "hand_l", "index_01_l", "index_02_l", "hand_l", "thumb_01_l"]
+    return ArmatureHierarchy(bone_names, parent_names)
+
+GROUP_NAMES = ["hand_l", "index_01_l", "index_02_l", "index_03_l", "thumb_01_l", "thumb_02_l", "not_a_bone"]
+
+def test_budget_already_met():
+    contributions = [10.0, 5.0, 4.0, 3.0, 2.0, 1.0, 50.0]
+    assert solve_bone_budget(make_hierarchy(), GROUP_NAMES, contributions, 6) == {}
+    # Groups without weight do not count against the budget
+    contributions = [10.0, 5.0, 0.0, 0.0, 2.0, 0.0, 50.0]
+    assert solve_bone_budget(make_hierarchy(), GROUP_NAMES, contributions, 3) == {}
+
+def test_exceeded_by_one_collapses_the_lightest_leaf():
+    contributions = [10.0, 5.0, 4.0, 3.0, 2.0, 1.0, 50.0]
+    assert solve_bone_budget(make_hierarchy(), GROUP_NAMES, contributions, 5) == {"thumb_02_l": "thumb_01_l"}
+
+def test_exceeded_by_several_bones_on_one_chain():
+    # The index tip is the lightest leaf, then its parent takes its weight and the tip of the chain moves up
+    contributions = [10.0, 1.5, 1.0, 0.5, 8.0, 9.0, 0.0]
+    assert solve_bone_budget(make_hierarchy(), GROUP_NAMES, contributions, 4) == {
+        "index_03_l": "index_01_l",
+        "index_02_l": "index_01_l",
+    }
+    # Collapsing the whole chain folds every bone into the root, which is never collapsed
+    assert solve_bone_budget(make_hierarchy(), GROUP_NAMES, contributions, 3) == {
+        "index_03_l": "hand_l",
+        "index_02_l": "hand_l",
+        "index_01_l": "hand_l",
+    }
+
+def test_inactive_parent_takes_the_place_of_its_child():
+    # index_02_l has no weight of its own, so collapsing the tip into it does not lower the count
+    contributions = [10.0, 5.0, 0.0, 0.5, 8.0, 9.0, 0.0]
+    assert solve_bone_budget(make_hierarchy(), GROUP_NAMES, contributions, 4) == {
+        "index_03_l": "index_01_l",
+        "index_02_l": "index_01_l",
+    }
+
+def test_last_budget_applies_to_higher_lods():
+    budgets = [6, 5, 4]
+    contributions = [10.0, 5.0, 4.0, 3.5, 2.0, 1.0, 0.0]
+    assert solve_bone_budget(make_hierarchy(), GROUP_NAMES, contributions, budget_for_lod(budgets, 0)) == {}
+    lod_5 = solve_bone_budget(make_hierarchy(), GROUP_NAMES, contributions, budget_for_lod(budgets, 5))
+    assert lod_5 == solve_bone_budget(make_hierarchy(), GROUP_NAMES, contributions, 4)
+    # The thumb tip was folded into thumb_01_l first, so it ends up wherever thumb_01_l went
+    assert lod_5 == {"thumb_02_l": "hand_l", "thumb_01_l": "hand_l"}
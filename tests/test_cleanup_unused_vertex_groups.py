@@ -0,0 +1,16 @@
+import fake_blender
+
+def test_groups_follow_the_armature_bone_order(fake_bpy):
+    from addon.operators.armature_hierarchy import get_armature_hierarchy
+    from addon.operators.cleanup_unused_vertex_groups import CleanUpUnusedVertexGroupsOperator
+
+    # Depth-first the order would be root, pelvis, spine_01, thigh_l
+    armature = fake_blender.Armature("CompactBody", [("root", None), ("pelvis", "root"), ("thigh_l", "pelvis"), ("spine_01", "pelvis")])
+    mesh = fake_blender.Mesh("CompactBody_LOD0", 3)
+    for name, vertices in (("spine_01", [0]), ("helper", [1]), ("thigh_l", [1, 2]), ("root", []), ("pelvis", [2])):
+        mesh.vertex_groups.new(name).add(vertices, 0.5, 'REPLACE')
+
+    CleanUpUnusedVertexGroupsOperator().cleanup_unused_groups(mesh, get_armature_hierarchy(armature), armature.data.bones.keys())
+    assert [vg.name for vg in mesh.vertex_groups] == ["pelvis", "thigh_l", "spine_01"]
+    assert mesh.group_weights("thigh_l") == {1: 0.5, 2: 0.5}
+    assert mesh.group_weights("spine_01") == {0: 0.5}
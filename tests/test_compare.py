@@ -0,0 +1,52 @@
+import numpy as np
+from core.compare import align_weights, compare_weight_snapshots, format_audit, format_comparison, weight_divergence
+
+def snapshot(mesh, groups, weights):
+    return {"mesh": mesh, "groups": groups, "weights": np.array(weights, dtype=np.float32)}
+
+def test_align_weights_unions_groups():
+    groups, reference, candidate = align_weights(
+        ["a", "b"], np.array([[1.0, 0.0]]), ["c", "a"], np.array([[0.25, 0.75]])
+    )
+    assert groups == ["a", "b", "c"]
+    np.testing.assert_allclose(reference, [[1.0, 0.0, 0.0]])
+    np.testing.assert_allclose(candidate, [[0.75, 0.0, 0.25]])
+
+def test_identical_snapshots_pass():
+    reference = snapshot("Body", ["a", "b"], [[1.0, 0.0], [0.5, 0.5]])
+    candidate = snapshot("Body.001", ["b", "a", "empty"], [[0.0, 1.0, 0.0], [0.5, 0.5, 0.0]])
+    report = compare_weight_snapshots(reference, candidate)
+    assert report["passed"]
+    assert report["extra_groups"] == ["empty"]
+    assert report["changed_vertices"] == 0
+    assert format_comparison(report).startswith("PASS Body.001")
+
+def test_changed_weights_fail():
+    reference = snapshot("Body", ["a", "b"], [[1.0, 0.0], [0.5, 0.5]])
+    candidate = snapshot("Body.001", ["a"], [[1.0], [0.5]])
+    report = compare_weight_snapshots(reference, candidate)
+    assert not report["passed"]
+    assert report["missing_groups"] == ["b"]
+    assert report["worst_vertex"] == 1
+    assert report["changed_groups"] == {"b": 0.5}
+    assert report["max_difference"] == 0.5
+
+def test_vertex_count_mismatch():
+    report = compare_weight_snapshots(snapshot("A", ["a"], [[1.0]]), snapshot("B", ["a"], [[1.0], [1.0]]))
+    assert not report["passed"]
+    assert "vertex count differs" in format_comparison(report)
+
+def test_weight_divergence():
+    expected = np.array([[1.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+    actual = np.array([[1.0, 0.0], [0.0, 1.0], [0.0, 1.0]])
+    report = weight_divergence(["a", "b"], expected, ["a", "b"], actual)
+    assert report["vertices"] == 3
+    assert report["max_divergence"] == 1.0
+    assert np.isclose(report["mean_divergence"], 1.0 / 3.0)
+    assert report["dominant_bone_mismatch"] == 1
+    assert report["worst_regions"] == [{"bone": "a", "vertices": 2, "mean_divergence": 0.5}]
+
+    report.update({"source": "LOD0", "target": "LOD1"})
+    lines = format_audit(report).splitlines()
+    assert lines[0].startswith("LOD1 vs LOD0")
+    assert lines[1] == "  Region a: 0.5000 over 2 vertices"
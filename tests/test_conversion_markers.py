@@ -0,0 +1,37 @@
+import fake_blender
+
+def make_mesh():
+    mesh = fake_blender.Mesh("Body_LOD0", 4)
+    mesh.vertex_groups.new(name="pelvis").add([0, 1], 1.0, 'REPLACE')
+    mesh.vertex_groups.new(name="empty")
+    mesh.vertex_groups.new(name="spine_01").add([2, 3], 0.5, 'REPLACE')
+    return mesh
+
+def test_mark_step_done_reuses_a_known_fingerprint(fake_bpy):
+    from addon.operators.conversion_markers import FINGERPRINT_PROPERTY, is_step_done, mark_step_done, mesh_fingerprint, object_fingerprint
+    from addon.operators.weight_checkpoint import capture_weight_checkpoint
+
+    mesh = make_mesh()
+    fingerprint = mesh_fingerprint(mesh, capture_weight_checkpoint(mesh))
+    assert fingerprint == object_fingerprint(mesh)
+
+    mark_step_done(mesh, "fix_seams", fingerprint=fingerprint)
+    mark_step_done(mesh, "propagate_lod_weights", depends_on="lod0")
+    assert mesh[FINGERPRINT_PROPERTY] == fingerprint
+    assert is_step_done(mesh, "fix_seams")
+    assert is_step_done(mesh, "propagate_lod_weights", "lod0")
+    assert not is_step_done(mesh, "propagate_lod_weights", "changed lod0")
+
+def test_checkpoint_active_groups(fake_bpy):
+    from addon.operators.weight_checkpoint import capture_weight_checkpoint, checkpoint_active_groups
+
+    assert checkpoint_active_groups(capture_weight_checkpoint(make_mesh())) == 2
+
+def test_rollback_summary_names_what_is_not_restored(fake_bpy):
+    from addon.operators.in_place_conversion import InPlaceConversionOperator
+
+    operator = InPlaceConversionOperator()
+    assert "topology changes cannot be rolled back" in operator.rollback_summary("fix_seams", [], False)
+    assert operator.rollback_summary("prune_shape_keys", [], False).startswith("Its shape key changes cannot be rolled back")
+    assert "vertex count changed" in operator.rollback_summary("apply_bone_budget", ["Body_LOD0"])
+    assert operator.rollback_summary("apply_bone_budget", []).endswith("run the conversion again to resume.")
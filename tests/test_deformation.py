@@ -0,0 +1,109 @@
+import numpy as np
+from core.deformation import compare_deformation, format_deformation_report, vertex_regions
+
+REGION_PATTERNS = {"Hands": ["hand_*", "index_*"], "Legs": ["thigh_*", "calf_*"]}
+
+def make_capture(name, positions, poses=("bend", "twist")):
+    group_names = ["hand_l", "thigh_l", "spine_01"]
+    weights = np.array([
+        [0.9, 0.1, 0.0],
+        [0.2, 0.8, 0.0],
+        [0.0, 0.0, 1.0],
+        [0.0, 0.0, 0.0],
+    ], dtype=np.float32)
+    region_names, vertex_region = vertex_regions(group_names, weights, REGION_PATTERNS)
+    return {
+        "mesh": name,
+        "poses": list(poses),
+        "positions": np.asarray(positions, dtype=np.float32),
+        "region_names": region_names,
+        "vertex_region": vertex_region,
+    }
+
+def reference_positions():
+    rest = np.arange(12, dtype=np.float32).reshape(4, 3)
+    return np.stack([rest, rest + 1.0])
+
+def test_vertex_regions_follow_the_dominant_group():
+    capture = make_capture("ref", reference_positions())
+    assert capture["region_names"] == ["Hands", "Legs", "Other"]
+    # Unmatched dominant group and weightless vertex both go to Other
+    assert capture["vertex_region"].tolist() == [0, 1, 2, 2]
+
+def test_vertex_regions_without_groups():
+    region_names, vertex_region = vertex_regions([], np.zeros((3, 0), dtype=np.float32), REGION_PATTERNS)
+    assert region_names == ["Hands", "Legs", "Other"]
+    assert vertex_region.tolist() == [2, 2, 2]
+
+def test_identical_captures_pass():
+    report = compare_deformation(make_capture("ref", reference_positions()), make_capture("new", reference_positions()))
+    assert report["passed"]
+    assert [pose["max_displacement"] for pose in report["poses"]] == [0.0, 0.0]
+    assert report["missing_poses"] == []
+
+def test_displacement_above_tolerance_fails():
+    positions = reference_positions()
+    positions[1, 1, 2] += 0.75  # Legs vertex in the twist pose
+    positions[0, 0, 0] += 0.25  # Hands vertex in the bend pose, within tolerance
+    report = compare_deformation(make_capture("ref", reference_positions()), make_capture("new", positions), tolerance=0.5)
+    assert not report["passed"]
+    bend, twist = report["poses"]
+    assert bend["moved_vertices"] == 0 and bend["worst_vertex"] == 0
+    assert twist["moved_vertices"] == 1 and twist["worst_vertex"] == 1
+    assert twist["max_displacement"] == np.float32(0.75)
+    assert twist["regions"] == {"Hands": 0.0, "Legs": 0.75, "Other": 0.0}
+    # Tolerance is exclusive
+    assert compare_deformation(make_capture("ref", reference_positions()), make_capture("new", positions), tolerance=0.75)["passed"]
+
+def test_missing_poses_are_listed_and_skipped():
+    candidate = make_capture("new", reference_positions()[:1], poses=("bend",))
+    report = compare_deformation(make_capture("ref", reference_positions()), candidate)
+    assert report["missing_poses"] == ["twist"]
+    assert [pose["pose"] for pose in report["poses"]] == ["bend"]
+    assert report["passed"]
+
+def test_vertex_count_mismatch_needs_a_vertex_map():
+    reference = make_capture("ref", reference_positions())
+    # The candidate merged vertices 2 and 3 away
+    candidate = make_capture("new", reference_positions()[:, [0, 1]])
+    report = compare_deformation(reference, candidate)
+    assert not report["passed"]
+    assert report["error"] == "vertex count differs: 4 vs 2"
+
+    report = compare_deformation(reference, candidate, vertex_map=np.array([0, 1]))
+    assert report["passed"]
+    assert set(report["poses"][0]["regions"]) == {"Hands", "Legs"}
+
+def test_format_deformation_report():
+    positions = reference_positions()
+    positions[1, 1, 2] += 0.75
+    positions[1, 0, 2] += 0.25
+    candidate = make_capture("new", positions[1:], poses=("twist",))
+    report = compare_deformation(make_capture("ref", reference_positions()), candidate)
+    assert format_deformation_report(report).splitlines() == [
+        "FAIL new: max displacement 0.7500 over 1 pose(s)",
+        "  Missing poses: bend",
+        "  twist: max 0.7500 at vertex 1 (Legs 0.7500, Hands 0.2500, Other 0.0000)",
+    ]
+
+    candidate = make_capture("new", reference_positions()[:, :2])
+    assert format_deformation_report(compare_deformation(make_capture("ref", reference_positions()), candidate)) == (
+        "FAIL new: vertex count differs: 4 vs 2"
+    )
+
+def test_mesh_vertex_regions_matches_dense_read(fake_bpy, monkeypatch):
+    import fake_blender
+    from addon.operators import vertex_weights
+    from addon.operators.deformation_qa import mesh_vertex_regions
+
+    mesh = fake_blender.Mesh("Body", 7)
+    for name, weights in (("hand_l", {0: 0.9, 1: 0.2, 5: 0.5}), ("thigh_l", {1: 0.8, 5: 0.6}), ("spine_01", {2: 1.0, 6: 0.3})):
+        mesh.vertex_groups.new(name).weights.update(weights)
+
+    expected = vertex_regions(*vertex_weights.read_weight_matrix(mesh), REGION_PATTERNS)
+    # Tiny chunks, so the regions are assembled from several reads
+    iter_weight_chunks = vertex_weights.iter_weight_chunks
+    monkeypatch.setattr(vertex_weights, "iter_weight_chunks", lambda obj, rows=None: iter_weight_chunks(obj, rows, memory_budget=24))
+    region_names, vertex_region = mesh_vertex_regions(mesh, REGION_PATTERNS)
+    assert region_names == expected[0]
+    assert vertex_region.tolist() == expected[1].tolist() == [0, 1, 2, 2, 2, 1, 2]
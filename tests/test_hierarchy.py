@@ -0,0 +1,51 @@
+import numpy as np
+from core.hierarchy import ArmatureHierarchy
+
+def make_hierarchy():
+    # root -> pelvis -> (spine_01 -> spine_02, thigh_l -> calf_l), and a second root ik_root
+    bone_names = ["root", "spine_01", "thigh_l", "pelvis", "spine_02", "calf_l", "ik_root"]
+    parent_names = [None, "pelvis", "pelvis", "root", "spine_01", "thigh_l", None]
+    return ArmatureHierarchy(bone_names, parent_names)
+
+def test_depth_first_order():
+    hierarchy = make_hierarchy()
+    assert hierarchy.names == ["root", "pelvis", "spine_01", "spine_02", "thigh_l", "calf_l", "ik_root"]
+    assert hierarchy.parents.tolist() == [-1, 0, 1, 2, 1, 4, -1]
+    assert hierarchy.depth.tolist() == [0, 1, 2, 3, 2, 3, 0]
+    assert len(hierarchy) == 7
+
+def test_subtree_ranges():
+    hierarchy = make_hierarchy()
+    assert hierarchy.subtree_end.tolist() == [6, 6, 4, 4, 6, 6, 7]
+    assert hierarchy.descendants("pelvis") == ["spine_01", "spine_02", "thigh_l", "calf_l"]
+    assert hierarchy.descendants("calf_l") == []
+    assert hierarchy.descendants("missing") == []
+
+def test_unknown_parent_becomes_root():
+    hierarchy = ArmatureHierarchy(["a", "b"], ["deleted", "a"])
+    assert hierarchy.names == ["a", "b"]
+    assert hierarchy.parents.tolist() == [-1, 0]
+    assert hierarchy.has_bone("b")
+    assert not hierarchy.has_bone("deleted")
+
+def test_nearest_ancestor_indices():
+    hierarchy = make_hierarchy()
+    target = hierarchy.nearest_ancestor_indices(["pelvis", "thigh_l", "not_a_bone"])
+    expected = [-1, 1, 1, 1, 4, 4, -1]
+    assert target.tolist() == expected
+    assert target.dtype == np.int32
+
+def test_nearest_ancestor_map_skips_members_and_orphans():
+    hierarchy = make_hierarchy()
+    assert hierarchy.nearest_ancestor_map(["pelvis", "thigh_l"]) == {
+        "spine_01": "pelvis",
+        "spine_02": "pelvis",
+        "calf_l": "thigh_l",
+    }
+
+def test_long_chain_resolves():
+    names = [f"bone_{i}" for i in range(1000)]
+    hierarchy = ArmatureHierarchy(names, [None] + names[:-1])
+    target = hierarchy.nearest_ancestor_indices(["bone_0", "bone_500"])
+    assert target[499] == 0
+    assert target[999] == 500
@@ -0,0 +1,59 @@
+import types
+import fake_blender
+
+SETTINGS = types.SimpleNamespace(bApplyLODReduction=False, bApplyBoneBudget=False)
+
+def make_mesh(name, vertex_count):
+    mesh = fake_blender.Mesh(name, vertex_count)
+    for group_name in ("pelvis", "spine_01"):
+        mesh.vertex_groups.new(name=group_name)
+    mesh.vertex_groups["pelvis"].add(range(vertex_count), 0.75, 'REPLACE')
+    mesh.vertex_groups["spine_01"].add(range(vertex_count), 0.25, 'REPLACE')
+    return mesh
+
+def test_propagated_lod_is_not_dirty_on_the_next_run(fake_bpy):
+    from addon.core.weights import HASH_CHUNK_VERTICES
+    from addon.operators.incremental_reconversion import find_dirty_chunks, reconvert_changed_vertices, refresh_chunk_hashes
+    from addon.operators.vertex_weights import read_weight_matrix, write_weight_matrix
+    from addon.operators.weight_checkpoint import capture_weight_checkpoint
+
+    armature = fake_blender.Armature("Body", [("pelvis", None), ("spine_01", "pelvis")])
+    lod0 = make_mesh("Body_LOD0", 2 * HASH_CHUNK_VERTICES)
+    lod1 = make_mesh("Body_LOD1", HASH_CHUNK_VERTICES)
+    refresh_chunk_hashes([lod0, lod1])
+
+    # An artist touches up LOD0, the next run reconverts it and propagates it to LOD1 again
+    lod0.vertex_groups["spine_01"].add([5], 0.5, 'REPLACE')
+    reconverted = set()
+    for mesh in (lod0, lod1):
+        if reconvert_changed_vertices(mesh, armature, SETTINGS) is not None:
+            reconverted.add(mesh.name)
+    assert reconverted == {"Body_LOD0", "Body_LOD1"}
+
+    group_names, weights = read_weight_matrix(lod1)
+    weights[:, group_names.index("spine_01")] = 0.5
+    write_weight_matrix(lod1, group_names, weights)
+    modified = {"Body_LOD1"}
+    refresh_chunk_hashes([lod0, lod1], current=reconverted - modified)
+
+    for mesh in (lod0, lod1):
+        assert find_dirty_chunks(mesh, capture_weight_checkpoint(mesh)) == []
+        assert reconvert_changed_vertices(mesh, armature, SETTINGS) == 0
+
+def test_reconvert_folds_sources_with_weight_on_clean_chunks(fake_bpy):
+    from addon.core.weights import HASH_CHUNK_VERTICES
+    from addon.operators.incremental_reconversion import reconvert_changed_vertices, refresh_chunk_hashes
+
+    armature = fake_blender.Armature("Body", [("ball_l", None)])
+    mesh = fake_blender.Mesh("Feet", 2 * HASH_CHUNK_VERTICES)
+    mesh.vertex_groups.new(name="ball_l").add(range(2 * HASH_CHUNK_VERTICES), 0.5, 'REPLACE')
+    mesh.vertex_groups.new(name="bigtoe_01_l").add([10], 0.5, 'REPLACE')
+    refresh_chunk_hashes([mesh])
+
+    # Only the second chunk changes, but the toe group also has weight on the first one
+    mesh.vertex_groups["bigtoe_01_l"].add([HASH_CHUNK_VERTICES + 1], 0.25, 'REPLACE')
+    assert reconvert_changed_vertices(mesh, armature, SETTINGS) == HASH_CHUNK_VERTICES
+    assert "bigtoe_01_l" not in mesh.vertex_groups
+    ball = mesh.group_weights("ball_l")
+    assert ball[10] == 1.0
+    assert ball[HASH_CHUNK_VERTICES + 1] == 0.75
@@ -0,0 +1,14 @@
+from core.naming import bulge_merge_map, lod_number, lod_prefix, toe_merge_map
+
+def test_lod_names():
+    assert lod_number("FaceMesh_LOD3") == 3
+    assert lod_number("FaceMesh") == 0
+    assert lod_prefix("FaceMesh_LOD3") == "FaceMesh"
+
+def test_toe_merge_map():
+    assert toe_merge_map(["bigtoe_01_l", "littletoe_01_r", "ball_l"]) == {"bigtoe_01_l": "ball_l", "littletoe_01_r": "ball_r"}
+
+def test_bulge_merge_map_returns_missing_targets():
+    group_map, missing_targets = bulge_merge_map(["index_01_l", "index_01_bulge_l", "thumb_bulge_r"])
+    assert group_map == {"index_01_bulge_l": "index_01_l"}
+    assert missing_targets == ["thumb_r"]
@@ -0,0 +1,47 @@
+from core.hierarchy import ArmatureHierarchy
+from core.reduction import budget_for_lod, compile_reduction_map, rules_for_lod
+
+def make_hierarchy():
+    bone_names = ["hand_l", "index_01_l", "index_02_l", "index_03_l", "thumb_01_l", "thumb_02_l"]
+    parent_names = [None, "hand_l", "index_01_l", "index_02_l", "hand_l", "thumb_01_l"]
+    return ArmatureHierarchy(bone_names, parent_names)
+
+def test_budget_for_lod_clamps_to_last_entry():
+    assert budget_for_lod([], 2) is None
+    assert budget_for_lod(None, 0) is None
+    assert budget_for_lod([120, 80, 40], 1) == 80
+    assert budget_for_lod([120, 80, 40], 6) == 40
+
+def test_rules_for_lod_respects_min_lod():
+    profiles = [
+        {"min_lod": 1, "rules": [{"target": "a"}]},
+        {"rules": [{"target": "b"}]},
+        {"min_lod": 3, "rules": [{"target": "c"}]},
+    ]
+    assert rules_for_lod(profiles, 0) == [{"target": "b"}]
+    assert rules_for_lod(profiles, 3) == [{"target": "a"}, {"target": "b"}, {"target": "c"}]
+
+def test_descendant_rule():
+    rules = [{"target": "index_01_l", "descendants": True}]
+    assert compile_reduction_map(rules, make_hierarchy()) == {
+        "index_02_l": "index_01_l",
+        "index_03_l": "index_01_l",
+    }
+
+def test_first_rule_wins_and_chains_are_followed():
+    rules = [
+        {"target": "index_02_l", "bones": ["index_03_l"]},
+        {"target": "hand_l", "bones": ["index_02_l", "index_03_l", "hand_l"]},
+    ]
+    assert compile_reduction_map(rules, make_hierarchy()) == {
+        "index_03_l": "hand_l",
+        "index_02_l": "hand_l",
+    }
+
+def test_cycles_terminate():
+    rules = [
+        {"target": "thumb_01_l", "bones": ["thumb_02_l"]},
+        {"target": "thumb_02_l", "bones": ["thumb_01_l"]},
+    ]
+    group_map = compile_reduction_map(rules, make_hierarchy())
+    assert set(group_map) == {"thumb_01_l", "thumb_02_l"}
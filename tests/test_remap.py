@@ -0,0 +1,54 @@
+import fake_blender
+from core.hierarchy import ArmatureHierarchy
+from core.remap import build_remap_table, find_remap_table, skeleton_hash
+
+BONE_NAMES = ["root", "pelvis", "spine_01", "neck_01", "head", "FACIAL_C_Jaw", "FACIAL_L_Eye"]
+PARENT_NAMES = [None, "root", "pelvis", "spine_01", "neck_01", "head", "head"]
+
+def test_skeleton_hash_ignores_bone_order():
+    order = [4, 0, 6, 2, 1, 5, 3]
+    shuffled = skeleton_hash([BONE_NAMES[i] for i in order], [PARENT_NAMES[i] for i in order])
+    assert shuffled == skeleton_hash(BONE_NAMES, PARENT_NAMES)
+
+def test_skeleton_hash_depends_on_names_and_parents():
+    signature = skeleton_hash(BONE_NAMES, PARENT_NAMES)
+    assert skeleton_hash(BONE_NAMES, PARENT_NAMES[:-1] + ["neck_01"]) != signature
+    assert skeleton_hash(BONE_NAMES[:-1] + ["FACIAL_R_Eye"], PARENT_NAMES) != signature
+    assert skeleton_hash(BONE_NAMES[:-1], PARENT_NAMES[:-1]) != signature
+
+def test_remap_table_round_trip():
+    hierarchy = ArmatureHierarchy(BONE_NAMES, PARENT_NAMES)
+    targets = ("head", "neck_01")
+    group_map = hierarchy.nearest_ancestor_map(targets)
+    signature = skeleton_hash(BONE_NAMES, PARENT_NAMES)
+    tables = {"face_collapse": build_remap_table(signature, targets, group_map)}
+
+    assert tables["face_collapse"]["targets"] == ["head", "neck_01"]
+    # Target order does not matter
+    assert find_remap_table(tables, "face_collapse", signature, ["neck_01", "head"]) == group_map
+    assert find_remap_table(tables, "face_collapse", signature, ["head"]) is None
+    assert find_remap_table(tables, "keep_list_fold", signature, targets) is None
+    other = skeleton_hash(BONE_NAMES[:-1], PARENT_NAMES[:-1])
+    assert find_remap_table(tables, "face_collapse", other, targets) is None
+
+def test_generated_tables_match_the_armature(fake_bpy, monkeypatch, tmp_path):
+    from addon.operators import in_place_conversion, remap_tables
+
+    monkeypatch.setattr(remap_tables, "remap_tables_path", lambda: str(tmp_path / "metahuman_remap_tables.json"))
+    monkeypatch.setattr(remap_tables, "_remap_tables", None)
+    monkeypatch.setattr(in_place_conversion, "load_bone_keep_list", lambda: ["root", "pelvis", "head"])
+
+    armature = fake_blender.Armature("RemapSource", list(zip(BONE_NAMES, PARENT_NAMES)))
+    remap_tables.save_remap_tables(remap_tables.build_remap_tables(armature))
+
+    # Read back from the file, as in a new session
+    monkeypatch.setattr(remap_tables, "_remap_tables", None)
+    face_collapse = remap_tables.find_stored_remap(armature, "face_collapse", ("head", "neck_02", "neck_01"))
+    assert face_collapse == {"FACIAL_C_Jaw": "head", "FACIAL_L_Eye": "head"}
+    keep_list_fold = remap_tables.find_stored_remap(armature, "keep_list_fold", ["root", "pelvis", "head"])
+    assert keep_list_fold == {"spine_01": "pelvis", "neck_01": "pelvis", "FACIAL_C_Jaw": "head", "FACIAL_L_Eye": "head"}
+
+    # Another skeleton or another keep list falls back to walking the hierarchy
+    assert remap_tables.find_stored_remap(armature, "keep_list_fold", ["root", "head"]) is None
+    other = fake_blender.Armature("RemapOther", list(zip(BONE_NAMES[:-1], PARENT_NAMES[:-1])))
+    assert remap_tables.find_stored_remap(other, "face_collapse", ("head", "neck_02", "neck_01")) is None
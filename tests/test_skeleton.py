@@ -0,0 +1,73 @@
+import numpy as np
+from core.skeleton import compare_skeletons, format_conformance
+
+def make_skeleton(name="Manny", names=("root", "pelvis", "spine_01", "thigh_l"), parents=(-1, 0, 1, 1)):
+    rest = np.tile(np.eye(4, dtype=np.float32), (len(names), 1, 1))
+    rest[:, 2, 3] = np.arange(len(names), dtype=np.float32)
+    return {"armature": name, "names": list(names), "parents": np.array(parents, dtype=np.int32), "rest": rest}
+
+def rotation_z(degrees):
+    angle = np.radians(degrees)
+    matrix = np.eye(4, dtype=np.float32)
+    matrix[:2, :2] = [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
+    return matrix
+
+def test_identical_skeletons_pass():
+    report = compare_skeletons(make_skeleton(), make_skeleton("Converted"))
+    assert report["passed"]
+    assert report["max_position_error"] == 0.0
+    assert report["max_angle_error"] < 0.01
+
+def test_bone_order_does_not_matter():
+    candidate = make_skeleton(names=("root", "thigh_l", "pelvis", "spine_01"), parents=(-1, 2, 0, 2))
+    candidate["rest"][:, 2, 3] = [0, 3, 1, 2]
+    assert compare_skeletons(make_skeleton(), candidate)["passed"]
+
+def test_missing_and_extra_bones():
+    candidate = make_skeleton(names=("root", "pelvis", "thigh_l", "FACIAL_C_Jaw"), parents=(-1, 0, 1, 0))
+    candidate["rest"][:, 2, 3] = [0, 1, 3, 4]
+    report = compare_skeletons(make_skeleton(), candidate)
+    assert not report["passed"]
+    assert report["missing_bones"] == ["spine_01"]
+    assert report["extra_bones"] == ["FACIAL_C_Jaw"]
+    assert report["wrong_parents"] == {} and report["wrong_rest"] == {}
+
+def test_wrong_parent():
+    candidate = make_skeleton(parents=(-1, 0, 1, 2))
+    report = compare_skeletons(make_skeleton(), candidate)
+    assert not report["passed"]
+    assert report["wrong_parents"] == {"thigh_l": {"expected": "pelvis", "actual": "spine_01"}}
+
+def test_parent_missing_from_the_reference():
+    candidate = make_skeleton(names=("root", "pelvis", "spine_01", "thigh_l", "ik_root"), parents=(-1, 0, 1, 4, -1))
+    report = compare_skeletons(make_skeleton(), candidate)
+    assert report["wrong_parents"] == {"thigh_l": {"expected": "pelvis", "actual": "ik_root"}}
+    # A bone that became a root is reported as well
+    candidate = make_skeleton(parents=(-1, -1, 1, 1))
+    assert compare_skeletons(make_skeleton(), candidate)["wrong_parents"] == {"pelvis": {"expected": "root", "actual": None}}
+
+def test_rest_pose_tolerances():
+    candidate = make_skeleton()
+    candidate["rest"][1, 0, 3] += 0.005  # pelvis head, within 0.01
+    candidate["rest"][2, 0, 3] += 0.02   # spine_01 head, outside
+    candidate["rest"][3] = candidate["rest"][3] @ rotation_z(1.0)  # thigh_l orientation, outside 0.5 degrees
+    report = compare_skeletons(make_skeleton(), candidate)
+    assert not report["passed"]
+    assert set(report["wrong_rest"]) == {"spine_01", "thigh_l"}
+    assert abs(report["wrong_rest"]["spine_01"]["position_error"] - 0.02) < 1e-5
+    assert abs(report["wrong_rest"]["thigh_l"]["angle_error"] - 1.0) < 0.01
+    assert report["wrong_rest"]["thigh_l"]["position_error"] == 0.0
+    # Wider tolerances accept the same skeleton
+    assert compare_skeletons(make_skeleton(), candidate, position_tolerance=0.05, angle_tolerance=2.0)["passed"]
+
+def test_bone_scale_is_ignored():
+    candidate = make_skeleton()
+    candidate["rest"][1, :3, :3] *= 2.0
+    assert compare_skeletons(make_skeleton(), candidate)["passed"]
+
+def test_format_conformance():
+    candidate = make_skeleton("Converted", names=("root", "pelvis", "thigh_l"), parents=(-1, 0, 0))
+    candidate["rest"][:, 2, 3] = [0, 1, 3]
+    lines = format_conformance(compare_skeletons(make_skeleton(), candidate)).splitlines()
+    assert lines[0].startswith("FAIL Converted against Manny: 1 missing, 0 extra, 1 wrong parent(s), 0 wrong rest pose(s)")
+    assert lines[1:] == ["  Missing: spine_01", "  thigh_l: parent root, expected pelvis"]
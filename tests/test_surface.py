@@ -0,0 +1,77 @@
+import numpy as np
+from core.surface import SurfaceIndex, closest_points_on_triangles
+
+def grid_mesh(size=8, seed=0):
+    """A bumpy height field of size x size vertices, two triangles per cell"""
+    rng = np.random.default_rng(seed)
+    x, y = np.meshgrid(np.linspace(0.0, 1.0, size), np.linspace(0.0, 1.0, size), indexing='ij')
+    positions = np.stack([x.ravel(), y.ravel(), 0.05 * rng.standard_normal(size * size)], axis=1)
+    index = np.arange(size * size).reshape(size, size)
+    a, b = index[:-1, :-1].ravel(), index[1:, :-1].ravel()
+    c, d = index[1:, 1:].ravel(), index[:-1, 1:].ravel()
+    triangles = np.concatenate([np.stack([a, b, c], axis=1), np.stack([a, c, d], axis=1)])
+    return positions, triangles
+
+def brute_force_closest(points, positions, triangles):
+    """Squared distance to the closest point over all triangles, for every point"""
+    count = len(triangles)
+    distance, _bary = closest_points_on_triangles(
+        np.repeat(points, count, axis=0),
+        np.tile(positions[triangles[:, 0]], (len(points), 1)),
+        np.tile(positions[triangles[:, 1]], (len(points), 1)),
+        np.tile(positions[triangles[:, 2]], (len(points), 1)),
+    )
+    return distance.reshape(len(points), count).min(axis=1)
+
+def test_closest_point_regions_of_one_triangle():
+    a, b, c = np.array([[0.0, 0.0, 0.0]]), np.array([[1.0, 0.0, 0.0]]), np.array([[0.0, 1.0, 0.0]])
+    points = np.array([
+        [0.25, 0.25, 1.0],   # above the face
+        [-1.0, -1.0, 0.0],   # past corner a
+        [2.0, -0.5, 0.0],    # past corner b
+        [0.5, -1.0, 0.0],    # beside edge ab
+        [1.0, 1.0, 0.0],     # beside edge bc
+    ])
+    count = len(points)
+    distance, bary = closest_points_on_triangles(points, *(np.repeat(corner, count, axis=0) for corner in (a, b, c)))
+    np.testing.assert_allclose(bary, [
+        [0.5, 0.25, 0.25],
+        [1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [0.5, 0.5, 0.0],
+        [0.0, 0.5, 0.5],
+    ], atol=1e-12)
+    np.testing.assert_allclose(distance, [1.0, 2.0, 1.25, 1.0, 0.5], atol=1e-12)
+
+def test_nearest_vertices_match_brute_force():
+    positions, triangles = grid_mesh()
+    points = np.random.default_rng(1).uniform(-0.5, 1.5, (200, 3))
+    nearest, distance = SurfaceIndex(positions, triangles).nearest_vertices(points)
+
+    all_distances = ((points[:, None, :] - positions[None, :, :]) ** 2).sum(axis=2)
+    np.testing.assert_allclose(distance, all_distances.min(axis=1))
+    np.testing.assert_allclose(all_distances[np.arange(len(points)), nearest], all_distances.min(axis=1))
+
+def test_closest_points_match_brute_force():
+    positions, triangles = grid_mesh()
+    points = np.random.default_rng(2).uniform([0.0, 0.0, -0.2], [1.0, 1.0, 0.2], (300, 3))
+    corners, bary = SurfaceIndex(positions, triangles).closest_points(points)
+
+    assert corners.dtype == np.int32 and bary.dtype == np.float32
+    np.testing.assert_allclose(bary.sum(axis=1), 1.0, atol=1e-6)
+    assert (bary >= -1e-6).all()
+    # Every returned corner triple is a triangle of the mesh
+    known = {tuple(sorted(triangle)) for triangle in triangles.tolist()}
+    assert all(tuple(sorted(triangle)) in known for triangle in corners.tolist())
+
+    closest = (positions[corners] * bary[:, :, None]).sum(axis=1)
+    distance = ((points - closest) ** 2).sum(axis=1)
+    np.testing.assert_allclose(distance, brute_force_closest(points, positions, triangles), atol=1e-6)
+
+def test_seam_vertices_share_one_fan():
+    # Two triangles that only touch through duplicated, coincident vertices
+    positions = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]], dtype=np.float64)
+    triangles = np.array([[0, 1, 2], [3, 5, 4]])
+    corners, bary = SurfaceIndex(positions, triangles).closest_points(np.array([[0.9, 0.9, 0.1]]))
+    closest = (positions[corners[0]] * bary[0, :, None]).sum(axis=0)
+    np.testing.assert_allclose(closest, [0.9, 0.9, 0.0], atol=1e-6)
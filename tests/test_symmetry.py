@@ -0,0 +1,61 @@
+import numpy as np
+from core.naming import mirror_group_name
+from core.symmetry import build_symmetry_map, mirror_target_columns, mirrored_vertices
+
+def test_mirror_group_name():
+    assert mirror_group_name("thigh_l") == "thigh_r"
+    assert mirror_group_name("calf_twist_01_r") == "calf_twist_01_l"
+    assert mirror_group_name("FACIAL_L_Eye") == "FACIAL_R_Eye"
+    assert mirror_group_name("hand.L") == "hand.R"
+    assert mirror_group_name("upper_arm.R.001") == "upper_arm.L.001"
+
+def test_center_groups_keep_their_name():
+    for name in ("pelvis", "spine_01", "head", "FACIAL_C_Jaw", "ball_lower", "roll"):
+        assert mirror_group_name(name) == name
+
+def test_symmetry_map_pairs_mirrored_vertices():
+    positions = np.array([
+        [1.0, 0.0, 0.0],
+        [-1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],         # on the mirror plane, its own partner
+        [0.5, 0.5, 0.5],
+        [-0.5 + 5e-5, 0.5, 0.5],  # within tolerance of the mirrored position
+        [2.0, 0.0, 0.0],         # no partner
+    ])
+    mirror = build_symmetry_map(positions)
+    assert mirror.tolist() == [1, 0, 2, 4, 3, -1]
+    assert mirror.dtype == np.int32
+    assert mirrored_vertices(positions, mirror).tolist() == [1, 4]
+
+def test_symmetry_map_tolerance():
+    positions = np.array([[0.5, 0.0, 0.0], [-0.5 - 0.005, 0.0, 0.0]])
+    assert build_symmetry_map(positions).tolist() == [-1, -1]
+    assert build_symmetry_map(positions, tolerance=0.02).tolist() == [1, 0]
+    positions = np.array([[0.5, 0.0, 0.0], [-0.5 - 0.009, 0.0, 0.0]])
+    assert build_symmetry_map(positions, tolerance=0.02).tolist() == [1, 0]
+    assert build_symmetry_map(positions, tolerance=0.008).tolist() == [-1, -1]
+
+def test_coincident_vertices_stay_unmatched():
+    positions = np.array([[1.0, 0.0, 0.0], [1.0, 0.0, 0.0], [-1.0, 0.0, 0.0]])
+    assert build_symmetry_map(positions).tolist() == [-1, -1, -1]
+
+def test_symmetry_map_along_another_axis():
+    positions = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, -1.0]])
+    assert build_symmetry_map(positions, axis=2).tolist() == [1, 0]
+    # Both lie on the X mirror plane, so each is its own partner there
+    assert build_symmetry_map(positions).tolist() == [0, 1]
+
+def test_mirror_target_columns():
+    mirror = np.array([1, 0, 2])
+    rows = np.array([1])
+    targets = ["ball_l", "ball_r", "pelvis", "only_l"]
+    summed = np.array([
+        [0.5, 0.0, 0.5, 0.25],
+        [0.0, 0.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0, 0.0],
+    ])
+    weights = np.array([[0.0, 0.75], [0.0, 0.0], [0.0, 0.0]])
+    mirror_target_columns(targets, summed, ["pelvis_extra", "only_r"], weights, mirror, rows)
+    # ball_r takes ball_l of the partner, the center group its own column, only_l the unfolded only_r
+    np.testing.assert_allclose(summed[1], [0.0, 0.5, 0.5, 0.75])
+    np.testing.assert_allclose(summed[0], [0.5, 0.0, 0.5, 0.25])
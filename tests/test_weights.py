@@ -0,0 +1,94 @@
+import numpy as np
+from core.weights import (
+    HASH_CHUNK_VERTICES,
+    chunk_count,
+    chunk_rows,
+    chunk_vertex_rows,
+    compact_order,
+    fold_weights,
+    group_id_dtype,
+    influence_chunk_hashes,
+    interpolate_weights,
+    sparse_influences,
+    split_by_weight,
+    used_columns,
+)
+
+def test_fold_weights_sums_sources_onto_targets():
+    weights = np.array([
+        [0.5, 0.25, 0.25, 0.0],
+        [0.0, 0.5, 0.0, 0.5],
+    ], dtype=np.float32)
+    group_names = ["a", "b", "c", "d"]
+    targets, summed, sources = fold_weights(group_names, weights, {"b": "a", "c": "a", "d": "new", "x": "a"})
+    assert targets == ["a", "new"]
+    assert sources == ["b", "c", "d"]
+    np.testing.assert_allclose(summed, [[1.0, 0.0], [0.5, 0.5]])
+    # The input stays untouched
+    assert weights[0, 1] == np.float32(0.25)
+
+def test_fold_weights_without_sources():
+    weights = np.ones((3, 2), dtype=np.float32)
+    targets, summed, sources = fold_weights(["a", "b"], weights, {"a": "a", "x": "b"})
+    assert targets == [] and sources == []
+    assert summed.shape == (3, 0)
+
+def test_compact_order_drops_unused_and_sorts_by_bone():
+    weights = np.array([[0.0, 0.4, 0.6, 0.0, 1.0]], dtype=np.float32)
+    group_names = ["unused", "spine", "pelvis", "also_unused", "custom"]
+    used = used_columns(weights)
+    assert used.tolist() == [False, True, True, False, True]
+    order, removed = compact_order(group_names, used, ["root", "pelvis", "spine"])
+    assert [group_names[i] for i in order] == ["pelvis", "spine", "custom"]
+    assert removed == 2
+
+def test_chunk_rows_and_ids():
+    assert chunk_rows(100, 1200) == 1
+    assert chunk_rows(10, 12000) == 100
+    assert chunk_rows(0, 12) == 1
+    assert group_id_dtype(65536) == np.uint16
+    assert group_id_dtype(65537) == np.uint32
+
+def test_sparse_influences():
+    weights = np.array([[0.0, 0.5], [1.0, 0.0]], dtype=np.float64)
+    vertex_ids, group_ids, values = sparse_influences(np.array([10, 20]), weights)
+    assert vertex_ids.tolist() == [10, 20] and vertex_ids.dtype == np.int32
+    assert group_ids.tolist() == [1, 0] and group_ids.dtype == np.uint16
+    assert values.tolist() == [0.5, 1.0] and values.dtype == np.float32
+
+def test_split_by_weight():
+    empty, chunks = split_by_weight(np.array([0.0, 0.5, 1.0, 0.5, 1e-9]))
+    assert empty.tolist() == [0, 4]
+    assert [(weight, indices.tolist()) for weight, indices in chunks] == [(0.5, [1, 3]), (1.0, [2])]
+    empty, chunks = split_by_weight(np.zeros(2))
+    assert empty.tolist() == [0, 1] and chunks == []
+
+def test_interpolate_weights():
+    source = np.array([[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]])
+    corners = np.array([[0, 1, 2], [2, 2, 2]])
+    bary = np.array([[0.5, 0.5, 0.0], [1.0, 0.0, 0.0]])
+    np.testing.assert_allclose(interpolate_weights(source, corners, bary), [[0.5, 0.5], [0.5, 0.5]])
+
+def test_chunk_hashes_only_change_for_edited_chunks():
+    vertex_count = 3 * HASH_CHUNK_VERTICES
+    rows = np.arange(vertex_count)
+    weights = np.zeros((vertex_count, 2), dtype=np.float32)
+    weights[:, 0] = 1.0
+    chunks = range(chunk_count(vertex_count))
+    before = influence_chunk_hashes(["a", "b"], *sparse_influences(rows, weights), chunks)
+
+    weights[HASH_CHUNK_VERTICES + 5] = (0.5, 0.5)
+    after = influence_chunk_hashes(["a", "b"], *sparse_influences(rows, weights), chunks)
+    assert [old != new for old, new in zip(before, after)] == [False, True, False]
+
+    # Groups enter by name, so reordering them keeps the chunks with one influence per vertex
+    reordered = influence_chunk_hashes(["b", "a"], *sparse_influences(rows, weights[:, ::-1]), chunks)
+    assert reordered[0] == after[0] and reordered[2] == after[2]
+
+def test_chunk_vertex_rows():
+    assert chunk_count(0) == 0
+    assert chunk_count(HASH_CHUNK_VERTICES + 1) == 2
+    rows = chunk_vertex_rows([1, 0], 10, chunk_vertices=4)
+    assert rows.tolist() == list(range(8)) and rows.dtype == np.int32
+    assert chunk_vertex_rows([2], 10, chunk_vertices=4).tolist() == [8, 9]
+    assert chunk_vertex_rows([], 10).tolist() == []
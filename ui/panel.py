@@ -6,6 +6,77 @@ class MetahumanToMannySettings(bpy.types.PropertyGroup):
         description="Automatically find and process all LOD meshes (LOD0, LOD1, LOD2, etc.)",
         default=True
     )
+    bResumeConversion: bpy.props.BoolProperty(
+        name="Resume Conversion",
+        description="Skip conversion steps that already finished on a mesh or armature that has not changed since",
+        default=True
+    )
+    bPropagateLODWeights: bpy.props.BoolProperty(
+        name="Propagate LOD0 Weights",
+        description="In Place Conversion cleans up LOD0 only and transfers its final weights to the other LODs",
+        default=False
+    )
+    bApplyLODReduction: bpy.props.BoolProperty(
+        name="LOD Bone Reduction",
+        description="In Place Conversion collapses bones on lower LODs according to lod_bone_reduction.json",
+        default=False
+    )
+    bApplyBoneBudget: bpy.props.BoolProperty(
+        name="Bone Budget",
+        description="In Place Conversion collapses the least significant bones until every LOD fits its bone budget from lod_bone_reduction.json",
+        default=False
+    )
+    bReorderMaterialSections: bpy.props.BoolProperty(
+        name="Reorder Face Sections",
+        description="In Place Conversion sorts the face mesh material slots into the order from material_section_order.json",
+        default=True
+    )
+    bPruneShapeKeys: bpy.props.BoolProperty(
+        name="Prune Shape Keys",
+        description="In Place Conversion removes negligible shape keys and deltas according to shape_key_pruning.json",
+        default=False
+    )
+    bSlimForExport: bpy.props.BoolProperty(
+        name="Slim For Export",
+        description="As its last step, In Place Conversion strips the mesh data Unreal does not need (with the default profile: extra UV maps, color attributes, custom split normals, custom properties and empty vertex groups)",
+        default=False
+    )
+    SlimmingProfile: bpy.props.StringProperty(
+        name="Slimming Profile",
+        description="Profile from slimming_profiles.json. Leave empty to use its default profile",
+        default=""
+    )
+    WeightMemoryBudget: bpy.props.IntProperty(
+        name="Weight Memory Budget (MB)",
+        description="Weight merges and cleanups read and write vertex weights in chunks of at most this size, so memory stays flat on huge meshes",
+        default=256,
+        min=16
+    )
+    bMirrorWeights: bpy.props.BoolProperty(
+        name="Mirror Weights",
+        description="Weight merges only process one side of symmetric meshes and mirror the result to the other side, vertices without an exact mirror partner are processed directly",
+        default=False
+    )
+    bDeformationQA: bpy.props.BoolProperty(
+        name="Deformation QA",
+        description="In Place Conversion poses the rig through the test poses in deformation_poses.json before and after converting and reports how far every region moved",
+        default=False
+    )
+    bCheckSkeleton: bpy.props.BoolProperty(
+        name="Check Skeleton",
+        description="In Place Conversion compares the pruned armature with the reference skeleton and reports missing bones, wrong parents and rest pose differences. Save a reference with Save Reference Skeleton first: without one the check fails",
+        default=False
+    )
+    SkeletonProfile: bpy.props.StringProperty(
+        name="Reference Skeleton",
+        description="Reference skeleton in the add-on's reference_skeletons folder. Leave empty to use 'default'",
+        default=""
+    )
+    bAuditLODCoherence: bpy.props.BoolProperty(
+        name="Audit LOD Coherence",
+        description="In Place Conversion finishes by comparing every lower LOD's weights with LOD0",
+        default=False
+    )
 
 class BoneWeightCleanupPanel(bpy.types.Panel):
     bl_label = "MetahumanToManny"
@@ -29,6 +100,20 @@ class BoneWeightCleanupPanel(bpy.types.Panel):
         box = layout.box()
         box.label(text="Settings", icon='PREFERENCES')
         box.prop(settings, "bAutoLookForLOD")
+        box.prop(settings, "bResumeConversion")
+        box.prop(settings, "bPropagateLODWeights")
+        box.prop(settings, "bApplyLODReduction")
+        box.prop(settings, "bApplyBoneBudget")
+        box.prop(settings, "bReorderMaterialSections")
+        box.prop(settings, "bPruneShapeKeys")
+        box.prop(settings, "bSlimForExport")
+        box.prop(settings, "SlimmingProfile")
+        box.prop(settings, "WeightMemoryBudget")
+        box.prop(settings, "bMirrorWeights")
+        box.prop(settings, "bCheckSkeleton")
+        box.prop(settings, "SkeletonProfile")
+        box.prop(settings, "bAuditLODCoherence")
+        box.prop(settings, "bDeformationQA")
         
         layout.separator()
 
@@ -48,6 +133,9 @@ class BoneWeightCleanupPanel(bpy.types.Panel):
         box.operator("object.fix_finger_bulges", text="Fix Finger Bulges")
         box.operator("object.fix_toes", text="Fix Toes")
         box.operator("object.cleanup_unused_vertex_groups", text="Cleanup Unused Groups")
+        box.operator("object.propagate_lod_weights", text="Propagate LOD0 Weights")
+        box.operator("object.apply_lod_bone_reduction", text="Apply LOD Bone Reduction")
+        box.operator("object.apply_bone_budget", text="Apply Bone Budget")
         
         layout.separator()
 
@@ -55,6 +143,9 @@ class BoneWeightCleanupPanel(bpy.types.Panel):
         box = layout.box()
         box.label(text="Mesh Cleanup", icon='MESH_CUBE')
         box.operator("object.fix_seams", text="Fix Seams")
+        box.operator("object.reorder_material_sections", text="Reorder Material Sections")
+        box.operator("object.prune_shape_keys", text="Prune Shape Keys")
+        box.operator("object.slim_for_export", text="Slim For Export")
         
         layout.separator()
 
@@ -63,14 +154,18 @@ class BoneWeightCleanupPanel(bpy.types.Panel):
         box.label(text="Hierarchy", icon='OUTLINER')
         box.operator("object.setup_lod_hierarchy", text="Setup LOD Hierarchy")
         box.operator("object.bind_to_manny", text="Bind to Manny")
+        box.operator("object.save_remap_tables", text="Save Remap Tables")
 
-def register():
-    bpy.utils.register_class(MetahumanToMannySettings)
-    bpy.utils.register_class(BoneWeightCleanupPanel)
-    bpy.types.Scene.metahuman_to_manny_settings = bpy.props.PointerProperty(type=MetahumanToMannySettings)
-
+        layout.separator()
 
-def unregister():
-    del bpy.types.Scene.metahuman_to_manny_settings
-    bpy.utils.unregister_class(BoneWeightCleanupPanel)
-    bpy.utils.unregister_class(MetahumanToMannySettings)
+        # Analysis section
+        box = layout.box()
+        box.label(text="Analysis", icon='VIEWZOOM')
+        box.operator("object.skinning_report", text="Skinning Report")
+        box.operator("object.save_weight_snapshot", text="Save Weight Snapshot")
+        box.operator("object.compare_weight_snapshot", text="Compare Weights")
+        box.operator("object.audit_lod_coherence", text="Audit LOD Coherence")
+        box.operator("object.save_reference_skeleton", text="Save Reference Skeleton")
+        box.operator("object.check_skeleton_conformance", text="Check Skeleton")
+        box.operator("object.save_deformation_reference", text="Save Deformation Reference")
+        box.operator("object.deformation_qa", text="Deformation QA")